@@ -1,7 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, PlainTextResponse, JSONResponse
 from pydantic import BaseModel
+from typing import Dict, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import logging
 import sys
 import os
 
@@ -11,6 +17,15 @@ project_root = current_dir.parent
 sys.path.append(str(project_root / "src"))
 
 from chatbot.groq_rag_chatbot import GroqRAGChatbot
+from chatbot.metrics import REGISTRY
+
+# DEBUG adds per-request retrieval / Groq timing lines
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logging.getLogger("httpx").setLevel(logging.WARNING)  # One line per Groq call otherwise
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Wei Ming Chatbot API", version="1.0.0")
 
@@ -38,10 +53,99 @@ class ChatResponse(BaseModel):
     response: str
     success: bool
     model_used: str
+    cache_hit: bool = False
+    timings: Dict[str, float] = {}  # Per-stage seconds (embed, search, hydrate, prompt, llm, ...)
+
+# Concurrency limits
+CPU_WORKERS = int(os.environ.get("CHAT_CPU_WORKERS", 4))  # FAISS search threads (embedding is micro-batched)
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", 32))  # In-flight Groq calls
+CHAT_MAX_CONCURRENCY = int(os.environ.get("CHAT_MAX_CONCURRENCY", 64))  # In-flight /chat requests
+
+# Groq HTTP client settings
+LLM_POOL_SIZE = int(os.environ.get("LLM_POOL_SIZE", 10))  # Keep-alive connections
+LLM_CONNECT_TIMEOUT = float(os.environ.get("LLM_CONNECT_TIMEOUT", 5.0))
+LLM_READ_TIMEOUT = float(os.environ.get("LLM_READ_TIMEOUT", 30.0))
+LLM_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", 2))  # On 429/5xx, with backoff
+
+# Semantic answer cache
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 256))  # 0 disables
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", 3600))  # Seconds
+RESPONSE_CACHE_THRESHOLD = float(os.environ.get("RESPONSE_CACHE_THRESHOLD", 0.95))  # Min cosine similarity
+
+# Query embedding cache
+QUERY_CACHE_SIZE = int(os.environ.get("QUERY_CACHE_SIZE", 1024))  # 0 disables
+QUERY_CACHE_PATH = os.environ.get("QUERY_CACHE_PATH")  # Optional .npz kept across restarts
+
+# Query embedding micro-batching
+EMBED_MAX_BATCH = int(os.environ.get("EMBED_MAX_BATCH", 32))  # Queries per encode call
+EMBED_MAX_WAIT_MS = float(os.environ.get("EMBED_MAX_WAIT_MS", 2.0))  # Wait for a batch to fill
 
-# Initialize chatbot
+# Hot reload of re-built vector stores
+INDEX_POLL_SECONDS = float(os.environ.get("INDEX_POLL_SECONDS", 5.0))  # 0 disables
+
+# Bounded pool for CPU-bound retrieval so it never runs on the event loop
+retrieval_pool = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="retrieval")
+chat_slots = asyncio.Semaphore(CHAT_MAX_CONCURRENCY)
+
+# Initialize chatbot; the model and index load in the background after startup
 vector_store_dir = project_root / "data" / "vector_store"
-chatbot = GroqRAGChatbot(str(vector_store_dir))
+chatbot = GroqRAGChatbot(
+    str(vector_store_dir),
+    max_concurrent_llm_requests=LLM_MAX_CONCURRENCY,
+    http_pool_size=LLM_POOL_SIZE,
+    connect_timeout=LLM_CONNECT_TIMEOUT,
+    read_timeout=LLM_READ_TIMEOUT,
+    max_retries=LLM_MAX_RETRIES,
+    response_cache_size=RESPONSE_CACHE_SIZE,
+    response_cache_ttl=RESPONSE_CACHE_TTL,
+    cache_similarity_threshold=RESPONSE_CACHE_THRESHOLD,
+    query_cache_size=QUERY_CACHE_SIZE,
+    query_cache_path=QUERY_CACHE_PATH,
+    embed_max_batch_size=EMBED_MAX_BATCH,
+    embed_max_wait_ms=EMBED_MAX_WAIT_MS,
+    warm_up=False
+)
+warm_up_task: Optional[asyncio.Task] = None
+index_watch_task: Optional[asyncio.Task] = None
+
+async def warm_up():
+    """Load model + index off the event loop, then open Groq connections"""
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(None, chatbot.warm_up)
+    except Exception:
+        return  # Logged by the chatbot; /ready reports it and the first query retries
+    await chatbot.aprewarm()
+
+async def watch_index():
+    """Poll the vector store and swap in newly published builds without a restart"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(INDEX_POLL_SECONDS)
+        try:
+            # Loading runs off the event loop; requests keep using the old build meanwhile
+            await loop.run_in_executor(None, chatbot.reload_index)
+        except Exception:
+            logging.getLogger(__name__).exception("❌ Vector store reload failed, keeping the current index")
+
+@app.on_event("startup")
+async def startup():
+    global warm_up_task, index_watch_task
+    warm_up_task = asyncio.create_task(warm_up())
+    if INDEX_POLL_SECONDS > 0:
+        index_watch_task = asyncio.create_task(watch_index())
+
+@app.on_event("shutdown")
+async def shutdown():
+    for task in (warm_up_task, index_watch_task):
+        if task is not None and not task.done():
+            task.cancel()
+    await chatbot.aclose()
+    chatbot.http_client.close()
+    if chatbot.is_ready:
+        chatbot.query_cache.save()
+        chatbot.query_encoder.close()
+    retrieval_pool.shutdown(wait=False)
 
 @app.get("/")
 async def root():
@@ -49,34 +153,95 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    """Liveness: the process is up (may still be warming up)"""
     return {"status": "healthy", "message": "API is operational"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: model and index loaded and Groq connection pre-warmed"""
+    if chatbot.is_ready and warm_up_task is not None and warm_up_task.done():
+        return {"status": "ready", "index_version": str(chatbot.index_version)}
+    if chatbot.warm_up_error is not None:
+        return JSONResponse(status_code=503, content={"status": "failed", "error": str(chatbot.warm_up_error)})
+    return JSONResponse(status_code=503, content={"status": "warming_up"})
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return {
+        "response_cache": chatbot.response_cache.get_stats(),
+        "query_embedding_cache": chatbot.query_cache.get_stats() if chatbot.is_ready else None
+    }
+
+@app.get("/embedding/stats")
+async def embedding_stats():
+    if not chatbot.is_ready:
+        raise HTTPException(status_code=503, detail="Chatbot is warming up")
+    return chatbot.query_encoder.get_stats()
+
+@app.get("/metrics")
+async def metrics():
+    """Stage latency histograms and cache / Groq counters in Prometheus text format"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
+    if not request.query.strip():
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+
     try:
-        if not request.query.strip():
-            raise HTTPException(status_code=400, detail="Query cannot be empty")
-
-        # Get response from your chatbot
-        result = chatbot.chat(
-            query=request.query,
-            top_k=request.top_k,
-            max_tokens=request.max_tokens
-        )
+        # Get response from your chatbot without blocking the event loop
+        async with chat_slots:
+            result = await chatbot.achat(
+                query=request.query,
+                top_k=request.top_k,
+                max_tokens=request.max_tokens,
+                executor=retrieval_pool
+            )
 
         return ChatResponse(
             response=result['response'],
             success=True,
-            model_used=result['model_used']
+            model_used=result['model_used'],
+            cache_hit=result['cache_hit'],
+            timings=result['timings']
         )
 
     except Exception as e:
-        print(f"Error in chat endpoint: {str(e)}")
+        logger.exception("Error in chat endpoint")
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
 
+@app.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """Stream response tokens as Server-Sent Events"""
+    if not request.query.strip():
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+
+    async def event_stream():
+        async with chat_slots:
+            try:
+                async for token in chatbot.achat_stream(
+                    query=request.query,
+                    top_k=request.top_k,
+                    max_tokens=request.max_tokens,
+                    executor=retrieval_pool
+                ):
+                    yield f"data: {json.dumps({'token': token})}\n\n"
+
+                yield f"data: {json.dumps({'done': True, 'model_used': chatbot.model_name})}\n\n"
+
+            except Exception as e:
+                logger.exception("Error in chat stream endpoint")
+                yield f"data: {json.dumps({'error': f'Internal server error: {str(e)}'})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     import uvicorn
     import os
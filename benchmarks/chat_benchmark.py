@@ -0,0 +1,264 @@
+# benchmarks/chat_benchmark.py
+"""
+End-to-end chat latency benchmark against a stubbed LLM
+
+Drives either GroqRAGChatbot.achat in-process ("direct", with a local
+FakeLLMServer standing in for Groq) or a running backend's /chat endpoint
+("http") with a weighted query mix at a fixed concurrency, and reports
+throughput, end-to-end latency percentiles and per-stage timings (embed,
+search, hydrate, prompt, llm, ...) as JSON.
+
+Usage:
+    python benchmarks/chat_benchmark.py --mode direct --requests 200 --concurrency 16
+    python benchmarks/fake_llm_server.py --port 8090 &
+    GROQ_API_URL=http://127.0.0.1:8090/v1/chat/completions GROQ_API_KEY=bench python backend/main.py &
+    python benchmarks/chat_benchmark.py --mode http --backend-url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Callable, Awaitable
+
+import httpx
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT / "src"))
+sys.path.append(str(PROJECT_ROOT / "benchmarks"))
+from fake_llm_server import FakeLLMServer
+
+# (query, weight) - roughly the mix of questions the site gets
+DEFAULT_QUERY_MIX = [
+    ("What machine learning projects has Wei Ming worked on?", 5),
+    ("Tell me about his technical skills", 4),
+    ("What is his educational background?", 3),
+    ("How can I contact Wei Ming?", 3),
+    ("What are his career goals?", 2),
+    ("Does he have deep learning experience?", 2),
+    ("What programming languages does Wei Ming know?", 2),
+    ("Tell me about his work experience", 2),
+    ("What is a transformer model?", 1)
+]
+
+# One result per request: (end-to-end seconds, per-stage seconds, ok, cache hit)
+RequestResult = Tuple[float, Dict[str, float], bool, bool]
+
+
+def load_query_mix(queries_file: str) -> List[Tuple[str, float]]:
+    """Load a JSON list of queries or {"query", "weight"} objects"""
+    if not queries_file:
+        return DEFAULT_QUERY_MIX
+    with open(queries_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return [(entry, 1) if isinstance(entry, str) else (entry['query'], entry.get('weight', 1)) for entry in entries]
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/mean in milliseconds"""
+    if not values:
+        return {}
+    ms = 1000 * np.array(values)
+    return {
+        'p50': float(np.percentile(ms, 50)),
+        'p95': float(np.percentile(ms, 95)),
+        'p99': float(np.percentile(ms, 99)),
+        'mean': float(ms.mean())
+    }
+
+
+async def run_load(send: Callable[[str], Awaitable[RequestResult]], queries: List[str],
+                   concurrency: int) -> Tuple[List[RequestResult], float]:
+    """Send all queries with at most `concurrency` in flight; returns results and wall time"""
+    pending = iter(queries)
+    results: List[RequestResult] = []
+
+    async def worker():
+        for query in pending:
+            results.append(await send(query))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results, time.perf_counter() - start
+
+
+async def benchmark_direct(args, queries: List[str], warmup: List[str]) -> Tuple[List[RequestResult], float, Dict]:
+    """Run the load through GroqRAGChatbot.achat with a fake LLM"""
+    from chatbot.groq_rag_chatbot import GroqRAGChatbot, ERROR_PREFIXES
+
+    fake_llm = None
+    llm_url = args.llm_url
+    if not llm_url:
+        fake_llm = FakeLLMServer(tokens_per_second=args.tokens_per_second, ttft_ms=args.ttft_ms,
+                                 response_tokens=args.response_tokens).start()
+        llm_url = fake_llm.url
+
+    output = sys.stdout if args.verbose else io.StringIO()
+    with contextlib.redirect_stdout(output):  # The chatbot logs every request
+        chatbot = GroqRAGChatbot(
+            str(args.vector_store),
+            groq_api_key="bench",
+            groq_url=llm_url,
+            max_concurrent_llm_requests=args.concurrency,
+            response_cache_size=256 if args.response_cache else 0
+        )
+    executor = ThreadPoolExecutor(max_workers=args.cpu_workers, thread_name_prefix="retrieval")
+
+    async def send(query: str) -> RequestResult:
+        start = time.perf_counter()
+        result = await chatbot.achat(query, top_k=args.top_k, max_tokens=args.max_tokens, executor=executor)
+        ok = not result['response'].startswith(ERROR_PREFIXES)
+        return time.perf_counter() - start, result['timings'], ok, result['cache_hit']
+
+    try:
+        with contextlib.redirect_stdout(output):
+            await run_load(send, warmup, args.concurrency)
+            results, wall_s = await run_load(send, queries, args.concurrency)
+        extra = {
+            'llm_url': llm_url,
+            'http': chatbot.get_http_stats(),
+            'embedding_batches': chatbot.query_encoder.get_stats()
+        }
+    finally:
+        await chatbot.aclose()
+        chatbot.query_encoder.close()
+        executor.shutdown()
+        if fake_llm is not None:
+            fake_llm.stop()
+
+    return results, wall_s, extra
+
+
+async def benchmark_http(args, queries: List[str], warmup: List[str]) -> Tuple[List[RequestResult], float, Dict]:
+    """Run the load against a backend's /chat endpoint"""
+    chat_url = args.backend_url.rstrip('/') + "/chat"
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        async def send(query: str) -> RequestResult:
+            start = time.perf_counter()
+            try:
+                response = await client.post(chat_url, json={
+                    'query': query, 'top_k': args.top_k, 'max_tokens': args.max_tokens
+                })
+            except httpx.HTTPError:
+                return time.perf_counter() - start, {}, False, False
+            elapsed = time.perf_counter() - start
+            if response.status_code != 200:
+                return elapsed, {}, False, False
+            data = response.json()
+            return elapsed, data.get('timings', {}), data.get('success', True), data.get('cache_hit', False)
+
+        await run_load(send, warmup, args.concurrency)
+        results, wall_s = await run_load(send, queries, args.concurrency)
+
+    return results, wall_s, {'backend_url': args.backend_url}
+
+
+def build_report(args, results: List[RequestResult], wall_s: float, extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize per-request results"""
+    stages: Dict[str, List[float]] = {}
+    for _, timings, ok, _ in results:
+        if ok:
+            for stage, seconds in timings.items():
+                stages.setdefault(stage.removesuffix('_s'), []).append(seconds)
+
+    successes = [r for r in results if r[2]]
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python_version': platform.python_version(),
+            'machine': platform.machine()
+        },
+        'config': {
+            'mode': args.mode,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+            'top_k': args.top_k,
+            'max_tokens': args.max_tokens,
+            'cpu_workers': args.cpu_workers,
+            'response_cache': args.response_cache,
+            'tokens_per_second': args.tokens_per_second,
+            'ttft_ms': args.ttft_ms,
+            'response_tokens': args.response_tokens,
+            'seed': args.seed,
+            **extra
+        },
+        'summary': {
+            'requests': len(results),
+            'errors': len(results) - len(successes),
+            'cache_hits': sum(1 for r in results if r[3]),
+            'wall_s': wall_s,
+            'throughput_rps': len(results) / wall_s if wall_s > 0 else 0.0,
+            'latency_ms': percentiles([r[0] for r in successes])
+        },
+        'stages_ms': {stage: percentiles(values) for stage, values in stages.items()}
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a summary of a benchmark report"""
+    summary = report['summary']
+    latency = summary['latency_ms']
+    print(f"\n📊 {summary['requests']} requests, {summary['errors']} errors, {summary['cache_hits']} cache hits "
+          f"in {summary['wall_s']:.2f}s ({summary['throughput_rps']:.1f} req/s)")
+    if latency:
+        print(f"⏱️  End-to-end: p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms")
+
+    print(f"\n{'stage':<10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    for stage, stats in report['stages_ms'].items():
+        print(f"{stage:<10} {stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['p99']:>9.2f} {stats['mean']:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the RAG chat pipeline against a fake LLM")
+    parser.add_argument("--mode", choices=["direct", "http"], default="direct")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--queries", default=None, help="JSON list of queries or {query, weight} objects")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--max-tokens", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(PROJECT_ROOT / "benchmarks" / "results" / "chat_benchmark.json"))
+    # direct mode
+    parser.add_argument("--vector-store", default=str(PROJECT_ROOT / "data" / "vector_store"))
+    parser.add_argument("--cpu-workers", type=int, default=4)
+    parser.add_argument("--response-cache", action="store_true", help="Keep the semantic response cache on")
+    parser.add_argument("--llm-url", default=None, help="Use this LLM endpoint instead of a local fake")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0)
+    parser.add_argument("--ttft-ms", type=float, default=100.0)
+    parser.add_argument("--response-tokens", type=int, default=60)
+    parser.add_argument("--verbose", action="store_true", help="Show chatbot logs")
+    # http mode
+    parser.add_argument("--backend-url", default="http://127.0.0.1:8000")
+    args = parser.parse_args()
+
+    mix = load_query_mix(args.queries)
+    rng = random.Random(args.seed)
+    texts, weights = zip(*mix)
+    warmup = rng.choices(texts, weights, k=args.warmup)
+    queries = rng.choices(texts, weights, k=args.requests)
+
+    print(f"🚀 {args.mode} benchmark: {args.requests} requests at concurrency {args.concurrency}")
+    run = benchmark_direct if args.mode == "direct" else benchmark_http
+    results, wall_s, extra = asyncio.run(run(args, queries, warmup))
+
+    report = build_report(args, results, wall_s, extra)
+    print_report(report)
+
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved report to {output_file}")
@@ -0,0 +1,183 @@
+# benchmarks/fake_llm_server.py
+"""
+Local OpenAI-compatible chat completions server for benchmarks
+
+Answers POST .../chat/completions (streaming or not) with filler tokens at a
+configurable time-to-first-token and token rate, so the RAG pipeline can be
+load-tested without calling Groq.
+
+Usage:
+    python benchmarks/fake_llm_server.py [--port 8090] [--tokens-per-second 200] [--ttft-ms 100]
+    GROQ_API_URL=http://127.0.0.1:8090/v1/chat/completions GROQ_API_KEY=bench uvicorn backend.main:app
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        pass  # No per-request logging during benchmarks
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith("/models"):
+            self._send_json(200, {'object': "list", 'data': [{'id': "fake-model", 'object': "model"}]})
+        else:
+            self._send_json(404, {'error': {'message': f"Unknown path {self.path}"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not self.path.rstrip('/').endswith("/chat/completions"):
+            self._send_json(404, {'error': {'message': f"Unknown path {self.path}"}})
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._send_json(400, {'error': {'message': "Invalid JSON body"}})
+            return
+
+        server: FakeLLMServer = self.server.fake_llm
+        server.count_request()
+        n_tokens = server.response_length(payload.get('max_tokens'))
+        model = payload.get('model', "fake-model")
+
+        time.sleep(server.ttft_s)
+        if payload.get('stream'):
+            self._stream_tokens(server, model, n_tokens)
+        else:
+            time.sleep(max(n_tokens - 1, 0) / server.tokens_per_second)
+            self._send_json(200, {
+                'id': f"chatcmpl-{uuid.uuid4().hex}",
+                'object': "chat.completion",
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': "assistant", 'content': "".join(server.token(i) for i in range(n_tokens))},
+                    'finish_reason': "stop"
+                }],
+                'usage': {'prompt_tokens': 0, 'completion_tokens': n_tokens, 'total_tokens': n_tokens}
+            })
+
+    def _send_json(self, status: int, data: Dict[str, Any]):
+        encoded = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', "application/json")
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream_tokens(self, server: "FakeLLMServer", model: str, n_tokens: int):
+        """Send tokens as chunked server-sent events"""
+        self.send_response(200)
+        self.send_header('Content-Type', "text/event-stream")
+        self.send_header('Transfer-Encoding', "chunked")
+        self.end_headers()
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        for i in range(n_tokens):
+            if i:
+                time.sleep(1 / server.tokens_per_second)
+            event = {
+                'id': completion_id,
+                'object': "chat.completion.chunk",
+                'model': model,
+                'choices': [{'index': 0, 'delta': {'content': server.token(i)}, 'finish_reason': None}]
+            }
+            self._write_chunk(f"data: {json.dumps(event)}\n\n".encode('utf-8'))
+
+        self._write_chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class FakeLLMServer:
+    """Threaded fake LLM endpoint with controllable latency"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, tokens_per_second: float = 200.0,
+                 ttft_ms: float = 100.0, response_tokens: int = 60):
+        """
+        Create the server (port 0 picks a free port)
+
+        Args:
+            host: Interface to bind
+            port: Port to bind
+            tokens_per_second: Generation rate after the first token
+            ttft_ms: Delay before the first token
+            response_tokens: Tokens per answer (capped by the request's max_tokens)
+        """
+        self.tokens_per_second = tokens_per_second
+        self.ttft_s = ttft_ms / 1000
+        self.response_tokens = response_tokens
+
+        self._httpd = ThreadingHTTPServer((host, port), _CompletionHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake_llm = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        """Chat completions URL to use as groq_url / GROQ_API_URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def response_length(self, max_tokens: Optional[int]) -> int:
+        return min(self.response_tokens, max_tokens) if max_tokens else self.response_tokens
+
+    @staticmethod
+    def token(i: int) -> str:
+        return "lorem " if i % 2 == 0 else "ipsum "
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def start(self) -> "FakeLLMServer":
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--tokens-per-second", type=float, default=200.0)
+    parser.add_argument("--ttft-ms", type=float, default=100.0)
+    parser.add_argument("--response-tokens", type=int, default=60)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.host, args.port, args.tokens_per_second, args.ttft_ms, args.response_tokens)
+    print(f"🤖 Fake LLM serving at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,191 @@
+# benchmarks/index_benchmark.py
+"""
+Recall / latency benchmark for the FAISS index types supported by FAISSManager
+
+Builds every configuration in DEFAULT_CONFIGS from embeddings.npy, measures
+recall@k against exact IndexFlatIP ground truth, p50/p99 single-query search
+latency, batch throughput, build time and serialized index size, and writes a
+JSON report that can be diffed across releases.
+
+Usage:
+    python benchmarks/index_benchmark.py [--embeddings data/vector_store/embeddings.npy]
+                                         [--queries queries.npy] [--k 10]
+                                         [--output benchmarks/results/index_benchmark.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any
+
+import faiss
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT / "src"))
+from vector_store.faiss_manager import FAISSManager
+
+# (name, index_type, index_params); unset nprobe / efSearch are tuned to --recall-target
+DEFAULT_CONFIGS = [
+    ("flat", "flat", {}),
+    ("ivf-nprobe1", "ivf", {'nprobe': 1}),
+    ("ivf-tuned", "ivf", {}),
+    ("ivfpq-tuned", "ivfpq", {}),
+    ("sq8", "sq", {}),
+    ("hnsw-ef16", "hnsw", {'efSearch': 16}),
+    ("hnsw-tuned", "hnsw", {}),
+    ("auto", "auto", {})
+]
+
+
+def load_queries(embeddings: np.ndarray, queries_file: str, num_queries: int, seed: int) -> np.ndarray:
+    """Load query embeddings, or sample them from the corpus when no file is given"""
+    if queries_file:
+        queries = np.load(queries_file).astype(np.float32)
+    else:
+        rng = np.random.default_rng(seed)
+        rows = rng.choice(len(embeddings), min(num_queries, len(embeddings)), replace=False)
+        queries = embeddings[rows].astype(np.float32)
+
+    queries = np.ascontiguousarray(queries.reshape(-1, embeddings.shape[1]))
+    faiss.normalize_L2(queries)
+    return queries
+
+
+def recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    """Mean fraction of the exact top-k that the index returned"""
+    k = truth.shape[1]
+    return float(np.mean([len(set(t) & set(f) - {-1}) / k for t, f in zip(truth, found)]))
+
+
+def benchmark_config(name: str, index_type: str, index_params: Dict[str, Any], embeddings: np.ndarray,
+                     queries: np.ndarray, truth: np.ndarray, k: int, recall_target: float) -> Dict[str, Any]:
+    """Build one index configuration and measure it"""
+    manager = FAISSManager(embeddings.shape[1], index_type=index_type, recall_target=recall_target,
+                           index_params=index_params)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Build progress is not part of the report
+        index = manager._create_faiss_index(embeddings)
+    build_s = time.perf_counter() - start
+
+    # Single-query latency, after a warm-up pass
+    for query in queries[:10]:
+        index.search(query.reshape(1, -1), k)
+    latencies = []
+    found = np.empty((len(queries), k), dtype=np.int64)
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        found[i] = index.search(query.reshape(1, -1), k)[1][0]
+        latencies.append(time.perf_counter() - start)
+    latencies_ms = 1000 * np.array(latencies)
+
+    # Batch throughput
+    start = time.perf_counter()
+    index.search(queries, k)
+    batch_s = time.perf_counter() - start
+
+    return {
+        'name': name,
+        'requested_type': index_type,
+        'index_class': type(manager._base_index()).__name__,
+        'index_params': manager.build_params,
+        'search_params': manager.search_params,
+        'build_s': build_s,
+        'memory_bytes': int(faiss.serialize_index(index).nbytes),
+        f'recall_at_{k}': recall_at_k(truth, found),
+        'latency_ms': {
+            'p50': float(np.percentile(latencies_ms, 50)),
+            'p99': float(np.percentile(latencies_ms, 99)),
+            'mean': float(latencies_ms.mean())
+        },
+        'batch_qps': len(queries) / batch_s if batch_s > 0 else float('inf')
+    }
+
+
+def run_benchmark(embeddings_file: str, queries_file: str = None, k: int = 10, num_queries: int = 200,
+                  recall_target: float = 0.95, seed: int = 0) -> Dict[str, Any]:
+    """
+    Benchmark all DEFAULT_CONFIGS on one set of embeddings
+
+    Returns:
+        Report dict (environment, dataset and one entry per configuration)
+    """
+    embeddings = np.load(embeddings_file).astype(np.float32)
+    queries = load_queries(embeddings, queries_file, num_queries, seed)
+    k = min(k, len(embeddings))
+
+    # Exact ground truth on normalized vectors
+    normalized = embeddings.copy()
+    faiss.normalize_L2(normalized)
+    exact = faiss.IndexFlatIP(normalized.shape[1])
+    exact.add(normalized)
+    _, truth = exact.search(queries, k)
+
+    print(f"📊 {len(embeddings)} vectors (dim {embeddings.shape[1]}), {len(queries)} queries, k={k}")
+
+    results: List[Dict[str, Any]] = []
+    for name, index_type, index_params in DEFAULT_CONFIGS:
+        print(f"🔧 Benchmarking {name}...")
+        results.append(benchmark_config(name, index_type, index_params, embeddings, queries, truth, k,
+                                        recall_target))
+
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'faiss_version': faiss.__version__,
+            'numpy_version': np.__version__,
+            'python_version': platform.python_version(),
+            'machine': platform.machine(),
+            'omp_threads': faiss.omp_get_max_threads()
+        },
+        'dataset': {
+            'embeddings_file': str(embeddings_file),
+            'num_vectors': int(len(embeddings)),
+            'dimension': int(embeddings.shape[1]),
+            'queries_file': str(queries_file) if queries_file else None,
+            'num_queries': int(len(queries)),
+            'k': k,
+            'recall_target': recall_target,
+            'seed': seed
+        },
+        'results': results
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a summary table of a benchmark report"""
+    k = report['dataset']['k']
+    print(f"\n{'config':<14} {'class':<22} {'recall@' + str(k):>9} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'build s':>8} {'size KB':>9} {'QPS':>9}")
+    for result in report['results']:
+        print(f"{result['name']:<14} {result['index_class']:<22} {result[f'recall_at_{k}']:>9.3f} "
+              f"{result['latency_ms']['p50']:>8.3f} {result['latency_ms']['p99']:>8.3f} "
+              f"{result['build_s']:>8.2f} {result['memory_bytes'] / 1024:>9.1f} {result['batch_qps']:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark FAISS index types")
+    parser.add_argument("--embeddings", default=str(PROJECT_ROOT / "data" / "vector_store" / "embeddings.npy"))
+    parser.add_argument("--queries", default=None, help=".npy of query embeddings (default: sample the corpus)")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--num-queries", type=int, default=200)
+    parser.add_argument("--recall-target", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(PROJECT_ROOT / "benchmarks" / "results" / "index_benchmark.json"))
+    args = parser.parse_args()
+
+    report = run_benchmark(args.embeddings, args.queries, args.k, args.num_queries, args.recall_target, args.seed)
+    print_report(report)
+
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved report to {output_file}")
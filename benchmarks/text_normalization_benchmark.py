@@ -0,0 +1,207 @@
+# benchmarks/text_normalization_benchmark.py
+"""
+Throughput benchmark for the processors' text cleanup
+
+Runs each cleanup step over the real data/raw corpus twice: as the processors
+used to do it (string patterns through re.sub/re.match, the "before" functions
+below) and through src/processors/text_normalization.py ("after"). It reports
+MB/s for both, checks the outputs are identical, and writes a JSON report.
+
+Usage:
+    python benchmarks/text_normalization_benchmark.py [--raw-dir data/raw]
+                                                      [--pdf-text data/processed/pdf_content.json]
+                                                      [--output benchmarks/results/text_normalization_benchmark.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+import markdown
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT / "src"))
+from processors import text_normalization as tn
+
+
+# Before: the processors' cleanup as it was written inline
+
+def before_normalize_pdf_text(content: str) -> str:
+    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+    content = re.sub(r'[ \t]+', ' ', content)
+    content = re.sub(r'---\s*Page\s+\d+\s*---', '\n[PAGE BREAK]\n', content)
+    content = re.sub(r'([a-z])([A-Z])', r'\1 \2', content)
+    content = re.sub(r'(\d+)([A-Za-z])', r'\1 \2', content)
+    return content
+
+
+def before_is_section_header(line: str) -> bool:
+    header_patterns = [
+        r'^\d+\.\s+[A-Z]',
+        r'^[IVX]+\.\s+[A-Z]',
+        r'^[A-Z][A-Z\s]{2,20}$',
+        r'^[A-Z][a-z]+ [A-Z][a-z]+',
+    ]
+    for pattern in header_patterns:
+        if re.match(pattern, line):
+            return True
+    if (len(line) < 50 and
+        line[0].isupper() and
+        not line.endswith('.') and
+        any(keyword in line.lower() for keyword in
+            ['introduction', 'conclusion', 'methodology', 'results', 'abstract',
+             'background', 'implementation', 'evaluation', 'discussion'])):
+        return True
+    return False
+
+
+def before_normalize_markdown(content: str) -> str:
+    content = re.sub(r'%20', ' ', content)
+    content = re.sub(r'%E2%80%99', "'", content)
+    content = re.sub(r'\[([^\]]+)\]\([^)]+\.(png|jpg|jpeg|gif|mp4|mov)\)', r'[Image: \1]', content)
+    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+    content = re.sub(r'[ \t]+', ' ', content)
+    return content.strip()
+
+
+def before_character(match: re.Match) -> str:
+    code = int(match.group(1)) if match.group(1) else int(match.group(2), 16)
+    return chr(code) if 0 < code <= 0x10FFFF else match.group()
+
+
+def before_html_to_text(html_content: str) -> str:
+    text = re.sub(r'<[^>]+>', '', html_content)
+    text = re.sub(r'&#(?:([0-9]{1,7})|[xX]([0-9a-fA-F]{1,6}));', before_character, text)
+    text = text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def load_corpus(raw_dir: Path, pdf_text_file: str = None) -> Dict[str, List[str]]:
+    """
+    Texts each cleanup step sees in the pipeline
+
+    PDF text is extracted from raw_dir with PDFProcessor, unless pdf_text_file
+    (a pdf_content.json from an earlier run) already has it.
+    """
+    markdown_texts = [path.read_text(encoding='utf-8') for path in sorted(raw_dir.rglob("*.md"))]
+
+    if pdf_text_file:
+        with open(pdf_text_file, 'r', encoding='utf-8') as f:
+            pdf_texts = [item['raw_content'] for item in json.load(f)]
+    else:
+        from processors.pdf_processor import PDFProcessor
+        processor = PDFProcessor(str(raw_dir), file_timeout=0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pdf_texts = [processor._extract_text(path) for path in sorted(raw_dir.rglob("*.pdf"))]
+        pdf_texts = [text for text in pdf_texts if text]
+
+    pdf_lines = [line.strip() for text in pdf_texts for line in tn.normalize_pdf_text(text).split('\n')]
+    return {
+        'pdf_text': pdf_texts,
+        'pdf_lines': [line for line in pdf_lines if line],
+        'markdown': markdown_texts,
+        'html': [markdown.markdown(tn.normalize_markdown(text), extensions=['tables', 'toc', 'codehilite'])
+                 for text in markdown_texts]
+    }
+
+
+def time_step(fn: Callable[[str], Any], texts: List[str], repeats: int) -> float:
+    """Best-of-repeats seconds to run fn over all texts"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# (name, corpus, before, after)
+STEPS = [
+    ("normalize_pdf_text", 'pdf_text', before_normalize_pdf_text, tn.normalize_pdf_text),
+    ("is_section_header", 'pdf_lines', before_is_section_header, tn.is_section_header),
+    ("normalize_markdown", 'markdown', before_normalize_markdown, tn.normalize_markdown),
+    ("html_to_text", 'html', before_html_to_text, tn.html_to_text)
+]
+
+
+def run_benchmark(raw_dir: str, pdf_text_file: str = None, repeats: int = 20) -> Dict[str, Any]:
+    """
+    Benchmark every step in STEPS
+
+    Returns:
+        Report dict (environment, corpus sizes and one entry per step)
+    """
+    corpus = load_corpus(Path(raw_dir), pdf_text_file)
+    sizes = {name: sum(len(text.encode('utf-8')) for text in texts) for name, texts in corpus.items()}
+    print(f"📊 Corpus: {len(corpus['pdf_text'])} PDFs ({sizes['pdf_text'] / 1e6:.2f} MB), "
+          f"{len(corpus['markdown'])} markdown files ({sizes['markdown'] / 1e6:.2f} MB)")
+
+    results: List[Dict[str, Any]] = []
+    for name, corpus_name, before, after in STEPS:
+        print(f"🔧 Benchmarking {name}...")
+        texts = corpus[corpus_name]
+        megabytes = sizes[corpus_name] / 1e6
+        before_s = time_step(before, texts, repeats)
+        after_s = time_step(after, texts, repeats)
+        results.append({
+            'name': name,
+            'corpus': corpus_name,
+            'megabytes': megabytes,
+            'identical': all(before(text) == after(text) for text in texts),
+            'before_mb_per_s': megabytes / before_s,
+            'after_mb_per_s': megabytes / after_s,
+            'speedup': before_s / after_s
+        })
+
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python_version': platform.python_version(),
+            'machine': platform.machine()
+        },
+        'corpus': {
+            'raw_dir': str(raw_dir),
+            'pdf_text_file': str(pdf_text_file) if pdf_text_file else None,
+            'bytes': sizes,
+            'repeats': repeats
+        },
+        'results': results
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a summary table of a benchmark report"""
+    print(f"\n{'step':<20} {'MB':>6} {'before MB/s':>12} {'after MB/s':>11} {'speedup':>8} {'same':>5}")
+    for result in report['results']:
+        print(f"{result['name']:<20} {result['megabytes']:>6.2f} {result['before_mb_per_s']:>12.1f} "
+              f"{result['after_mb_per_s']:>11.1f} {result['speedup']:>7.2f}x {'yes' if result['identical'] else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark processor text cleanup")
+    parser.add_argument("--raw-dir", default=str(PROJECT_ROOT / "data" / "raw"))
+    parser.add_argument("--pdf-text", default=None,
+                        help="pdf_content.json to take PDF text from (default: extract from --raw-dir)")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output",
+                        default=str(PROJECT_ROOT / "benchmarks" / "results" / "text_normalization_benchmark.json"))
+    args = parser.parse_args()
+
+    report = run_benchmark(args.raw_dir, args.pdf_text, args.repeats)
+    print_report(report)
+
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved report to {output_file}")
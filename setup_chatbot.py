@@ -116,7 +116,6 @@ def check_vector_store():
     vector_store_dir = Path("data/vector_store")
     required_files = [
         "embeddings.npy",
-        "faiss_index.index",
         "metadata.json",
         "config.json"
     ]
@@ -126,12 +125,14 @@ def check_vector_store():
         if not (vector_store_dir / file).exists():
             missing_files.append(file)
 
+    # Published index generation, or a faiss_index.index from older builds
+    if not (vector_store_dir / "CURRENT").exists() and not (vector_store_dir / "faiss_index.index").exists():
+        missing_files.append("faiss_index.index")
+
     if missing_files:
         print(f"❌ Missing vector store files: {missing_files}")
         print("\n🔧 Please run the setup pipeline first:")
-        print("1. python run_processing.py")
-        print("2. python src/embeddings/embedding_generator.py")
-        print("3. python src/vector_store/faiss_manager.py")
+        print("   python src/pipeline/pipeline_runner.py")
         return False
     else:
         print("✅ Vector store ready!")
@@ -1,11 +1,17 @@
 # src/chatbot/groq_rag_chatbot.py
 
+import asyncio
 import json
+import logging
 import numpy as np
 import os
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from sentence_transformers import SentenceTransformer
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Union, Tuple, Hashable
+import httpx
 import requests
 import sys
 from dotenv import load_dotenv
@@ -16,107 +22,393 @@ load_dotenv()
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from vector_store.faiss_manager import FAISSManager
+from vector_store.chunk_store import get_chunk_store
+from embeddings.query_cache import get_query_embedding_cache
+from embeddings.micro_batcher import EmbeddingMicroBatcher
+from chatbot.http_client import PooledHTTPClient, AsyncPooledHTTPClient
+from chatbot.response_cache import SemanticResponseCache
+from chatbot.metrics import REGISTRY, STAGE_SECONDS, span
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_LOOKUPS = REGISTRY.counter(
+    "rag_response_cache_lookups_total", "Semantic response cache lookups", labelnames=("result",)
+)
+CONTEXT_TRUNCATIONS = REGISTRY.counter(
+    "rag_context_truncations_total", "Prompts whose retrieved context was cut to fit the token budget"
+)
+LLM_RESPONSES = REGISTRY.counter(
+    "rag_llm_responses_total", "Groq responses by HTTP status (or timeout / connection_error)",
+    labelnames=("status",)
+)
+INDEX_RELOADS = REGISTRY.counter(
+    "rag_index_reloads_total", "Vector store builds swapped in without a restart"
+)
+
+# query_groq() reports failures as user-facing text starting with one of these
+ERROR_PREFIXES = ("❌", "⚠️", "⏱️")
+
+DEFAULT_GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+
+@dataclass(frozen=True)
+class RetrievalIndex:
+    """FAISS index and chunk store of one vector store build, swapped as a unit"""
+    faiss_manager: FAISSManager
+    chunk_store: Any
+    version: Hashable  # Published generation (or index file mtime for legacy stores)
+
 
 class GroqRAGChatbot:
     """RAG Chatbot powered by Groq's free Llama API"""
 
-    def __init__(self, vector_store_dir: str, groq_api_key: str = None):
+    def __init__(self, vector_store_dir: str, groq_api_key: str = None, max_concurrent_llm_requests: int = 32,
+                 http_pool_size: int = 10, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 max_retries: int = 2, response_cache_size: int = 256, response_cache_ttl: float = 3600,
+                 cache_similarity_threshold: float = 0.95, query_cache_size: int = 1024,
+                 query_cache_path: Optional[str] = None, embed_max_batch_size: int = 32,
+                 embed_max_wait_ms: float = 2.0, groq_url: Optional[str] = None, warm_up: bool = True):
         """
         Initialize RAG chatbot with Groq
 
         Args:
             vector_store_dir: Directory containing FAISS index and embeddings
             groq_api_key: Groq API key (get free at https://console.groq.com)
+            max_concurrent_llm_requests: Cap on in-flight Groq calls from achat()
+            http_pool_size: Keep-alive connections kept open to Groq
+            connect_timeout: Seconds to establish a connection to Groq
+            read_timeout: Seconds to wait for Groq between response bytes
+            max_retries: Retries with backoff on connection errors and 429/5xx
+            response_cache_size: Max cached answers (0 disables the cache)
+            response_cache_ttl: Seconds a cached answer stays valid
+            cache_similarity_threshold: Min query cosine similarity to reuse an answer
+            query_cache_size: Max cached query embeddings (0 disables the cache)
+            query_cache_path: Optional .npz file persisting query embeddings across restarts
+            embed_max_batch_size: Max concurrent queries encoded in one model call
+            embed_max_wait_ms: Max time a query waits for others to batch with
+            groq_url: OpenAI-compatible chat completions URL (default: GROQ_API_URL
+                      environment variable, else Groq's API)
+            warm_up: Load the model and index now; if False, call warm_up() later
+                     (e.g. in the background) or let the first query do it
         """
         self.vector_store_dir = Path(vector_store_dir)
         # Use provided key or environment variable
         self.groq_api_key = groq_api_key or os.getenv('GROQ_API_KEY')
-        self.groq_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.groq_url = groq_url or os.getenv('GROQ_API_URL', DEFAULT_GROQ_URL)
         self.model_name = "llama-3.1-8b-instant"  # Fast, reliable production model
 
+        # Pooled keep-alive HTTP client; the async one is created lazily
+        # inside the running event loop
+        self.http_options = {
+            'pool_size': http_pool_size,
+            'connect_timeout': connect_timeout,
+            'read_timeout': read_timeout,
+            'max_retries': max_retries
+        }
+        self.http_client = PooledHTTPClient(**self.http_options)
+        self.max_concurrent_llm_requests = max_concurrent_llm_requests
+        self._async_client: Optional[AsyncPooledHTTPClient] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+
         if not self.groq_api_key:
-            print("⚠️  No Groq API key found!")
-            print("Get your free API key at: https://console.groq.com")
-            print("Then set it as: GROQ_API_KEY=your_key_here")
+            logger.warning("⚠️  No Groq API key found! Get your free API key at https://console.groq.com "
+                           "and set it as GROQ_API_KEY=your_key_here")
 
         # Load configuration
         with open(self.vector_store_dir / "config.json", 'r') as f:
             self.config = json.load(f)
 
+        self.embed_options = {'max_batch_size': embed_max_batch_size, 'max_wait_ms': embed_max_wait_ms}
+        self.query_cache_options = {'max_entries': query_cache_size, 'persist_path': query_cache_path}
+
+        # Answers for near-identical queries over the same chunks, per index build
+        self.response_cache = SemanticResponseCache(
+            max_entries=response_cache_size,
+            ttl_seconds=response_cache_ttl,
+            similarity_threshold=cache_similarity_threshold
+        )
+
+        # Model, index and chunk store are loaded by warm_up()
+        self.embedding_model = None
+        self.query_encoder: Optional[EmbeddingMicroBatcher] = None
+        self.query_cache = None
+        self.warm_up_error: Optional[BaseException] = None
+        self._ready = threading.Event()
+        self._warm_up_lock = threading.Lock()
+
+        # Replaced wholesale by reload_index(); requests read it once
+        self._index: Optional[RetrievalIndex] = None
+        self._reload_lock = threading.Lock()
+        self._rejected_version: Optional[Hashable] = None
+
+        if warm_up:
+            self.warm_up()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the model and index are loaded"""
+        return self._ready.is_set()
+
+    @property
+    def faiss_manager(self) -> Optional[FAISSManager]:
+        """FAISS manager of the currently served vector store build"""
+        return self._index.faiss_manager if self._index is not None else None
+
+    @property
+    def chunk_store(self):
+        """Chunk store of the currently served vector store build"""
+        return self._index.chunk_store if self._index is not None else None
+
+    @property
+    def index_version(self) -> Optional[Hashable]:
+        """Version of the currently served vector store build"""
+        return self._index.version if self._index is not None else None
+
+    def warm_up(self):
+        """
+        Load the embedding model and index, run a dummy encode and open a Groq connection
+
+        Safe to call from several threads; later calls wait for the first and
+        return immediately once warm. A failed warm-up is retried by the next call.
+        """
+        with self._warm_up_lock:
+            if self._ready.is_set():
+                return
+
+            start = time.perf_counter()
+            try:
+                self._load_resources()
+            except Exception as e:
+                self.warm_up_error = e
+                logger.exception("❌ Chatbot warm-up failed")
+                raise
+
+            self.warm_up_error = None
+            self._ready.set()
+            logger.info("✅ RAG Chatbot ready with %d chunks (warm-up %.1f s)",
+                        self.faiss_manager.index.ntotal, time.perf_counter() - start)
+
+        # Test Groq connection (also opens the first keep-alive connection)
+        self._test_groq_connection()
+
+    def _ensure_ready(self):
+        """Warm up on first use if nobody else has"""
+        if not self._ready.is_set():
+            self.warm_up()
+
+    def _load_resources(self):
+        """Load everything retrieval needs"""
+        # Deferred import: loading torch + sentence-transformers dominates startup
+        from sentence_transformers import SentenceTransformer
+
         # Initialize embedding model
-        print(f"🔄 Loading embedding model: {self.config['model_name']}")
-        self.embedding_model = SentenceTransformer(self.config['model_name'])
+        logger.info("🔄 Loading embedding model: %s", self.config['model_name'])
+        embedding_model = SentenceTransformer(self.config['model_name'])
 
-        # Initialize FAISS manager
-        print("🔄 Loading FAISS index...")
-        self.faiss_manager = FAISSManager(self.config['embedding_dimension'])
-        self.faiss_manager.load_index(str(self.vector_store_dir))
+        # First encode allocates buffers / initializes kernels; keep it off the first request
+        embedding_model.encode(["warm up"], convert_to_numpy=True)
 
-        print(f"✅ RAG Chatbot initialized with {self.faiss_manager.index.ntotal} chunks")
+        # Repeated queries skip the transformer (shared across chatbot instances)
+        query_cache = get_query_embedding_cache(self.config['model_name'], **self.query_cache_options)
 
-        # Test Groq connection
-        self._test_groq_connection()
+        logger.info("🔄 Loading FAISS index...")
+        index = self._load_index()
+
+        self.embedding_model = embedding_model
+        self.query_cache = query_cache
+        self._index = index
+        self.response_cache.set_generation(index.version)
+
+        # Concurrent queries are encoded together instead of one by one
+        self.query_encoder = EmbeddingMicroBatcher(self.embedding_model, **self.embed_options)
 
     def _test_groq_connection(self):
         """Test if Groq API is working"""
         if not self.groq_api_key:
-            print("❌ No Groq API key - responses will show error messages")
+            logger.error("❌ No Groq API key - responses will show error messages")
             return
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-
-            test_payload = {
-                "model": self.model_name,
-                "messages": [{"role": "user", "content": "Hi"}],
-                "max_tokens": 5
-            }
-
-            response = requests.post(
-                self.groq_url,
-                headers=headers,
-                json=test_payload,
-                timeout=10
+            # Listing models checks the key without spending a completion, and
+            # opens the first keep-alive connection for later requests
+            response = self.http_client.get(
+                self._models_url(),
+                headers=self._groq_headers(),
+                timeout=(self.http_options['connect_timeout'], 10)
             )
 
             if response.status_code == 200:
-                print(f"✅ Groq API connected! Using {self.model_name}")
+                logger.info("✅ Groq API connected! Using %s", self.model_name)
             elif response.status_code == 401:
-                print("❌ Invalid Groq API key!")
+                logger.error("❌ Invalid Groq API key!")
             elif response.status_code == 429:
-                print("⚠️  Groq rate limit reached - try again later")
+                logger.warning("⚠️  Groq rate limit reached - try again later")
             else:
-                print(f"⚠️  Groq API issue: {response.status_code}")
+                logger.warning("⚠️  Groq API issue: %s", response.status_code)
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Cannot connect to Groq API: {str(e)}")
+            logger.error("❌ Cannot connect to Groq API: %s", e)
+
+    def _models_url(self) -> str:
+        """OpenAI-compatible model list endpoint next to the chat completions URL"""
+        return self.groq_url.rsplit("/chat/completions", 1)[0] + "/models"
+
+    async def aprewarm(self):
+        """Open a keep-alive connection on the async client before the first achat()"""
+        if not self.groq_api_key:
+            return
+        client = self._get_async_client()
+        try:
+            await client.request("GET", self._models_url(), headers=self._groq_headers())
+        except httpx.HTTPError as e:
+            logger.warning("⚠️  Could not pre-warm Groq connection: %s", e)
+
+    def _published_version(self) -> Optional[Hashable]:
+        """Version of the vector store build currently on disk"""
+        generation = FAISSManager.current_generation(str(self.vector_store_dir))
+        if generation:
+            return generation
+        # Legacy vector stores without published generations
+        index_file = self.vector_store_dir / "faiss_index.index"
+        return index_file.stat().st_mtime_ns if index_file.exists() else None
+
+    def _load_index(self) -> RetrievalIndex:
+        """Load the published FAISS index and its chunk store"""
+        version = self._published_version()
+        faiss_manager = FAISSManager(self.config['embedding_dimension'])
+        faiss_manager.load_index(str(self.vector_store_dir))
+
+        # Chunk content comes from the mapped store, or for legacy vector
+        # stores is loaded once and shared with other chatbots on the same index
+        chunk_store = faiss_manager.chunk_store
+        if chunk_store is None:
+            chunks_file = self.vector_store_dir.parent / "processed" / "final_chunks.json"
+            chunk_store = get_chunk_store(str(chunks_file), faiss_manager.row_to_id)
+
+        return RetrievalIndex(faiss_manager, chunk_store, faiss_manager.generation or version)
+
+    def reload_index(self) -> bool:
+        """
+        Swap in a newly published vector store build, if there is one
+
+        The new index is loaded alongside the served one and then replaces it
+        in a single assignment: requests already retrieving finish on the old
+        build, later ones use the new build. Cached answers are invalidated.
+
+        Returns:
+            True if a new build was swapped in
+        """
+        if not self._ready.is_set():
+            return False  # Warm-up loads whatever is published
+
+        with self._reload_lock:
+            version = self._published_version()
+            if version is None or version in (self._index.version, self._rejected_version):
+                return False
+
+            with open(self.vector_store_dir / "config.json", 'r') as f:
+                config = json.load(f)
+            if (config['model_name'], config['embedding_dimension']) != \
+                    (self.config['model_name'], self.config['embedding_dimension']):
+                # Queries would be embedded with the wrong model; needs a restart
+                logger.warning("⚠️  Vector store %s uses %s; restart the API to switch embedding models",
+                               version, config['model_name'])
+                self._rejected_version = version
+                return False
+
+            start = time.perf_counter()
+            index = self._load_index()
+            previous = self._index
+            self._index = index
+            self.config = config
+            self.response_cache.set_generation(index.version)
+
+        INDEX_RELOADS.inc()
+        logger.info("🔄 Swapped vector store %s -> %s (%d chunks, loaded in %.1f s)", previous.version,
+                    index.version, index.faiss_manager.index.ntotal, time.perf_counter() - start)
+        return True
+
+    def _retrieve(self, query: str, top_k: int = 5,
+                  timings: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Embed the query and retrieve context chunks, returning both
+
+        If timings is given, embed_s, search_s and hydrate_s are recorded in it.
+        """
+        self._ensure_ready()
 
-    def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
-        """Retrieve relevant context chunks for a query"""
         # Generate query embedding
-        query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)
+        with span('embed', timings):
+            query_embedding = self.query_cache.encode(query, self.query_encoder)
 
-        # Search FAISS index
-        results = self.faiss_manager.search(query_embedding, top_k=top_k)
+        return query_embedding, self._search(query_embedding, top_k, timings)
 
-        # Load actual chunk content
-        chunks_file = self.vector_store_dir.parent / "processed" / "final_chunks.json"
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            all_chunks = json.load(f)
+    def _search(self, query_embedding: np.ndarray, top_k: int = 5,
+                timings: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """Search the index for an embedded query and add chunk content (records search_s and hydrate_s)"""
+        index = self._index  # One build for the whole search, even if a reload swaps it
 
-        # Create a lookup dictionary
-        chunk_lookup = {chunk['id']: chunk['content'] for chunk in all_chunks}
+        # Search FAISS index
+        with span('search', timings):
+            results = index.faiss_manager.search(query_embedding, top_k=top_k)
 
-        # Add full content to results
-        for result in results:
-            chunk_id = result['chunk_id']
-            result['content'] = chunk_lookup.get(chunk_id, "Content not found")
+        # Add full content from the in-memory store (no file I/O per request)
+        with span('hydrate', timings):
+            index.chunk_store.refresh_if_stale()
+            index.chunk_store.hydrate(results)
 
         return results
 
+    def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """Retrieve relevant context chunks for a query"""
+        return self._retrieve(query, top_k=top_k)[1]
+
+    def retrieve_context_batch(self, queries: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Retrieve context chunks for several queries with one encode and one FAISS search"""
+        self._ensure_ready()
+        index = self._index
+        query_embeddings = self.query_cache.encode_batch(queries, self.query_encoder)
+        all_results = index.faiss_manager.search_batch(query_embeddings, top_k=top_k)
+
+        index.chunk_store.refresh_if_stale()
+        for results in all_results:
+            index.chunk_store.hydrate(results)
+
+        return all_results
+
+    def _lookup_cached_response(self, query_embedding: np.ndarray, context_chunks: List[Dict[str, Any]],
+                                max_tokens: int) -> Optional[str]:
+        """Reuse a cached answer for a similar query over the same chunks"""
+        chunk_ids = [chunk['chunk_id'] for chunk in context_chunks]
+        cached = self.response_cache.lookup(query_embedding, chunk_ids, max_tokens)
+        RESPONSE_CACHE_LOOKUPS.inc(result="miss" if cached is None else "hit")
+        if cached is not None:
+            logger.debug("⚡ Answer served from response cache")
+        return cached
+
+    def _cache_response(self, query_embedding: np.ndarray, context_chunks: List[Dict[str, Any]],
+                        max_tokens: int, response: str, version: Optional[Hashable] = None):
+        """
+        Cache a successful answer (error messages are never cached)
+
+        version is the index build the request started on; answers from a
+        build that has since been swapped out are not cached.
+        """
+        response = response.strip()
+        if response and not response.startswith(ERROR_PREFIXES):
+            chunk_ids = [chunk['chunk_id'] for chunk in context_chunks]
+            self.response_cache.store(query_embedding, chunk_ids, max_tokens, response, generation=version)
+
+    def _cache_stream(self, tokens: Iterator[str], query_embedding: np.ndarray,
+                      context_chunks: List[Dict[str, Any]], max_tokens: int,
+                      version: Optional[Hashable] = None) -> Iterator[str]:
+        """Pass tokens through and cache the full answer once the stream ends"""
+        parts = []
+        for token in tokens:
+            parts.append(token)
+            yield token
+        self._cache_response(query_embedding, context_chunks, max_tokens, "".join(parts), version)
+
     def _estimate_tokens(self, text: str) -> int:
         """Rough token estimation (1 token ≈ 4 characters)"""
         return len(text) // 4
@@ -141,7 +433,8 @@ class GroqRAGChatbot:
 
             # Stop if adding this chunk would exceed limit
             if current_tokens + chunk_tokens > max_tokens:
-                print(f"📏 Context truncated at {current_tokens} tokens (chunk {i-1}/{len(context_chunks)})")
+                CONTEXT_TRUNCATIONS.inc()
+                logger.debug("📏 Context truncated at %d tokens (chunk %d/%d)", current_tokens, i - 1, len(context_chunks))
                 break
 
             context_text += chunk_text
@@ -161,7 +454,8 @@ class GroqRAGChatbot:
 
                             Be natural and conversational in all responses."""
         # Build truncated context
-        context_text = self._truncate_context(context_chunks, max_tokens=6000)
+        with span('truncate'):
+            context_text = self._truncate_context(context_chunks, max_tokens=6000)
 
         # Create shorter user message
         user_message = f"""Here's what I know about Wei Ming:
@@ -175,72 +469,340 @@ class GroqRAGChatbot:
             {"role": "user", "content": user_message}
         ]
 
-        # Debug: Print message sizes
-        total_tokens = sum(self._estimate_tokens(msg["content"]) for msg in messages)
-        print(f"📏 Estimated total input tokens: {total_tokens}")
+        # Debug: Log message sizes
+        if logger.isEnabledFor(logging.DEBUG):
+            total_tokens = sum(self._estimate_tokens(msg["content"]) for msg in messages)
+            logger.debug("📏 Estimated total input tokens: %d", total_tokens)
 
         return messages
 
-    def query_groq(self, messages: List[Dict[str, str]], max_tokens: int = 300) -> str:
-        """Query Groq API with reduced token limits"""
+    def _groq_headers(self) -> Dict[str, str]:
+        """HTTP headers for Groq API calls"""
+        return {
+            "Authorization": f"Bearer {self.groq_api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _groq_payload(self, messages: List[Dict[str, str]], max_tokens: int, stream: bool = False) -> Dict[str, Any]:
+        """Chat completion request body"""
+        return {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": 0.1,
+            "max_tokens": max_tokens,  # Reduced from 500 to 300
+            "top_p": 0.9,
+            "stream": stream
+        }
+
+    def _parse_stream_line(self, line: str) -> Optional[str]:
+        """Extract the token from one server-sent event line ('' if none, None when done)"""
+        if not line.startswith("data:"):
+            return ""
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return None
+        choices = json.loads(data).get('choices') or [{}]
+        return choices[0].get('delta', {}).get('content') or ""
+
+    def _parse_groq_response(self, status_code: int, content: bytes) -> str:
+        """Turn a Groq HTTP response into the answer text or a user-facing error"""
+        LLM_RESPONSES.inc(status=str(status_code))
+        if status_code == 200:
+            result = json.loads(content)
+            return result['choices'][0]['message']['content'].strip()
+        elif status_code == 401:
+            return "❌ Invalid Groq API key. Please check your key at https://console.groq.com"
+        elif status_code == 429:
+            return "⚠️ Rate limit reached. The free tier allows 14,400 requests per day. Please try again later."
+        elif status_code == 400:
+            error_details = json.loads(content) if content else {}
+            return f"❌ Request error: {error_details.get('error', {}).get('message', 'Message too long or invalid content')}"
+        else:
+            return f"❌ Groq API error: {status_code}. Please try again."
+
+    def query_groq(self, messages: List[Dict[str, str]], max_tokens: int = 300,
+                   stream: bool = False) -> Union[str, Iterator[str]]:
+        """
+        Query Groq API with reduced token limits
+
+        Args:
+            messages: Chat messages
+            max_tokens: Max tokens to generate
+            stream: If True, return a generator yielding tokens as they arrive
+        """
+        if stream:
+            return self._stream_groq(messages, max_tokens)
+
         if not self.groq_api_key:
             return "⚠️ Groq API key not configured. Please set your GROQ_API_KEY environment variable. Get a free key at https://console.groq.com"
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-
-            payload = {
-                "model": self.model_name,
-                "messages": messages,
-                "temperature": 0.1,
-                "max_tokens": max_tokens,  # Reduced from 500 to 300
-                "top_p": 0.9,
-                "stream": False
-            }
-
-            response = requests.post(
+            response = self.http_client.post(
                 self.groq_url,
-                headers=headers,
-                json=payload,
-                timeout=30
+                headers=self._groq_headers(),
+                json=self._groq_payload(messages, max_tokens)
             )
-
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content'].strip()
-            elif response.status_code == 401:
-                return "❌ Invalid Groq API key. Please check your key at https://console.groq.com"
-            elif response.status_code == 429:
-                return "⚠️ Rate limit reached. The free tier allows 14,400 requests per day. Please try again later."
-            elif response.status_code == 400:
-                error_details = response.json() if response.content else {}
-                return f"❌ Request error: {error_details.get('error', {}).get('message', 'Message too long or invalid content')}"
-            else:
-                return f"❌ Groq API error: {response.status_code}. Please try again."
+            self._print_timing(response.timing)
+            return self._parse_groq_response(response.status_code, response.content)
 
         except requests.exceptions.Timeout:
+            LLM_RESPONSES.inc(status="timeout")
             return "⏱️ Request timed out. Groq might be busy. Please try again."
         except requests.exceptions.RequestException as e:
+            LLM_RESPONSES.inc(status="connection_error")
             return f"❌ Connection error: {str(e)}. Please check your internet connection."
 
-    def chat(self, query: str, top_k: int = 5, max_tokens: int = 500) -> Dict[str, Any]:
-        """Main chat function - retrieve context and generate response"""
+    def _stream_groq(self, messages: List[Dict[str, str]], max_tokens: int) -> Iterator[str]:
+        """Yield response tokens from a streaming Groq completion"""
+        if not self.groq_api_key:
+            yield "⚠️ Groq API key not configured. Please set your GROQ_API_KEY environment variable. Get a free key at https://console.groq.com"
+            return
 
-        # Step 1: Retrieve relevant context (back to 5 chunks)
-        print(f"🔍 Retrieving context for: '{query}'")
-        context_chunks = self.retrieve_context(query, top_k=top_k)
+        try:
+            with self.http_client.post(
+                self.groq_url,
+                headers=self._groq_headers(),
+                json=self._groq_payload(messages, max_tokens, stream=True),
+                stream=True
+            ) as response:
+                self._print_timing(response.timing)
+                if response.status_code != 200:
+                    yield self._parse_groq_response(response.status_code, response.content)
+                    return
+
+                LLM_RESPONSES.inc(status="200")
+                for line in response.iter_lines(decode_unicode=True):
+                    token = self._parse_stream_line(line or "")
+                    if token is None:
+                        break
+                    if token:
+                        yield token
 
-        # Step 2: Generate messages for Groq
-        messages = self.generate_prompt_messages(query, context_chunks)
+        except requests.exceptions.Timeout:
+            LLM_RESPONSES.inc(status="timeout")
+            yield "⏱️ Request timed out. Groq might be busy. Please try again."
+        except requests.exceptions.RequestException as e:
+            LLM_RESPONSES.inc(status="connection_error")
+            yield f"❌ Connection error: {str(e)}. Please check your internet connection."
+
+    def _print_timing(self, timing: Dict[str, Any]):
+        """Log connection setup vs. server time for one Groq request"""
+        if logger.isEnabledFor(logging.DEBUG):
+            reused = "reused connection" if timing['new_connections'] == 0 else "new connection"
+            logger.debug("⏱️  Groq %s: connect %.0f ms, server %.0f ms, retries %d", reused,
+                         timing['connect_s'] * 1000, timing['server_s'] * 1000, timing['retries'])
+
+    def _get_async_client(self) -> AsyncPooledHTTPClient:
+        """Shared async HTTP client and concurrency limit for achat()"""
+        if self._async_client is None:
+            self._async_client = AsyncPooledHTTPClient(
+                **{**self.http_options, 'pool_size': max(self.http_options['pool_size'], self.max_concurrent_llm_requests)}
+            )
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_requests)
+        return self._async_client
+
+    async def aquery_groq(self, messages: List[Dict[str, str]], max_tokens: int = 300) -> str:
+        """Query Groq API without blocking the event loop"""
+        if not self.groq_api_key:
+            return "⚠️ Groq API key not configured. Please set your GROQ_API_KEY environment variable. Get a free key at https://console.groq.com"
 
-        # Step 3: Query Groq
-        print(f"🧠 Generating response with {self.model_name}...")
-        response = self.query_groq(messages, max_tokens=max_tokens)
+        client = self._get_async_client()
+        try:
+            async with self._llm_semaphore:
+                response = await client.post(
+                    self.groq_url,
+                    headers=self._groq_headers(),
+                    json=self._groq_payload(messages, max_tokens)
+                )
+            self._print_timing(response.timing)
+            return self._parse_groq_response(response.status_code, response.content)
+
+        except httpx.TimeoutException:
+            LLM_RESPONSES.inc(status="timeout")
+            return "⏱️ Request timed out. Groq might be busy. Please try again."
+        except httpx.HTTPError as e:
+            LLM_RESPONSES.inc(status="connection_error")
+            return f"❌ Connection error: {str(e)}. Please check your internet connection."
+
+    async def aquery_groq_stream(self, messages: List[Dict[str, str]], max_tokens: int = 300) -> AsyncIterator[str]:
+        """Yield response tokens from Groq without blocking the event loop"""
+        if not self.groq_api_key:
+            yield "⚠️ Groq API key not configured. Please set your GROQ_API_KEY environment variable. Get a free key at https://console.groq.com"
+            return
 
-        # Step 4: Return structured result
+        client = self._get_async_client()
+        try:
+            async with self._llm_semaphore:
+                async with client.stream(
+                    "POST",
+                    self.groq_url,
+                    headers=self._groq_headers(),
+                    json=self._groq_payload(messages, max_tokens, stream=True)
+                ) as response:
+                    self._print_timing(response.timing)
+                    if response.status_code != 200:
+                        yield self._parse_groq_response(response.status_code, await response.aread())
+                        return
+
+                    LLM_RESPONSES.inc(status="200")
+                    async for line in response.aiter_lines():
+                        token = self._parse_stream_line(line)
+                        if token is None:
+                            break
+                        if token:
+                            yield token
+
+        except httpx.TimeoutException:
+            LLM_RESPONSES.inc(status="timeout")
+            yield "⏱️ Request timed out. Groq might be busy. Please try again."
+        except httpx.HTTPError as e:
+            LLM_RESPONSES.inc(status="connection_error")
+            yield f"❌ Connection error: {str(e)}. Please check your internet connection."
+
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._llm_semaphore = None
+
+    def get_http_stats(self) -> Dict[str, Any]:
+        """Request counts and average connect/server times for the Groq clients"""
+        stats = {'sync': self.http_client.stats.as_dict()}
+        if self._async_client is not None:
+            stats['async'] = self._async_client.stats.as_dict()
+        return stats
+
+    def chat(self, query: str, top_k: int = 5, max_tokens: int = 500, stream: bool = False) -> Dict[str, Any]:
+        """
+        Main chat function - retrieve context and generate response
+
+        With stream=True the result's 'response' is a generator of tokens
+        (and 'timings' excludes the LLM, which runs as the generator is consumed).
+        """
+        timings: Dict[str, float] = {}
+
+        # total_s lands in the result's timings when the span closes
+        with span('total', timings):
+            # Step 1: Retrieve relevant context (back to 5 chunks)
+            logger.debug("🔍 Retrieving context for: '%s'", query)
+            version = self.index_version
+            query_embedding, context_chunks = self._retrieve(query, top_k=top_k, timings=timings)
+
+            # Step 2: Reuse a cached answer when possible
+            cached = self._lookup_cached_response(query_embedding, context_chunks, max_tokens)
+            if cached is not None:
+                response = iter([cached]) if stream else cached
+                return self._build_result(query, response, context_chunks, cache_hit=True, timings=timings)
+
+            # Step 3: Generate messages for Groq
+            with span('prompt', timings):
+                messages = self.generate_prompt_messages(query, context_chunks)
+
+            # Step 4: Query Groq
+            logger.debug("🧠 Generating response with %s...", self.model_name)
+            if stream:
+                response = self.query_groq(messages, max_tokens=max_tokens, stream=True)
+                response = self._cache_stream(response, query_embedding, context_chunks, max_tokens, version)
+            else:
+                with span('llm', timings):
+                    response = self.query_groq(messages, max_tokens=max_tokens)
+                self._cache_response(query_embedding, context_chunks, max_tokens, response, version)
+
+            # Step 5: Return structured result
+            return self._build_result(query, response, context_chunks, timings=timings)
+
+    async def _aretrieve(self, query: str, top_k: int, executor: Optional[Executor],
+                         timings: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Embed the query on the event loop, then search in the executor
+
+        The micro-batcher is awaited here rather than from an executor thread,
+        so every concurrent request can join a batch: batch size is bounded by
+        embed_max_batch_size / embed_max_wait_ms, not by the executor's worker
+        count. Time spent waiting for a worker is recorded as 'queue'.
+        """
+        loop = asyncio.get_running_loop()
+        timings = {} if timings is None else timings
+
+        if not self._ready.is_set():
+            await loop.run_in_executor(executor, self._ensure_ready)
+
+        with span('embed', timings):
+            query_embedding = await self.query_cache.aencode(query, self.query_encoder)
+
+        start = time.perf_counter()
+        results = await loop.run_in_executor(executor, self._search, query_embedding, top_k, timings)
+        queued = time.perf_counter() - start - timings['search_s'] - timings['hydrate_s']
+
+        STAGE_SECONDS.observe(max(queued, 0.0), stage='queue')
+        timings['queue_s'] = max(queued, 0.0)
+        return query_embedding, results
+
+    async def achat(self, query: str, top_k: int = 5, max_tokens: int = 500,
+                    executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """
+        Async chat - FAISS search runs in a worker pool, embedding and the LLM call on the event loop
+
+        Args:
+            query: User question
+            top_k: Number of context chunks to retrieve
+            max_tokens: Max tokens to generate
+            executor: Pool for FAISS search (default loop executor if None)
+        """
+        timings: Dict[str, float] = {}
+
+        # total_s lands in the result's timings when the span closes
+        with span('total', timings):
+            # Step 1: Embed (micro-batched) and search the index off the event loop
+            logger.debug("🔍 Retrieving context for: '%s'", query)
+            version = self.index_version
+            query_embedding, context_chunks = await self._aretrieve(query, top_k, executor, timings)
+
+            # Step 2: Reuse a cached answer when possible
+            cached = self._lookup_cached_response(query_embedding, context_chunks, max_tokens)
+            if cached is not None:
+                return self._build_result(query, cached, context_chunks, cache_hit=True, timings=timings)
+
+            # Step 3: Generate messages for Groq
+            with span('prompt', timings):
+                messages = self.generate_prompt_messages(query, context_chunks)
+
+            # Step 4: Query Groq without blocking other requests
+            logger.debug("🧠 Generating response with %s...", self.model_name)
+            with span('llm', timings):
+                response = await self.aquery_groq(messages, max_tokens=max_tokens)
+            self._cache_response(query_embedding, context_chunks, max_tokens, response, version)
+
+            return self._build_result(query, response, context_chunks, timings=timings)
+
+    async def achat_stream(self, query: str, top_k: int = 5, max_tokens: int = 500,
+                           executor: Optional[Executor] = None) -> AsyncIterator[str]:
+        """Async chat that yields response tokens as Groq generates them"""
+        logger.debug("🔍 Retrieving context for: '%s'", query)
+        version = self.index_version
+        query_embedding, context_chunks = await self._aretrieve(query, top_k, executor)
+
+        cached = self._lookup_cached_response(query_embedding, context_chunks, max_tokens)
+        if cached is not None:
+            yield cached
+            return
+
+        with span('prompt'):
+            messages = self.generate_prompt_messages(query, context_chunks)
+
+        logger.debug("🧠 Streaming response with %s...", self.model_name)
+        parts = []
+        with span('llm'):
+            async for token in self.aquery_groq_stream(messages, max_tokens=max_tokens):
+                parts.append(token)
+                yield token
+        self._cache_response(query_embedding, context_chunks, max_tokens, "".join(parts), version)
+
+    def _build_result(self, query: str, response: Union[str, Iterator[str]],
+                      context_chunks: List[Dict[str, Any]], cache_hit: bool = False,
+                      timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Structured chat result shared by chat() and achat()"""
         return {
             'query': query,
             'response': response,
@@ -255,12 +817,16 @@ class GroqRAGChatbot:
                 for chunk in context_chunks
             ],
             'model_used': self.model_name,
-            'api_provider': 'groq'
+            'api_provider': 'groq',
+            'cache_hit': cache_hit,
+            'timings': timings if timings is not None else {}
         }
 
 
 # Test the chatbot
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Get project root and vector store path
     current_dir = Path(__file__).parent
     project_root = current_dir.parent.parent
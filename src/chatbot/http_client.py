@@ -0,0 +1,269 @@
+# src/chatbot/http_client.py
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Connection setup time (TCP + TLS) spent by the current thread's request
+_connect_timing = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = getattr(_connect_timing, 'seconds', 0.0) + time.perf_counter() - start
+            _connect_timing.count = getattr(_connect_timing, 'count', 0) + 1
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = getattr(_connect_timing, 'seconds', 0.0) + time.perf_counter() - start
+            _connect_timing.count = getattr(_connect_timing, 'count', 0) + 1
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections record their setup time"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+
+class _CappedRetry(Retry):
+    """Retry that waits at most max_retry_after seconds for a Retry-After header"""
+
+    max_retry_after = 30.0
+
+    def new(self, **kw) -> "_CappedRetry":
+        retry = super().new(**kw)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        try:
+            seconds = super().parse_retry_after(retry_after)
+        except InvalidHeader:
+            return 0.0  # Unparseable (e.g. negative): fall back to exponential backoff
+        return min(seconds, self.max_retry_after)
+
+
+class _ClientStats:
+    """Thread-safe running totals of request timings"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.retries = 0
+        self.connect_seconds = 0.0
+        self.server_seconds = 0.0
+
+    def record(self, timing: Dict[str, Any]):
+        with self._lock:
+            self.requests += 1
+            self.new_connections += timing['new_connections']
+            self.retries += timing['retries']
+            self.connect_seconds += timing['connect_s']
+            self.server_seconds += timing['server_s']
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'retries': self.retries,
+                'avg_connect_ms': 1000 * self.connect_seconds / self.requests if self.requests else 0.0,
+                'avg_server_ms': 1000 * self.server_seconds / self.requests if self.requests else 0.0
+            }
+
+
+class PooledHTTPClient:
+    """Keep-alive requests session with bounded pool, retries and timing"""
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 max_retries: int = 2, backoff_factor: float = 0.5, max_retry_after: Optional[float] = None):
+        """
+        Create a pooled HTTP client
+
+        Args:
+            pool_size: Max keep-alive connections kept per host
+            connect_timeout: Seconds to establish a connection
+            read_timeout: Seconds to wait for the server between bytes
+            max_retries: Retries on connection errors and 429/5xx responses
+            backoff_factor: Exponential backoff base in seconds (Retry-After wins)
+            max_retry_after: Longest Retry-After wait honoured before a retry (default read_timeout)
+        """
+        self.timeout = (connect_timeout, read_timeout)
+
+        retry = _CappedRetry(
+            total=max_retries,
+            read=0,  # Never resend a request the server may already be processing
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,  # Retry POSTs too
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        retry.max_retry_after = read_timeout if max_retry_after is None else max_retry_after
+        adapter = _TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.stats = _ClientStats()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on a pooled connection
+
+        The returned response has a ``timing`` dict: connect_s (TCP + TLS setup,
+        0 when a kept-alive connection was reused), server_s (remaining time
+        until response headers), total_s, new_connections and retries.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        _connect_timing.seconds = 0.0
+        _connect_timing.count = 0
+
+        start = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        total = time.perf_counter() - start
+
+        retries = response.raw.retries if response.raw is not None else None
+        connect_s = _connect_timing.seconds
+        response.timing = {
+            'connect_s': connect_s,
+            'server_s': max(response.elapsed.total_seconds() - connect_s, 0.0),
+            'total_s': total,
+            'new_connections': _connect_timing.count,
+            'retries': len(retries.history) if retries is not None else 0
+        }
+        self.stats.record(response.timing)
+        return response
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncPooledHTTPClient:
+    """httpx.AsyncClient with the same pooling, retry and timing behaviour"""
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 max_retries: int = 2, backoff_factor: float = 0.5, max_retry_after: Optional[float] = None):
+        """Create an async pooled HTTP client (see PooledHTTPClient for arguments)"""
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_after = read_timeout if max_retry_after is None else max_retry_after
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=httpx.AsyncHTTPTransport(retries=max_retries)  # Connection errors only
+        )
+        self.stats = _ClientStats()
+
+    def _backoff(self, response: Optional[httpx.Response], attempt: int) -> float:
+        """Seconds to wait before retrying, honouring Retry-After up to max_retry_after"""
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                seconds = None
+            # HTTP dates, negative and NaN values fall back to exponential backoff
+            if seconds is not None and seconds >= 0.0:
+                return min(seconds, self.max_retry_after)
+        return self.backoff_factor * (2 ** attempt)
+
+    def _trace(self, timing: Dict[str, Any]):
+        """httpx trace hook accumulating connection setup time into timing"""
+        started = {}
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if not event_name.startswith(("connection.connect_tcp", "connection.start_tls")):
+                return
+            step, phase = event_name.rsplit(".", 1)
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase in ("complete", "failed") and step in started:
+                timing['connect_s'] += time.perf_counter() - started.pop(step)
+                if step == "connection.connect_tcp":
+                    timing['new_connections'] += 1
+
+        return trace
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streaming request, retrying 429/5xx before the body is read
+
+        The yielded response has a ``timing`` dict like PooledHTTPClient.request.
+        """
+        timing = {'connect_s': 0.0, 'server_s': 0.0, 'total_s': 0.0, 'new_connections': 0, 'retries': 0}
+        kwargs['extensions'] = {**kwargs.get('extensions', {}), 'trace': self._trace(timing)}
+        start = time.perf_counter()
+
+        attempt = 0
+        while True:
+            async with self.client.stream(method, url, **kwargs) as response:
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                    delay = self._backoff(response, attempt)
+                    await response.aclose()
+                else:
+                    timing['total_s'] = time.perf_counter() - start
+                    timing['server_s'] = max(timing['total_s'] - timing['connect_s'], 0.0)
+                    timing['retries'] = attempt
+                    response.timing = timing
+                    self.stats.record(timing)
+                    yield response
+                    return
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request and read the full body, with retries and timing"""
+        async with self.stream(method, url, **kwargs) as response:
+            await response.aread()
+            return response
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        await self.client.aclose()
@@ -11,22 +11,45 @@ import sys
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from vector_store.faiss_manager import FAISSManager
+from vector_store.chunk_store import get_chunk_store
+from embeddings.query_cache import get_query_embedding_cache
+from embeddings.micro_batcher import EmbeddingMicroBatcher
+from chatbot.http_client import PooledHTTPClient
 
 class RAGChatbot:
     """RAG Chatbot powered by Llama via Ollama"""
 
-    def __init__(self, vector_store_dir: str, llama_model: str = "llama3.2:3b"):
+    def __init__(self, vector_store_dir: str, llama_model: str = "llama3.2:3b",
+                 http_pool_size: int = 4, connect_timeout: float = 2.0, read_timeout: float = 30.0,
+                 max_retries: int = 2, query_cache_size: int = 1024, query_cache_path: Optional[str] = None,
+                 embed_max_batch_size: int = 32, embed_max_wait_ms: float = 2.0):
         """
         Initialize RAG chatbot
 
         Args:
             vector_store_dir: Directory containing FAISS index and embeddings
             llama_model: Ollama model name (e.g., "llama3.2:3b", "llama3.2:1b")
+            http_pool_size: Keep-alive connections kept open to Ollama
+            connect_timeout: Seconds to establish a connection to Ollama
+            read_timeout: Seconds to wait for Ollama between response bytes
+            max_retries: Retries with backoff on connection errors and 429/5xx
+            query_cache_size: Max cached query embeddings (0 disables the cache)
+            query_cache_path: Optional .npz file persisting query embeddings across restarts
+            embed_max_batch_size: Max concurrent queries encoded in one model call
+            embed_max_wait_ms: Max time a query waits for others to batch with
         """
         self.vector_store_dir = Path(vector_store_dir)
         self.llama_model = llama_model
         self.ollama_url = "http://localhost:11434/api/generate"
 
+        # Pooled keep-alive HTTP client for Ollama
+        self.http_client = PooledHTTPClient(
+            pool_size=http_pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries
+        )
+
         # Load configuration
         with open(self.vector_store_dir / "config.json", 'r') as f:
             self.config = json.load(f)
@@ -35,11 +58,32 @@ class RAGChatbot:
         print(f"🔄 Loading embedding model: {self.config['model_name']}")
         self.embedding_model = SentenceTransformer(self.config['model_name'])
 
+        # Concurrent queries are encoded together instead of one by one
+        self.query_encoder = EmbeddingMicroBatcher(
+            self.embedding_model,
+            max_batch_size=embed_max_batch_size,
+            max_wait_ms=embed_max_wait_ms
+        )
+
+        # Repeated queries skip the transformer (shared across chatbot instances)
+        self.query_cache = get_query_embedding_cache(
+            self.config['model_name'],
+            max_entries=query_cache_size,
+            persist_path=query_cache_path
+        )
+
         # Initialize FAISS manager
         print("🔄 Loading FAISS index...")
         self.faiss_manager = FAISSManager(self.config['embedding_dimension'])
         self.faiss_manager.load_index(str(self.vector_store_dir))
 
+        # Chunk content comes from the mapped store, or for legacy vector
+        # stores is loaded once and shared with other chatbots on the same index
+        self.chunk_store = self.faiss_manager.chunk_store
+        if self.chunk_store is None:
+            chunks_file = self.vector_store_dir.parent / "processed" / "final_chunks.json"
+            self.chunk_store = get_chunk_store(str(chunks_file), self.faiss_manager.row_to_id)
+
         print(f"✅ RAG Chatbot initialized with {self.faiss_manager.index.ntotal} chunks")
 
         # Test Ollama connection
@@ -48,7 +92,7 @@ class RAGChatbot:
     def _test_ollama_connection(self):
         """Test if Ollama is running and model is available"""
         try:
-            response = requests.post(
+            response = self.http_client.post(
                 "http://localhost:11434/api/tags",
                 timeout=5
             )
@@ -74,25 +118,27 @@ class RAGChatbot:
     def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Retrieve relevant context chunks for a query"""
         # Generate query embedding
-        query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)
+        query_embedding = self.query_cache.encode(query, self.query_encoder)
 
         # Search FAISS index
         results = self.faiss_manager.search(query_embedding, top_k=top_k)
 
-        # Load actual chunk content
-        chunks_file = self.vector_store_dir.parent / "processed" / "final_chunks.json"
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            all_chunks = json.load(f)
+        # Add full content from the in-memory store (no file I/O per request)
+        self.chunk_store.refresh_if_stale()
+        self.chunk_store.hydrate(results)
 
-        # Create a lookup dictionary
-        chunk_lookup = {chunk['id']: chunk['content'] for chunk in all_chunks}
+        return results
 
-        # Add full content to results
-        for result in results:
-            chunk_id = result['chunk_id']
-            result['content'] = chunk_lookup.get(chunk_id, "Content not found")
+    def retrieve_context_batch(self, queries: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Retrieve context chunks for several queries with one encode and one FAISS search"""
+        query_embeddings = self.query_cache.encode_batch(queries, self.query_encoder)
+        all_results = self.faiss_manager.search_batch(query_embeddings, top_k=top_k)
 
-        return results
+        self.chunk_store.refresh_if_stale()
+        for results in all_results:
+            self.chunk_store.hydrate(results)
+
+        return all_results
 
     def generate_prompt(self, query: str, context_chunks: List[Dict[str, Any]]) -> str:
         """Generate prompt for Llama with retrieved context"""
@@ -141,11 +187,13 @@ ANSWER:"""
                 }
             }
 
-            response = requests.post(
+            response = self.http_client.post(
                 self.ollama_url,
-                json=payload,
-                timeout=30
+                json=payload
             )
+            timing = response.timing
+            print(f"⏱️  Ollama: connect {timing['connect_s'] * 1000:.0f} ms, "
+                  f"server {timing['server_s'] * 1000:.0f} ms, retries {timing['retries']}")
 
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,148 @@
+# src/chatbot/response_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Hashable
+
+import numpy as np
+
+
+@dataclass
+class CachedResponse:
+    """One cached answer and the retrieval it was generated from"""
+    embedding: np.ndarray
+    chunk_ids: frozenset
+    max_tokens: int
+    response: str
+    created_at: float
+
+
+class SemanticResponseCache:
+    """LRU + TTL answer cache matched on query embedding similarity"""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600, similarity_threshold: float = 0.95):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Max cached answers (least recently used are evicted)
+            ttl_seconds: Seconds before a cached answer expires
+            similarity_threshold: Min cosine similarity between query embeddings
+                                  for a cached answer to be reused
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, CachedResponse]" = OrderedDict()
+        self._next_key = 0
+        self.generation: Optional[Hashable] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def set_generation(self, generation: Hashable):
+        """Tie the cache to an index build; a different generation clears it"""
+        with self._lock:
+            if generation != self.generation:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.generation = generation
+
+    def invalidate(self):
+        """Drop all cached answers"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def _expire(self, now: float):
+        """Remove expired entries (oldest first); caller holds the lock"""
+        for key in [key for key, entry in self._entries.items() if now - entry.created_at > self.ttl_seconds]:
+            del self._entries[key]
+            self.evictions += 1
+
+    def lookup(self, query_embedding: np.ndarray, chunk_ids: List[str], max_tokens: int) -> Optional[str]:
+        """
+        Find a cached answer for a similar query with the same retrieved chunks
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        if self.max_entries <= 0:
+            return None
+
+        query = self._normalize(query_embedding)
+        wanted_ids = frozenset(chunk_ids)
+
+        with self._lock:
+            self._expire(time.monotonic())
+
+            best_key, best_score = None, self.similarity_threshold
+            for key, entry in self._entries.items():
+                if entry.chunk_ids != wanted_ids or entry.max_tokens != max_tokens:
+                    continue
+                score = float(np.dot(entry.embedding, query))
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return self._entries[best_key].response
+
+    def store(self, query_embedding: np.ndarray, chunk_ids: List[str], max_tokens: int, response: str,
+              generation: Optional[Hashable] = None):
+        """
+        Cache an answer, evicting the least recently used if full
+
+        If generation is given and is no longer the cache's generation (the
+        index was swapped while the answer was generated), nothing is stored.
+        """
+        if self.max_entries <= 0:
+            return
+
+        entry = CachedResponse(
+            embedding=self._normalize(query_embedding),
+            chunk_ids=frozenset(chunk_ids),
+            max_tokens=max_tokens,
+            response=response,
+            created_at=time.monotonic()
+        )
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[self._next_key] = entry
+            self._next_key += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
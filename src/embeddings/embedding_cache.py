@@ -0,0 +1,82 @@
+# src/embeddings/embedding_cache.py
+
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional
+
+import numpy as np
+
+
+def content_hash(text: str) -> str:
+    """sha256 of chunk content (the cache key within one model)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent content-hash -> embedding store for one embedding model"""
+
+    def __init__(self, cache_dir: str, model_name: str):
+        """
+        Open (or start) the cache for a model
+
+        Args:
+            cache_dir: Directory holding one .npz file per model
+            model_name: Embedding model the vectors were produced by
+        """
+        self.model_name = model_name
+        self.cache_file = Path(cache_dir) / (model_name.replace('/', '__') + ".npz")
+        self._entries: Dict[str, np.ndarray] = {}
+
+        if self.cache_file.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self._entries.get(key)
+
+    def put_many(self, keys: List[str], embeddings: np.ndarray):
+        """Store one embedding per content hash"""
+        for key, embedding in zip(keys, embeddings):
+            self._entries[key] = np.asarray(embedding, dtype=np.float32)
+
+    def retain(self, keys: Iterable[str]) -> int:
+        """Drop entries not in keys (e.g. removed or edited chunks); returns how many were dropped"""
+        keep = set(keys)
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def load(self):
+        """Load vectors saved by save(); an unreadable cache is ignored and rebuilt"""
+        try:
+            with np.load(self.cache_file) as data:
+                if str(data['model_name']) != self.model_name:
+                    raise ValueError(f"cache is for {data['model_name']}")
+                keys, embeddings = data['keys'], data['embeddings']
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Ignoring embedding cache {self.cache_file}: {e}")
+            return
+
+        self._entries = {str(key): embedding for key, embedding in zip(keys, embeddings)}
+        print(f"✅ Loaded {len(self._entries)} cached embeddings from {self.cache_file}")
+
+    def save(self):
+        """Write the cache atomically"""
+        keys = list(self._entries)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            np.savez(
+                f,
+                model_name=np.array(self.model_name),
+                keys=np.array(keys, dtype=str),
+                embeddings=np.stack([self._entries[key] for key in keys]) if keys else np.zeros((0, 0), dtype=np.float32)
+            )
+        tmp_file.replace(self.cache_file)
+        print(f"💾 Saved {len(keys)} cached embeddings to {self.cache_file}")
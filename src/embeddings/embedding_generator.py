@@ -3,10 +3,15 @@
 import json
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 import pickle
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from embeddings.embedding_cache import EmbeddingCache, content_hash
 
 class EmbeddingGenerator:
     """Generate embeddings for content chunks using sentence transformers"""
@@ -21,17 +26,29 @@ class EmbeddingGenerator:
                        - all-mpnet-base-v2: Higher quality, 768 dimensions (slower)
         """
         self.model_name = model_name
-        print(f"🔄 Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name)
-        print(f"✅ Model loaded. Embedding dimension: {self.model.get_sentence_embedding_dimension()}")
-
-    def generate_embeddings_from_chunks(self, chunks_file: str, output_dir: str) -> Dict[str, Any]:
+        self._model = None
+
+    @property
+    def model(self) -> SentenceTransformer:
+        """Embedding model, loaded on first use (fully cached rebuilds never load it)"""
+        if self._model is None:
+            print(f"🔄 Loading embedding model: {self.model_name}")
+            self._model = SentenceTransformer(self.model_name)
+            print(f"✅ Model loaded. Embedding dimension: {self._model.get_sentence_embedding_dimension()}")
+        return self._model
+
+    def generate_embeddings_from_chunks(self, chunks_file: str, output_dir: str,
+                                        cache_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate embeddings for all chunks and save to files
 
+        Only chunks whose content is not in the embedding cache are encoded;
+        the rest reuse their stored vectors. Output rows follow final_chunks.json.
+
         Args:
             chunks_file: Path to final_chunks.json
             output_dir: Directory to save embeddings and metadata
+            cache_dir: Embedding cache directory (default: cache/embeddings beside chunks_file)
 
         Returns:
             Dictionary with embedding info
@@ -61,14 +78,29 @@ class EmbeddingGenerator:
                 'word_count': chunk['word_count']
             })
 
-        # Generate embeddings with progress bar
-        print(f"🧠 Generating embeddings using {self.model_name}...")
-        embeddings = self.model.encode(
-            texts,
-            show_progress_bar=True,
-            batch_size=32,
-            convert_to_numpy=True
-        )
+        # Reuse vectors for unchanged content, encode only new / changed chunks
+        cache = EmbeddingCache(cache_dir or str(chunks_path.parent / "cache" / "embeddings"), self.model_name)
+        hashes = [content_hash(text) for text in texts]
+        missing = list(dict.fromkeys(h for h in hashes if h not in cache))  # Unique, in order
+        reused = sum(1 for h in hashes if h in cache)
+        print(f"♻️  Reusing {reused} cached embeddings, encoding {len(missing)} new or changed chunks")
+
+        if missing:
+            text_by_hash = dict(zip(hashes, texts))
+            print(f"🧠 Generating embeddings using {self.model_name}...")
+            new_embeddings = self.model.encode(
+                [text_by_hash[h] for h in missing],
+                show_progress_bar=True,
+                batch_size=32,
+                convert_to_numpy=True
+            )
+            cache.put_many(missing, new_embeddings)
+
+        embeddings = np.stack([cache.get(h) for h in hashes])
+
+        # Keep only vectors for the current corpus
+        cache.retain(hashes)
+        cache.save()
 
         print(f"✅ Generated {len(embeddings)} embeddings")
         print(f"📐 Embedding shape: {embeddings.shape}")
@@ -93,6 +125,7 @@ class EmbeddingGenerator:
             'embedding_dimension': embeddings.shape[1],
             'num_chunks': embeddings.shape[0],
             'chunks_file': str(chunks_path),
+            'embedding_cache_file': str(cache.cache_file),
             'created_timestamp': str(Path().resolve())
         }
 
@@ -108,6 +141,7 @@ class EmbeddingGenerator:
             'metadata_file': str(metadata_file),
             'config_file': str(config_file),
             'num_embeddings': len(embeddings),
+            'num_encoded': len(missing),
             'embedding_dim': embeddings.shape[1]
         }
 
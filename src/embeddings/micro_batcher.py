@@ -0,0 +1,148 @@
+# src/embeddings/micro_batcher.py
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+import sys
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from chatbot.metrics import REGISTRY
+
+EMBEDDING_BATCH_SIZE = REGISTRY.histogram(
+    "rag_embedding_batch_size", "Queries encoded per micro-batched model call",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+_STOP = object()
+
+
+class EmbeddingMicroBatcher:
+    """Coalesce concurrent single-query encodes into batched model calls"""
+
+    def __init__(self, model, max_batch_size: int = 32, max_wait_ms: float = 2.0):
+        """
+        Start the batching worker
+
+        Args:
+            model: SentenceTransformer (anything with encode(texts, convert_to_numpy=True))
+            max_batch_size: Max queries encoded in one model call
+            max_wait_ms: Max time to hold a query while waiting for more to batch with it
+        """
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.batch_size_counts: Dict[int, int] = {}
+
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue one text; the future resolves to its (dim,) embedding"""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, texts: List[str], convert_to_numpy: bool = True, **kwargs) -> np.ndarray:
+        """
+        SentenceTransformer-compatible encode that goes through the batcher
+
+        Blocks until all texts are encoded; texts from concurrent callers are
+        encoded together.
+        """
+        futures = [self.submit(text) for text in texts]
+        return np.stack([future.result() for future in futures])
+
+    async def aencode(self, texts: List[str]) -> np.ndarray:
+        """
+        encode() for event loop callers: awaits the batch without holding a thread
+
+        Concurrent requests all reach the queue this way, so batches fill up to
+        max_batch_size instead of being limited by how many worker threads the
+        callers have.
+        """
+        futures = [asyncio.wrap_future(self.submit(text)) for text in texts]
+        return np.stack(await asyncio.gather(*futures))
+
+    def _collect(self, first: Tuple[str, Future]) -> List[Tuple[str, Future]]:
+        """Gather up to max_batch_size items, waiting at most max_wait_ms"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            # Take whatever is already queued without waiting
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = self._collect(item)
+            # Skip callers that gave up before we got to them
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                embeddings = self.model.encode([text for text, _ in batch], convert_to_numpy=True)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.items += len(batch)
+                self.batch_size_counts[len(batch)] = self.batch_size_counts.get(len(batch), 0) + 1
+            EMBEDDING_BATCH_SIZE.observe(len(batch))
+
+    def close(self):
+        """Stop the worker after already-queued texts are encoded"""
+        self._queue.put(_STOP)
+        self._worker.join(timeout=5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch counts and how full batches were"""
+        with self._stats_lock:
+            avg_batch_size = self.items / self.batches if self.batches else 0.0
+            return {
+                'batches': self.batches,
+                'items': self.items,
+                'avg_batch_size': avg_batch_size,
+                'avg_batch_fill': avg_batch_size / self.max_batch_size,
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait_ms,
+                'batch_size_counts': dict(sorted(self.batch_size_counts.items()))
+            }
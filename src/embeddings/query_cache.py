@@ -0,0 +1,207 @@
+# src/embeddings/query_cache.py
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import sys
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from chatbot.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+QUERY_EMBEDDING_CACHE_LOOKUPS = REGISTRY.counter(
+    "rag_query_embedding_cache_lookups_total", "Query embedding cache lookups", labelnames=("result",)
+)
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU of normalized query text -> float32 query embedding"""
+
+    def __init__(self, max_entries: int = 1024, persist_path: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Max cached query embeddings (least recently used evicted)
+            persist_path: Optional .npz file to load from now and save() to later
+        """
+        self.max_entries = max_entries
+        self.persist_path = Path(persist_path) if persist_path else None
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.persist_path and self.persist_path.exists():
+            self.load()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Cache key: query with surrounding and repeated whitespace removed"""
+        return " ".join(query.split())
+
+    def get(self, query: str) -> Optional[np.ndarray]:
+        """Get a cached (1, dim) embedding, or None"""
+        key = self.normalize_query(query)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        QUERY_EMBEDDING_CACHE_LOOKUPS.inc(result="miss" if embedding is None else "hit")
+        return embedding
+
+    def put(self, query: str, embedding: np.ndarray) -> np.ndarray:
+        """Cache an embedding for a query and return the stored (1, dim) array"""
+        embedding = np.array(embedding, dtype=np.float32).reshape(1, -1)
+        embedding.flags.writeable = False  # Shared between callers
+        if self.max_entries <= 0:
+            return embedding
+
+        key = self.normalize_query(query)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return embedding
+
+    def __contains__(self, query: str) -> bool:
+        with self._lock:
+            return self.normalize_query(query) in self._entries
+
+    def encode(self, query: str, model) -> np.ndarray:
+        """
+        Get the embedding for a query, encoding it with model on a miss
+
+        Args:
+            query: Query text
+            model: Anything with a SentenceTransformer-style encode(texts, convert_to_numpy=True)
+
+        Returns:
+            float32 array of shape (1, dim)
+        """
+        embedding = self.get(query)
+        if embedding is None:
+            embedding = self.put(query, model.encode([self.normalize_query(query)], convert_to_numpy=True))
+        return embedding
+
+    async def aencode(self, query: str, encoder) -> np.ndarray:
+        """
+        encode() for event loop callers
+
+        Args:
+            query: Query text
+            encoder: Anything with an async aencode(texts) (e.g. EmbeddingMicroBatcher)
+
+        Returns:
+            float32 array of shape (1, dim)
+        """
+        embedding = self.get(query)
+        if embedding is None:
+            embedding = self.put(query, await encoder.aencode([self.normalize_query(query)]))
+        return embedding
+
+    def encode_batch(self, queries: List[str], model) -> np.ndarray:
+        """
+        Get embeddings for several queries, encoding all misses in one call
+
+        Returns:
+            float32 array of shape (len(queries), dim)
+        """
+        embeddings = [self.get(query) for query in queries]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            encoded = model.encode([self.normalize_query(queries[i]) for i in missing], convert_to_numpy=True)
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = self.put(queries[i], embedding)
+
+        return np.concatenate(embeddings)
+
+    def warm(self, queries: List[str], model, batch_size: int = 32):
+        """Pre-compute embeddings for known queries in one batched encode"""
+        missing = [query for query in dict.fromkeys(self.normalize_query(q) for q in queries)
+                   if query not in self]
+        if not missing:
+            return
+        embeddings = model.encode(missing, convert_to_numpy=True, batch_size=batch_size)
+        for query, embedding in zip(missing, embeddings):
+            self.put(query, embedding)
+        logger.info("🔥 Pre-warmed %d query embeddings", len(missing))
+
+    def save(self, path: Optional[str] = None):
+        """Persist cached embeddings to an .npz file"""
+        target = Path(path) if path else self.persist_path
+        if target is None:
+            return
+        with self._lock:
+            queries = list(self._entries.keys())
+            embeddings = [self._entries[query][0] for query in queries]
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = target.with_name(target.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            np.savez(
+                f,
+                queries=np.array(queries, dtype=str),
+                embeddings=np.stack(embeddings) if embeddings else np.zeros((0, 0), dtype=np.float32)
+            )
+        tmp_file.replace(target)
+        logger.info("💾 Saved %d query embeddings to %s", len(queries), target)
+
+    def load(self, path: Optional[str] = None):
+        """Load cached embeddings saved by save()"""
+        source = Path(path) if path else self.persist_path
+        try:
+            with np.load(source) as data:
+                queries, embeddings = data['queries'], data['embeddings']
+        except (OSError, KeyError, ValueError):
+            logger.warning("⚠️  Could not load query embedding cache from %s", source, exc_info=True)
+            return
+
+        for query, embedding in zip(queries, embeddings):
+            self.put(str(query), embedding)
+        logger.info("✅ Loaded %d cached query embeddings from %s", len(queries), source)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+_shared_caches: Dict[str, QueryEmbeddingCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_query_embedding_cache(model_name: str, max_entries: int = 1024,
+                              persist_path: Optional[str] = None) -> QueryEmbeddingCache:
+    """
+    Get the process-wide query embedding cache for an embedding model
+
+    Chatbots using the same model share one cache; settings from the first
+    caller win.
+    """
+    with _shared_lock:
+        cache = _shared_caches.get(model_name)
+        if cache is None:
+            cache = QueryEmbeddingCache(max_entries=max_entries, persist_path=persist_path)
+            _shared_caches[model_name] = cache
+        return cache
@@ -0,0 +1,342 @@
+# src/pipeline/pipeline_runner.py
+"""
+Incremental pipeline from data/raw to the FAISS index
+
+Runs the processing scripts as one DAG:
+
+    discover ─┬─ markdown ─┐
+              └─ pdf ──────┴─ aggregate ── embed ── index
+
+Each stage is keyed by a hash of what it reads: the content hashes of its raw
+files (from the data/raw manifest), the content hashes of its dependencies'
+outputs and its settings. A stage whose key matches the last successful run,
+and whose outputs are still on disk unmodified, is skipped; a stage that reruns
+but writes identical outputs leaves everything downstream skipped too.
+Independent stages (markdown and PDF extraction) run concurrently in worker
+processes.
+
+Usage:
+    python src/pipeline/pipeline_runner.py [--force] [--sequential] [--pdf-workers N]
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from processors.extraction_cache import file_hash
+from processors.file_manifest import FileManifest, discover_raw_files, typed_files, print_diff
+from processors import markdown_processor, pdf_processor
+
+# Bump when the stages change in a way their keys do not capture, so everything reruns
+PIPELINE_VERSION = "1"
+
+
+@dataclass
+class PipelineConfig:
+    """Where the pipeline reads and writes, and the settings that shape its outputs"""
+    project_root: Path
+    pdf_workers: int = 1
+    pdf_timeout: float = 120.0
+    fast_plain_text: bool = False
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    index_type: str = "auto"
+
+    @property
+    def raw_dir(self) -> Path:
+        return self.project_root / "data" / "raw"
+
+    @property
+    def export_dir(self) -> Path:
+        return self.raw_dir / "notion_export"
+
+    @property
+    def processed_dir(self) -> Path:
+        return self.project_root / "data" / "processed"
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.processed_dir / "cache"
+
+    @property
+    def vector_store_dir(self) -> Path:
+        return self.project_root / "data" / "vector_store"
+
+
+@dataclass
+class Stage:
+    """One step of the pipeline"""
+    name: str
+    run: Callable[[PipelineConfig, List[Path]], None]  # Module level, so it can run in a worker process
+    outputs: List[str]  # Files the stage writes, relative to project_root
+    deps: List[str] = field(default_factory=list)
+    file_type: Optional[str] = None  # typed_files() list passed to run ('markdown', 'pdf' or 'csv')
+    raw_inputs: List[str] = field(default_factory=list)  # Other files it reads, relative to data/raw
+    params: List[str] = field(default_factory=list)  # PipelineConfig fields its outputs depend on
+    version: str = "1"  # Bump when the stage's output changes for the same inputs
+
+
+# Stage functions (run in worker processes when stages run concurrently)
+
+def run_markdown(config: PipelineConfig, md_files: List[Path]):
+    processor = markdown_processor.MarkdownProcessor(
+        str(config.export_dir), cache_dir=str(config.cache_dir), fast_plain_text=config.fast_plain_text
+    )
+    processor.process_all_markdown(md_files)
+    processor.save_processed_content(str(config.processed_dir / "markdown_content.json"))
+
+
+def run_pdf(config: PipelineConfig, pdf_files: List[Path]):
+    base_path = config.export_dir if config.export_dir.exists() else config.raw_dir
+    processor = pdf_processor.PDFProcessor(
+        str(base_path), workers=config.pdf_workers, file_timeout=config.pdf_timeout, cache_dir=str(config.cache_dir)
+    )
+    processor.process_all_pdfs(pdf_files)
+    processor.save_processed_content(str(config.processed_dir / "pdf_content.json"))
+
+
+def run_aggregate(config: PipelineConfig, csv_files: List[Path]):
+    from processors.content_aggregator import ContentAggregator
+
+    aggregator = ContentAggregator(str(config.processed_dir), config.chunk_size, config.chunk_overlap)
+    aggregator.aggregate_all_content(csv_files)
+    aggregator.save_chunks(str(config.processed_dir / "final_chunks.json"))
+
+
+def run_embed(config: PipelineConfig, files: List[Path]):
+    from embeddings.embedding_generator import EmbeddingGenerator
+
+    generator = EmbeddingGenerator(config.model_name)
+    generator.generate_embeddings_from_chunks(
+        str(config.processed_dir / "final_chunks.json"), str(config.vector_store_dir)
+    )
+
+
+def run_index(config: PipelineConfig, files: List[Path]):
+    from vector_store.faiss_manager import FAISSManager
+
+    with open(config.vector_store_dir / "config.json", 'r') as f:
+        embedding_dim = json.load(f)['embedding_dimension']
+
+    manager = FAISSManager(embedding_dim, index_type=config.index_type)
+    if FAISSManager.current_generation(str(config.vector_store_dir)):
+        # Only re-index chunks that changed since the published generation
+        try:
+            manager.sync_from_embeddings(str(config.vector_store_dir))
+            return
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            manager = FAISSManager(embedding_dim, index_type=config.index_type)
+    manager.create_index_from_embeddings(str(config.vector_store_dir))
+
+
+# In dependency order. config.json is left out of embed's outputs: publishing
+# an index generation rewrites it.
+STAGES = [
+    Stage("markdown", run_markdown, ["data/processed/markdown_content.json"],
+          file_type='markdown', params=['fast_plain_text'], version=markdown_processor.PROCESSOR_VERSION),
+    Stage("pdf", run_pdf, ["data/processed/pdf_content.json"],
+          file_type='pdf', version=pdf_processor.PROCESSOR_VERSION),
+    Stage("aggregate", run_aggregate, ["data/processed/final_chunks.json"],
+          deps=["markdown", "pdf"], file_type='csv', raw_inputs=["basic_info.json"],
+          params=['chunk_size', 'chunk_overlap']),
+    Stage("embed", run_embed, ["data/vector_store/embeddings.npy", "data/vector_store/metadata.json"],
+          deps=["aggregate"], params=['model_name']),
+    Stage("index", run_index, ["data/vector_store/CURRENT"],
+          deps=["embed"], params=['index_type'])
+]
+
+
+class PipelineRunner:
+    """Run the pipeline stages whose inputs changed since their last successful run"""
+
+    def __init__(self, config: PipelineConfig, stages: List[Stage] = STAGES, concurrent: bool = True):
+        """
+        Args:
+            config: Paths and settings
+            stages: Stages in dependency order
+            concurrent: Run independent stages at the same time in worker processes
+        """
+        names = set()
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in names]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on {missing}, which must come before it")
+            names.add(stage.name)
+
+        self.config = config
+        self.stages = stages
+        self.concurrent = concurrent
+        self.state_file = config.cache_dir / "pipeline_state.json"
+        self.state: Dict[str, Dict[str, Any]] = self._load_state()
+
+    def run(self, force: bool = False) -> Dict[str, str]:
+        """
+        Discover data/raw, then run every stage that is out of date
+
+        Args:
+            force: Run every stage even if its inputs are unchanged
+
+        Returns:
+            Outcome per stage: 'skipped', 'ran', 'failed' or 'blocked' (a dependency failed)
+        """
+        start = time.perf_counter()
+        manifest, diff = discover_raw_files(
+            str(self.config.raw_dir), str(self.config.cache_dir / "raw_manifest.json")
+        )
+        print_diff(diff)
+        files = typed_files(manifest)
+
+        outcomes: Dict[str, str] = {}
+        outputs: Dict[str, Dict[str, str]] = {}  # Output hashes of finished stages
+        pending = list(self.stages)
+        running: Dict[Future, Tuple[Stage, str, float]] = {}
+        executor = ProcessPoolExecutor(max_workers=len(self.stages)) if self.concurrent else None
+
+        try:
+            while pending or running:
+                for stage in list(pending):
+                    if any(outcomes.get(dep) in ('failed', 'blocked') for dep in stage.deps):
+                        pending.remove(stage)
+                        outcomes[stage.name] = 'blocked'
+                        print(f"⛔ {stage.name}: not run, a dependency failed")
+                        continue
+                    if not all(dep in outputs for dep in stage.deps):
+                        continue
+
+                    pending.remove(stage)
+                    stage_files = files[stage.file_type] if stage.file_type else []
+                    key = self._stage_key(stage, manifest, stage_files, outputs)
+                    recorded = None if force else self._up_to_date(stage, key)
+                    if recorded is not None:
+                        outputs[stage.name] = recorded
+                        outcomes[stage.name] = 'skipped'
+                        print(f"⏭️  {stage.name}: up to date")
+                        continue
+
+                    print(f"▶️  {stage.name}: running...")
+                    if executor is not None:
+                        running[executor.submit(stage.run, self.config, stage_files)] = (stage, key, time.perf_counter())
+                    else:
+                        stage_start = time.perf_counter()
+                        try:
+                            stage.run(self.config, stage_files)
+                            error = None
+                        except Exception as e:
+                            error = e
+                        outcomes[stage.name] = self._finish(stage, key, stage_start, error, outputs)
+
+                if running:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        stage, key, stage_start = running.pop(future)
+                        outcomes[stage.name] = self._finish(stage, key, stage_start, future.exception(), outputs)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        ran = [name for name, outcome in outcomes.items() if outcome == 'ran']
+        failed = [name for name, outcome in outcomes.items() if outcome in ('failed', 'blocked')]
+        print(f"\n🏁 Pipeline finished in {time.perf_counter() - start:.1f}s: "
+              f"ran {ran or 'nothing'}, {len(outcomes) - len(ran) - len(failed)} up to date"
+              + (f", {len(failed)} not completed" if failed else ""))
+        return outcomes
+
+    def _stage_key(self, stage: Stage, manifest: FileManifest, stage_files: List[Path],
+                   outputs: Dict[str, Dict[str, str]]) -> str:
+        """Hash of everything the stage's outputs depend on"""
+        raw_files = [path.relative_to(manifest.root).as_posix() for path in stage_files] + stage.raw_inputs
+        key_data = {
+            'pipeline_version': PIPELINE_VERSION,
+            'stage': stage.name,
+            'version': stage.version,
+            'params': {name: getattr(self.config, name) for name in stage.params},
+            'raw_files': {path: manifest.entries.get(path, {}).get('sha256') for path in raw_files},
+            'deps': {dep: outputs[dep] for dep in stage.deps}
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _up_to_date(self, stage: Stage, key: str) -> Optional[Dict[str, str]]:
+        """Output hashes recorded for this key, if the outputs on disk still have them (else None)"""
+        entry = self.state.get(stage.name)
+        if entry is None or entry['key'] != key:
+            return None
+        for output, digest in entry['outputs'].items():
+            output_file = self.config.project_root / output
+            if not output_file.exists() or file_hash(output_file) != digest:
+                return None
+        return entry['outputs']
+
+    def _finish(self, stage: Stage, key: str, stage_start: float, error: Optional[BaseException],
+                outputs: Dict[str, Dict[str, str]]) -> str:
+        """Record a stage that ran; returns its outcome"""
+        seconds = time.perf_counter() - stage_start
+        if error is None:
+            missing = [output for output in stage.outputs if not (self.config.project_root / output).exists()]
+            if missing:
+                error = FileNotFoundError(f"did not write {missing}")
+        if error is not None:
+            print(f"❌ {stage.name}: failed after {seconds:.1f}s: {error}")
+            self.state.pop(stage.name, None)
+            self._save_state()
+            return 'failed'
+
+        outputs[stage.name] = {
+            output: file_hash(self.config.project_root / output) for output in stage.outputs
+        }
+        previous = self.state.get(stage.name, {}).get('outputs')
+        self.state[stage.name] = {'key': key, 'outputs': outputs[stage.name], 'seconds': round(seconds, 3)}
+        self._save_state()
+        unchanged = " (outputs unchanged)" if outputs[stage.name] == previous else ""
+        print(f"✅ {stage.name}: done in {seconds:.1f}s{unchanged}")
+        return 'ran'
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Stage keys and output hashes from the last run (empty if there is none or it is unreadable)"""
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)['stages']
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Ignoring pipeline state {self.state_file}: {e}")
+            return {}
+
+    def _save_state(self):
+        """Write the stage state atomically (after every stage, so an interrupted run keeps its progress)"""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_name(f"{self.state_file.name}.tmp-{os.getpid()}")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'stages': self.state}, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh processed content, embeddings and the FAISS index")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if its inputs are unchanged")
+    parser.add_argument("--sequential", action="store_true", help="Run one stage at a time in this process")
+    parser.add_argument("--pdf-workers", type=int, default=os.cpu_count() or 1, help="PDF extraction processes")
+    parser.add_argument("--pdf-timeout", type=float, default=120.0, help="Seconds per PDF / page range")
+    parser.add_argument("--fast-plain-text", action="store_true",
+                        help="Extract markdown plain_text without rendering HTML")
+    args = parser.parse_args()
+
+    config = PipelineConfig(
+        project_root=Path(__file__).parent.parent.parent,
+        pdf_workers=args.pdf_workers,
+        pdf_timeout=args.pdf_timeout,
+        fast_plain_text=args.fast_plain_text
+    )
+    outcomes = PipelineRunner(config, concurrent=not args.sequential).run(force=args.force)
+    sys.exit(1 if any(outcome in ('failed', 'blocked') for outcome in outcomes.values()) else 0)
@@ -26,8 +26,13 @@ class ContentAggregator:
         self.chunk_overlap = chunk_overlap
         self.all_chunks = []
 
-    def aggregate_all_content(self) -> List[ContentChunk]:
-        """Aggregate all processed content into chunks"""
+    def aggregate_all_content(self, csv_files: Optional[List[Path]] = None) -> List[ContentChunk]:
+        """
+        Aggregate all processed content into chunks
+
+        Args:
+            csv_files: Notion export CSVs already found (e.g. by FileManifest); None searches data/raw
+        """
         print("🔄 Aggregating all content...")
 
         # Load markdown content
@@ -37,7 +42,7 @@ class ContentAggregator:
         self._load_pdf_content()
 
         # Load CSV content
-        self._load_csv_content()
+        self._load_csv_content(csv_files)
 
         # Load basic info
         self._load_basic_info()
@@ -94,11 +99,12 @@ class ContentAggregator:
             else:
                 self._chunk_general_pdf(item)
 
-    def _load_csv_content(self):
+    def _load_csv_content(self, csv_files: Optional[List[Path]] = None):
         """Load and process CSV content"""
         # Look for CSV files in the raw data
         try:
-            csv_files = list((self.processed_data_dir.parent / "raw" / "notion_export").rglob("*.csv"))
+            if csv_files is None:
+                csv_files = list((self.processed_data_dir.parent / "raw" / "notion_export").rglob("*.csv"))
 
             if csv_files:
                 print(f"📊 Found {len(csv_files)} CSV files")
@@ -0,0 +1,118 @@
+# src/processors/extraction_cache.py
+
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterable, Tuple
+
+
+def file_hash(file_path: Path) -> str:
+    """sha256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Persistent per-file processor output, reused while the source file is unchanged"""
+
+    def __init__(self, cache_file: str, processor_version: str, scope: str = ""):
+        """
+        Open (or start) a processor's cache
+
+        Args:
+            cache_file: JSON file holding the cached results
+            processor_version: Processor output version; a different one discards the cache
+            scope: Anything else results depend on (e.g. the processor's base path)
+        """
+        self.cache_file = Path(cache_file)
+        self.processor_version = processor_version
+        self.scope = scope
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+
+        if self.cache_file.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, file_path: Path) -> Tuple[bool, Any]:
+        """
+        Find the cached result for a file
+
+        A file whose size and mtime are unchanged is a hit without reading it;
+        if only the mtime changed (e.g. a re-export), its content hash decides.
+
+        Returns:
+            (True, result) on a hit, (False, None) otherwise
+        """
+        entry = self._entries.get(str(file_path))
+        if entry is None:
+            return False, None
+
+        stat = file_path.stat()
+        if stat.st_size != entry['size']:
+            return False, None
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            if file_hash(file_path) != entry['sha256']:
+                return False, None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._dirty = True
+
+        return True, copy.deepcopy(entry['result'])
+
+    def store(self, file_path: Path, result: Any):
+        """Cache a file's result (must be JSON serializable; None is cached too)"""
+        stat = file_path.stat()
+        self._entries[str(file_path)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_hash(file_path),
+            'result': copy.deepcopy(result)
+        }
+        self._dirty = True
+
+    def retain(self, file_paths: Iterable[Path]) -> int:
+        """Drop entries for files not in file_paths (deleted or renamed); returns how many were dropped"""
+        keep = {str(file_path) for file_path in file_paths}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        self._dirty = self._dirty or bool(stale)
+        return len(stale)
+
+    def load(self):
+        """Load results saved by save(); an unreadable or outdated cache is ignored"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data['processor_version'], data['scope']) != (self.processor_version, self.scope):
+                raise ValueError(f"cache is for version {data['processor_version']} of {data['scope']}")
+            entries = data['entries']
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Ignoring extraction cache {self.cache_file}: {e}")
+            return
+
+        self._entries = entries
+        print(f"✅ Loaded {len(self._entries)} cached extraction results from {self.cache_file}")
+
+    def save(self):
+        """Write the cache atomically (skipped if nothing changed)"""
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.tmp-{os.getpid()}")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'processor_version': self.processor_version,
+                'scope': self.scope,
+                'entries': self._entries
+            }, f, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+        self._dirty = False
+        print(f"💾 Saved {len(self._entries)} cached extraction results to {self.cache_file}")
@@ -0,0 +1,198 @@
+# src/processors/file_manifest.py
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from processors.extraction_cache import file_hash
+
+
+@dataclass
+class ManifestDiff:
+    """Files added, changed (different content) and removed since a previous manifest, relative to its root"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def with_suffix(self, suffix: str) -> "ManifestDiff":
+        """Only the files ending in suffix (e.g. '.pdf')"""
+        def keep(paths: List[str]) -> List[str]:
+            return [path for path in paths if Path(path).suffix == suffix]
+        return ManifestDiff(keep(self.added), keep(self.changed), keep(self.removed))
+
+
+class FileManifest:
+    """Every file under the raw data folder, found in one walk, with its size, mtime and content hash"""
+
+    def __init__(self, root: str, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            root: Raw data folder (file paths are built from it as given, relative or absolute)
+            entries: size, mtime_ns and sha256 per file path relative to root
+        """
+        self.root = Path(root)
+        self.entries = entries or {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def discover(cls, root: str, previous: Optional["FileManifest"] = None) -> "FileManifest":
+        """
+        Walk root once and record every file
+
+        Files whose size and mtime match the previous manifest keep its hash
+        without being read; the rest are hashed.
+        """
+        manifest = cls(root)
+        previous_entries = previous.entries if previous is not None else {}
+        hashed = 0
+
+        for dir_path, dir_names, file_names in os.walk(manifest.root):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = Path(dir_path) / file_name
+                relative_path = file_path.relative_to(manifest.root).as_posix()
+                stat = file_path.stat()
+                entry = previous_entries.get(relative_path)
+                if entry is None or (entry['size'], entry['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+                    entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': file_hash(file_path)}
+                    hashed += 1
+                manifest.entries[relative_path] = dict(entry)
+
+        print(f"🔍 Found {len(manifest)} files in {manifest.root} (hashed {hashed} new or modified)")
+        return manifest
+
+    def files(self, suffix: str, under: str = "", recursive: bool = True) -> List[Path]:
+        """
+        Paths of the files ending in suffix (e.g. '.md'), sorted
+
+        Args:
+            suffix: File extension, matched case-sensitively like rglob("*.md")
+            under: Only files in this folder, relative to root ("" is root itself)
+            recursive: False keeps only files directly in under
+        """
+        folder = Path(under)
+        selected = []
+        for relative_path in self.entries:
+            path = Path(relative_path)
+            if path.suffix != suffix:
+                continue
+            if path.parent != folder and (not recursive or folder not in path.parents):
+                continue
+            selected.append(self.root / path)
+        return sorted(selected)
+
+    def diff(self, previous: Optional["FileManifest"]) -> ManifestDiff:
+        """Compare with a previous manifest (None treats every file as added)"""
+        previous_entries = previous.entries if previous is not None else {}
+        diff = ManifestDiff()
+        for relative_path, entry in sorted(self.entries.items()):
+            old = previous_entries.get(relative_path)
+            if old is None:
+                diff.added.append(relative_path)
+            elif old['sha256'] != entry['sha256']:
+                diff.changed.append(relative_path)
+        diff.removed = sorted(path for path in previous_entries if path not in self.entries)
+        return diff
+
+    @classmethod
+    def load(cls, manifest_file: str, root: str) -> Optional["FileManifest"]:
+        """Manifest saved by save() for the same root, or None if there is none (or it is unreadable)"""
+        manifest_file = Path(manifest_file)
+        if not manifest_file.exists():
+            return None
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data['root'] != str(Path(root).resolve()):
+                raise ValueError(f"manifest is for {data['root']}")
+            return cls(root, data['entries'])
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Ignoring file manifest {manifest_file}: {e}")
+            return None
+
+    def save(self, manifest_file: str):
+        """Write the manifest atomically"""
+        manifest_file = Path(manifest_file)
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = manifest_file.with_name(f"{manifest_file.name}.tmp-{os.getpid()}")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'root': str(self.root.resolve()), 'entries': self.entries}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, manifest_file)
+        print(f"💾 Saved manifest of {len(self)} files to {manifest_file}")
+
+
+def discover_raw_files(raw_dir: str, manifest_file: str, save: bool = True) -> Tuple[FileManifest, ManifestDiff]:
+    """
+    Walk the raw data folder and compare it with the manifest saved by the last run
+
+    Args:
+        raw_dir: Raw data folder (data/raw)
+        manifest_file: Where the manifest is kept between runs
+        save: Replace the saved manifest with this walk's
+
+    Returns:
+        (manifest, diff against the saved manifest)
+    """
+    previous = FileManifest.load(manifest_file, raw_dir)
+    manifest = FileManifest.discover(raw_dir, previous)
+    diff = manifest.diff(previous)
+    if save:
+        manifest.save(manifest_file)
+    return manifest, diff
+
+
+def typed_files(manifest: FileManifest, export_dir: str = "notion_export") -> Dict[str, List[Path]]:
+    """
+    The files each processor reads, picked from one manifest
+
+    Same selection the processors make when they search themselves: markdown
+    and CSV anywhere in the Notion export, PDFs anywhere in the export plus
+    directly in the raw folder (like mingresume.pdf).
+
+    Returns:
+        {'markdown': [...], 'pdf': [...], 'csv': [...]}
+    """
+    return {
+        'markdown': manifest.files('.md', export_dir),
+        'pdf': sorted(manifest.files('.pdf', export_dir) + manifest.files('.pdf', recursive=False)),
+        'csv': manifest.files('.csv', export_dir)
+    }
+
+
+def print_diff(diff: ManifestDiff):
+    """Print the files a diff lists"""
+    if not diff:
+        print("✅ No files added, changed or removed")
+        return
+    for label, paths in (("Added", diff.added), ("Changed", diff.changed), ("Removed", diff.removed)):
+        if paths:
+            print(f"{label} ({len(paths)}):")
+            for path in paths:
+                print(f"  - {path}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    project_root = Path(__file__).parent.parent.parent
+
+    parser = argparse.ArgumentParser(description="Find raw data files and what changed since the last run")
+    parser.add_argument("--raw-dir", default=str(project_root / "data" / "raw"))
+    parser.add_argument("--manifest", default=str(project_root / "data" / "processed" / "cache" / "raw_manifest.json"))
+    parser.add_argument("--dry-run", action="store_true", help="Show the diff without saving the new manifest")
+    args = parser.parse_args()
+
+    manifest, diff = discover_raw_files(args.raw_dir, args.manifest, save=not args.dry_run)
+    for file_type, files in typed_files(manifest).items():
+        print(f"  {file_type}: {len(files)} files")
+    print_diff(diff)
@@ -1,26 +1,58 @@
 # src/processors/markdown_processor.py
 
 import os
-import re
 import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import markdown
 from markdown.extensions import codehilite, tables, toc
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from processors.extraction_cache import ExtractionCache
+from processors.text_normalization import (
+    normalize_markdown, html_to_text, markdown_to_text, MARKDOWN_HEADER, MARKDOWN_TITLE, FILE_LINK,
+    NOTION_ID_SUFFIX, BARE_NOTION_ID_SUFFIX, WHITESPACE
+)
+
+# Bump when process_single_file() output changes, so cached results are discarded
+PROCESSOR_VERSION = "2"
 
 class MarkdownProcessor:
     """Process markdown files from Notion export"""
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, cache_dir: Optional[str] = None, fast_plain_text: bool = False):
+        """
+        Args:
+            base_path: Notion export folder
+            cache_dir: Directory for the extraction cache (None parses every file every run)
+            fast_plain_text: Take plain_text straight from the markdown instead of rendering HTML
+                             and stripping its tags (see verify_plain_text())
+        """
         self.base_path = Path(base_path)
+        self.fast_plain_text = fast_plain_text
         self.processed_content = []
-
-    def process_all_markdown(self) -> List[Dict[str, Any]]:
-        """Process all markdown files in the export"""
-        print("🔍 Finding markdown files...")
-
-        # Find all .md files recursively
-        md_files = list(self.base_path.rglob("*.md"))
+        self.cache = None
+        if cache_dir:
+            # One cache per plain text mode, so switching modes does not discard the other's results
+            cache_name = "markdown_extraction_fast.json" if fast_plain_text else "markdown_extraction.json"
+            self.cache = ExtractionCache(str(Path(cache_dir) / cache_name), PROCESSOR_VERSION,
+                                         str(self.base_path.resolve()))
+        self.cache_stats = {'reused': 0, 'parsed': 0}
+
+    def process_all_markdown(self, md_files: Optional[List[Path]] = None) -> List[Dict[str, Any]]:
+        """
+        Process all markdown files in the export
+
+        Args:
+            md_files: Markdown files already found (e.g. by FileManifest); None searches base_path
+        """
+        if md_files is None:
+            print("🔍 Finding markdown files...")
+
+            # Find all .md files recursively
+            md_files = list(self.base_path.rglob("*.md"))
         print(f"Found {len(md_files)} markdown files")
 
         for md_file in md_files:
@@ -32,10 +64,30 @@ class MarkdownProcessor:
             except Exception as e:
                 print(f"❌ Error processing {md_file.name}: {e}")
 
+        if self.cache is not None:
+            self.cache.retain(md_files)
+            self.cache.save()
+            print(f"♻️  Reused {self.cache_stats['reused']} cached files, parsed {self.cache_stats['parsed']} new or changed")
+
         return self.processed_content
 
     def process_single_file(self, file_path: Path) -> Dict[str, Any]:
-        """Process a single markdown file"""
+        """Process a single markdown file (reusing the cached result if the file is unchanged)"""
+        if self.cache is not None:
+            hit, content = self.cache.lookup(file_path)
+            if hit:
+                self.cache_stats['reused'] += 1
+                content['metadata']['last_modified'] = file_path.stat().st_mtime
+                return content
+
+        content = self._parse_file(file_path)
+        self.cache_stats['parsed'] += 1
+        if self.cache is not None:
+            self.cache.store(file_path, content)
+        return content
+
+    def _parse_file(self, file_path: Path) -> Dict[str, Any]:
+        """Parse a markdown file into content, sections and metadata"""
         with open(file_path, 'r', encoding='utf-8') as f:
             raw_content = f.read()
 
@@ -45,14 +97,8 @@ class MarkdownProcessor:
         # Clean and process content
         cleaned_content = self._clean_content(raw_content)
 
-        # Convert markdown to structured text
-        html_content = markdown.markdown(
-            cleaned_content,
-            extensions=['tables', 'toc', 'codehilite']
-        )
-
-        # Extract plain text (removing HTML tags)
-        plain_text = self._html_to_text(html_content)
+        # Extract plain text
+        plain_text = self._plain_text(cleaned_content)
 
         # Extract sections
         sections = self._extract_sections(cleaned_content)
@@ -72,6 +118,42 @@ class MarkdownProcessor:
             'referenced_files': self._extract_file_references(raw_content)
         }
 
+    def _plain_text(self, cleaned_content: str) -> str:
+        """Plain text of cleaned markdown (rendered to HTML and stripped, unless fast_plain_text)"""
+        if self.fast_plain_text:
+            return markdown_to_text(cleaned_content)
+
+        # Convert markdown to structured text
+        html_content = markdown.markdown(
+            cleaned_content,
+            extensions=['tables', 'toc', 'codehilite']
+        )
+
+        # Extract plain text (removing HTML tags)
+        return self._html_to_text(html_content)
+
+    def verify_plain_text(self) -> List[str]:
+        """
+        Check fast plain text extraction against HTML rendering for every markdown file
+
+        Returns:
+            Files whose plain_text or word_count differ between the two
+        """
+        mismatched = []
+        md_files = sorted(self.base_path.rglob("*.md"))
+        for md_file in md_files:
+            with open(md_file, 'r', encoding='utf-8') as f:
+                cleaned_content = self._clean_content(f.read())
+            rendered = self._html_to_text(markdown.markdown(cleaned_content, extensions=['tables', 'toc', 'codehilite']))
+            fast = markdown_to_text(cleaned_content)
+            if fast != rendered:
+                mismatched.append(str(md_file))
+                words = "same" if len(fast.split()) == len(rendered.split()) else "different"
+                print(f"⚠️  Plain text differs for {md_file.name} ({words} word count)")
+
+        print(f"🔎 Fast plain text matches HTML rendering for {len(md_files) - len(mismatched)}/{len(md_files)} files")
+        return mismatched
+
     def _extract_metadata(self, file_path: Path, content: str) -> Dict[str, Any]:
         """Extract metadata from file path and content"""
         file_name = file_path.stem
@@ -91,7 +173,7 @@ class MarkdownProcessor:
             title = self._clean_title(file_name)
 
         # Try to extract title from content (first header)
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = MARKDOWN_TITLE.search(content)
         if title_match:
             title = title_match.group(1).strip()
 
@@ -105,18 +187,7 @@ class MarkdownProcessor:
 
     def _clean_content(self, content: str) -> str:
         """Clean markdown content"""
-        # Remove Notion-specific artifacts
-        content = re.sub(r'%20', ' ', content)  # URL encoding
-        content = re.sub(r'%E2%80%99', "'", content)  # Smart quotes
-
-        # Clean up file references but keep meaningful ones
-        content = re.sub(r'\[([^\]]+)\]\([^)]+\.(png|jpg|jpeg|gif|mp4|mov)\)', r'[Image: \1]', content)
-
-        # Normalize whitespace
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)  # Multiple newlines
-        content = re.sub(r'[ \t]+', ' ', content)  # Multiple spaces
-
-        return content.strip()
+        return normalize_markdown(content)
 
     def _extract_sections(self, content: str) -> List[Dict[str, str]]:
         """Extract sections based on headers"""
@@ -127,7 +198,7 @@ class MarkdownProcessor:
 
         for line in lines:
             # Check if line is a header
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            header_match = MARKDOWN_HEADER.match(line)
             if header_match:
                 # Save previous section if it has content
                 if current_section['content'].strip():
@@ -152,37 +223,31 @@ class MarkdownProcessor:
 
     def _html_to_text(self, html_content: str) -> str:
         """Convert HTML to plain text"""
-        # Simple HTML tag removal
-        text = re.sub(r'<[^>]+>', '', html_content)
-        # Decode HTML entities
-        text = text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return html_to_text(html_content)
 
     def _extract_file_references(self, content: str) -> List[str]:
         """Extract referenced files (PDFs, images, etc.)"""
         # Find file references in markdown links
-        file_refs = re.findall(r'\[([^\]]+)\]\(([^)]+\.(pdf|png|jpg|jpeg|gif|mp4|mov))\)', content)
+        file_refs = FILE_LINK.findall(content)
         return [{'name': ref[0], 'path': ref[1], 'type': ref[2]} for ref in file_refs]
 
     def _clean_project_title(self, file_name: str) -> str:
         """Clean project titles from Notion export format"""
         # Remove Notion ID hash
-        title = re.sub(r'\s+[a-f0-9]{32}$', '', file_name)
-        title = re.sub(r'[a-f0-9]{32}$', '', title)
+        title = NOTION_ID_SUFFIX.sub('', file_name)
+        title = BARE_NOTION_ID_SUFFIX.sub('', title)
 
         # Clean up common patterns
         title = title.replace('_', ' ')
-        title = re.sub(r'\s+', ' ', title)
+        title = WHITESPACE.sub(' ', title)
 
         return title.strip()
 
     def _clean_title(self, title: str) -> str:
         """General title cleaning"""
         title = title.replace('_', ' ')
-        title = re.sub(r'\s+[a-f0-9]{32}$', '', title)  # Remove Notion IDs
-        title = re.sub(r'\s+', ' ', title)
+        title = NOTION_ID_SUFFIX.sub('', title)  # Remove Notion IDs
+        title = WHITESPACE.sub(' ', title)
         return title.strip()
 
     def _generate_id(self, file_path: Path) -> str:
@@ -204,8 +269,21 @@ class MarkdownProcessor:
 
 # Example usage
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Process the Notion markdown export")
+    parser.add_argument("--fast-plain-text", action="store_true",
+                        help="Extract plain_text without rendering HTML")
+    parser.add_argument("--verify-plain-text", action="store_true",
+                        help="Only compare fast plain text with HTML rendering for every file")
+    args = parser.parse_args()
+
     # Initialize processor
-    processor = MarkdownProcessor("data/raw/notion_export")
+    processor = MarkdownProcessor("data/raw/notion_export", cache_dir="data/processed/cache",
+                                  fast_plain_text=args.fast_plain_text)
+
+    if args.verify_plain_text:
+        sys.exit(1 if processor.verify_plain_text() else 0)
 
     # Process all markdown files
     processed_content = processor.process_all_markdown()
@@ -2,57 +2,436 @@
 
 import os
 import json
+import multiprocessing
+import multiprocessing.connection
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Set, TextIO, Callable
 import PyPDF2
 import pdfplumber
-import re
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from processors.extraction_cache import ExtractionCache
+from processors.text_normalization import normalize_pdf_text, is_section_header, WHITESPACE
+
+# Bump when process_single_pdf() output changes, so cached results are discarded
+PROCESSOR_VERSION = "1"
+
+# Extraction task: (extractor, file path, first page, end page or None)
+ExtractionTask = Tuple[str, str, int, Optional[int]]
+
+# Categories inferred from PDF text when the file name gives no hint (first match wins)
+CONTENT_CATEGORY_KEYWORDS = [
+    ('resume', ['experience', 'education', 'skills', 'objective']),
+    ('academic_paper', ['abstract', 'introduction', 'methodology', 'conclusion']),
+    ('meeting_document', ['agenda', 'meeting', 'minutes'])
+]
+
+
+class ExtractionTimeout(Exception):
+    """A PDF (or page range) took longer than the per-file timeout to extract"""
+
+
+@contextmanager
+def _time_limit(seconds: float) -> Iterator[None]:
+    """
+    Raise ExtractionTimeout in the block after `seconds` (POSIX main thread only; no-op elsewhere)
+
+    Only for extraction in this process: the signal is not delivered while
+    native code runs, so worker tasks are timed out by _run_in_processes().
+    """
+    if not seconds or not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise ExtractionTimeout(f"timed out after {seconds:.0f}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _count_pages(file_path: str) -> int:
+    """Page count for splitting a PDF into page ranges (0 if unreadable)"""
+    try:
+        with open(file_path, 'rb') as file:
+            return len(PyPDF2.PdfReader(file).pages)
+    except Exception:
+        return 0
+
+
+def _extract_task(task: ExtractionTask) -> str:
+    """Worker task: run one extractor over a page range"""
+    extractor, file_path, start, end = task
+    extract = PDFProcessor._extract_with_pdfplumber if extractor == 'pdfplumber' else PDFProcessor._extract_with_pypdf2
+    return extract(Path(file_path), start, end)
+
+
+def _task_process(conn: multiprocessing.connection.Connection, func: Callable[[Any], Any], arg: Any):
+    """Worker process body: send func(arg) back to the parent"""
+    try:
+        conn.send(func(arg))
+    finally:
+        conn.close()
+
+
+def _run_in_processes(func: Callable[[Any], Any], args: List[Any], workers: int,
+                      timeout: float) -> List[Tuple[str, Any]]:
+    """
+    Run func(arg) for every arg in its own process, at most `workers` at a time
+
+    The parent enforces the timeout: a task still running `timeout` seconds
+    (0 = no limit) after it started is killed, even inside native code, and a
+    worker that dies (segfault, OOM kill) is noticed as soon as it exits.
+
+    Returns:
+        Per arg, in order: ('ok', result), ('timeout', None) or ('crashed', None)
+    """
+    results: List[Optional[Tuple[str, Any]]] = [None] * len(args)
+    queued = list(range(len(args)))[::-1]
+    running: Dict[multiprocessing.connection.Connection, Tuple[int, multiprocessing.Process, Optional[float]]] = {}
+
+    def finish(conn: multiprocessing.connection.Connection, result: Tuple[str, Any]):
+        i, process, _ = running.pop(conn)
+        conn.close()
+        if result[0] == 'timeout':
+            process.kill()
+        process.join()
+        results[i] = result
+
+    try:
+        while queued or running:
+            while queued and len(running) < workers:
+                i = queued.pop()
+                conn, child_conn = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=_task_process, args=(child_conn, func, args[i]), daemon=True)
+                process.start()
+                child_conn.close()
+                running[conn] = (i, process, time.monotonic() + timeout if timeout else None)
+
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            wait_s = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = set(multiprocessing.connection.wait(
+                list(running) + [process.sentinel for _, process, _ in running.values()], wait_s
+            ))
+
+            now = time.monotonic()
+            for conn, (i, process, deadline) in list(running.items()):
+                if conn in ready or process.sentinel in ready:
+                    try:
+                        finish(conn, ('ok', conn.recv()))
+                    except (EOFError, OSError):
+                        finish(conn, ('crashed', None))  # Exited without sending a result
+                elif deadline is not None and now >= deadline:
+                    finish(conn, ('timeout', None))
+    finally:
+        for conn, (_, process, _) in running.items():
+            process.kill()
+            process.join()
+            conn.close()
+
+    return results
+
+
+def _page_chunk(page_num: int, page_text: str) -> str:
+    """A page's text as it appears in raw_content"""
+    return f"\n--- Page {page_num} ---\n{page_text}\n"
+
+
+def _json_string_body(text: str) -> str:
+    """text escaped as the inside of a JSON string, so a long string can be written in pieces"""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def _content_keywords(text: str) -> Set[str]:
+    """CONTENT_CATEGORY_KEYWORDS that occur in text"""
+    text_lower = text.lower()
+    return {keyword for _, keywords in CONTENT_CATEGORY_KEYWORDS for keyword in keywords if keyword in text_lower}
+
+
+class _PageSpool:
+    """
+    One PDF's record built a page at a time
+
+    raw_content, cleaned_content and sections go to temporary files as JSON as
+    each page is cleaned and sectioned, so only the current page is held in
+    memory; the rest is small running state for the title, category and counts.
+    """
+
+    def __init__(self, processor: "PDFProcessor"):
+        self.processor = processor
+        self.raw = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.cleaned = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.sections = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+        self.text_length = 0  # len(raw_content.strip())
+        self._trailing_space = 0
+        self.page_breaks = 0
+        self.word_count = 0
+        self.first_lines: List[str] = []
+        self.keywords: Set[str] = set()
+        self._n_lines = 0
+        self._n_sections = 0
+        self._prev_line = ""
+        self._page_lines: List[str] = []  # Cleaned lines since the last page break
+
+    def close(self):
+        for spool in (self.raw, self.cleaned, self.sections):
+            spool.close()
+
+    def add_page(self, page_num: int, page_text: str):
+        """Clean and section one page (same result as _clean_content()/_extract_sections() on the whole text)"""
+        chunk = _page_chunk(page_num, page_text)
+        self.raw.write(_json_string_body(chunk))
+        self._count_stripped(chunk)
+
+        lines = self.processor._normalize_text(chunk).split('\n')
+        kept, self._prev_line = self.processor._filter_lines(lines, self._prev_line)
+        for line in kept:
+            self._add_line(line)
+
+    def finish(self):
+        """Section the last page"""
+        self._flush_page()
+        self._page_lines = []
+
+    def _count_stripped(self, chunk: str):
+        """Track the stripped length of raw_content (the 'minimal text' check) without keeping it"""
+        if not self.text_length:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+        trailing = len(chunk) - len(chunk.rstrip())
+        if trailing == len(chunk):
+            self._trailing_space += trailing
+            return
+        self.text_length += self._trailing_space + len(chunk) - trailing
+        self._trailing_space = trailing
+
+    def _add_line(self, line: str):
+        self.cleaned.write(_json_string_body(line if not self._n_lines else "\n" + line))
+        self._n_lines += 1
+        self.word_count += len(line.split())
+        if len(self.first_lines) < 10:
+            self.first_lines.append(line)
+        self.keywords |= _content_keywords(line)
+
+        # Page text between [PAGE BREAK] markers, as content.split('[PAGE BREAK]') would give it
+        parts = line.split('[PAGE BREAK]')
+        self._page_lines.append(parts[0])
+        for part in parts[1:]:
+            self._flush_page()
+            self.page_breaks += 1
+            self._page_lines = [part]
+
+    def _flush_page(self):
+        page_content = '\n'.join(self._page_lines)
+        for section in self.processor._page_sections(page_content, self.page_breaks + 1):
+            self.sections.write(("" if not self._n_sections else ", ") + json.dumps(section, ensure_ascii=False))
+            self._n_sections += 1
+
 
 class PDFProcessor:
     """Process PDF files from portfolio"""
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, workers: int = 1, file_timeout: float = 120.0, pages_per_task: int = 20,
+                 cache_dir: Optional[str] = None):
+        """
+        Args:
+            base_path: Notion export (or raw data) folder to search for PDFs
+            workers: Extraction processes (1 extracts in this process)
+            file_timeout: Seconds one extraction task (a file or page range) may take (0 = no limit)
+            pages_per_task: Larger PDFs are split into page ranges of this size across workers
+            cache_dir: Directory for the extraction cache (None parses every file every run)
+        """
         self.base_path = Path(base_path)
+        self.workers = max(1, workers)
+        self.file_timeout = file_timeout
+        self.pages_per_task = max(1, pages_per_task)
         self.processed_content = []
+        self.cache = None
+        if cache_dir:
+            self.cache = ExtractionCache(
+                str(Path(cache_dir) / "pdf_extraction.json"), PROCESSOR_VERSION, str(self.base_path.resolve())
+            )
+        self.cache_stats = {'reused': 0, 'parsed': 0}
+
+    def process_all_pdfs(self, pdf_files: Optional[List[Path]] = None) -> List[Dict[str, Any]]:
+        """
+        Process all PDF files in the export and raw data folder
+
+        Args:
+            pdf_files: PDFs already found (e.g. by FileManifest); None searches base_path
+        """
+        all_pdf_files = self._find_pdf_files(pdf_files)
+
+        # Unchanged files come from the cache without being opened
+        cached = {}
+        if self.cache is not None:
+            for pdf_file in all_pdf_files:
+                hit, content = self.cache.lookup(pdf_file)
+                if hit:
+                    cached[pdf_file] = self._refresh_cached(pdf_file, content)
+        pending = [pdf_file for pdf_file in all_pdf_files if pdf_file not in cached]
+
+        # Extract text in worker processes; cleaning and sectioning stay here, in file order
+        extracted = self._extract_parallel(pending) if self.workers > 1 and pending else {}
 
-    def process_all_pdfs(self) -> List[Dict[str, Any]]:
-        """Process all PDF files in the export and raw data folder"""
-        print("🔍 Finding PDF files...")
+        for pdf_file in all_pdf_files:
+            if pdf_file in extracted and extracted[pdf_file] is None:
+                print(f"⏱️  Could not extract {pdf_file.name} (timed out after {self.file_timeout:.0f}s "
+                      f"or crashed), skipping")
+                continue
+            try:
+                if pdf_file in cached:
+                    content = cached[pdf_file]
+                else:
+                    content = self._process_and_cache(pdf_file, extracted.get(pdf_file))
+                if content:
+                    self.processed_content.append(content)
+                    print(f"✅ Processed: {pdf_file.name}")
+            except Exception as e:
+                print(f"❌ Error processing {pdf_file.name}: {e}")
 
-        # Find PDFs in the notion export folder
-        notion_pdf_files = list(self.base_path.rglob("*.pdf"))
+        if self.cache is not None:
+            self.cache.retain(all_pdf_files)
+            self.cache.save()
+            print(f"♻️  Reused {self.cache_stats['reused']} cached files, parsed {self.cache_stats['parsed']} new or changed")
 
-        # Also look for PDFs in the parent raw folder (like mingresume.pdf)
+        return self.processed_content
+
+    def _find_pdf_files(self, pdf_files: Optional[List[Path]] = None) -> List[Path]:
+        """PDFs in the export folder and the raw data folder (or pdf_files, if given), sorted"""
         raw_folder = self.base_path.parent if self.base_path.name == "notion_export" else self.base_path
-        raw_pdf_files = list(raw_folder.glob("*.pdf"))
 
-        # Combine and deduplicate
-        all_pdf_files = list(set(notion_pdf_files + raw_pdf_files))
+        if pdf_files is not None:
+            all_pdf_files = sorted(pdf_files)
+        else:
+            print("🔍 Finding PDF files...")
+
+            # Find PDFs in the notion export folder
+            notion_pdf_files = list(self.base_path.rglob("*.pdf"))
+
+            # Also look for PDFs in the parent raw folder (like mingresume.pdf)
+            raw_pdf_files = list(raw_folder.glob("*.pdf"))
+
+            # Combine and deduplicate (sorted so output order does not depend on the filesystem)
+            all_pdf_files = sorted(set(notion_pdf_files + raw_pdf_files))
 
         print(f"Found {len(all_pdf_files)} PDF files:")
         for pdf_file in all_pdf_files:
             relative_path = pdf_file.relative_to(raw_folder.parent) if raw_folder.parent in pdf_file.parents else pdf_file.name
             print(f"  - {relative_path}")
 
-        for pdf_file in all_pdf_files:
-            try:
-                content = self.process_single_pdf(pdf_file)
-                if content:
-                    self.processed_content.append(content)
-                    print(f"✅ Processed: {pdf_file.name}")
-            except Exception as e:
-                print(f"❌ Error processing {pdf_file.name}: {e}")
+        return all_pdf_files
 
-        return self.processed_content
+    def _extract_parallel(self, pdf_files: List[Path]) -> Dict[Path, Optional[str]]:
+        """
+        Extract text from many PDFs in worker processes
+
+        Returns:
+            Extracted text per file (None if extraction timed out or crashed its worker)
+        """
+        workers = min(self.workers, max(len(pdf_files), 1))
+        page_counts = [
+            n_pages if status == 'ok' else 0
+            for status, n_pages in _run_in_processes(_count_pages, [str(pdf_file) for pdf_file in pdf_files],
+                                                     workers, self.file_timeout)
+        ]
 
-    def process_single_pdf(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Process a single PDF file"""
-        # Try pdfplumber first (better for complex layouts)
-        text_content = self._extract_with_pdfplumber(file_path)
+        # Try pdfplumber first (better for complex layouts), one task per page range
+        tasks, owners = [], []
+        for pdf_file, n_pages in zip(pdf_files, page_counts):
+            for start, end in self._page_ranges(n_pages):
+                tasks.append(('pdfplumber', str(pdf_file), start, end))
+                owners.append(pdf_file)
+        texts = self._run_tasks(tasks, owners, workers)
+
+        # Fallback to PyPDF2 where pdfplumber failed
+        retry = [pdf_file for pdf_file, text in texts.items() if text is not None and len(text.strip()) < 50]
+        if retry:
+            tasks = [('pypdf2', str(pdf_file), 0, None) for pdf_file in retry]
+            texts.update(self._run_tasks(tasks, retry, workers))
+
+        return texts
+
+    def _page_ranges(self, n_pages: int) -> List[Tuple[int, Optional[int]]]:
+        """Split a PDF's pages into [start, end) ranges of at most pages_per_task"""
+        if n_pages <= self.pages_per_task:
+            return [(0, None)]  # Whole file (also when the page count is unknown)
+        return [(start, min(start + self.pages_per_task, n_pages)) for start in range(0, n_pages, self.pages_per_task)]
+
+    def _run_tasks(self, tasks: List[ExtractionTask], owners: List[Path], workers: int) -> Dict[Path, Optional[str]]:
+        """Run extraction tasks and join each file's page ranges in page order"""
+        texts: Dict[Path, Optional[str]] = {}
+        for owner, task, (status, text) in zip(owners, tasks, _run_in_processes(_extract_task, tasks, workers,
+                                                                                 self.file_timeout)):
+            if status == 'crashed':
+                print(f"💥 Extraction worker crashed on {owner.name} ({task[0]})")
+            if status != 'ok' or (owner in texts and texts[owner] is None):
+                texts[owner] = None
+            else:
+                texts[owner] = texts.get(owner, "") + text
+        return texts
+
+    def _extract_text(self, file_path: Path) -> str:
+        """Extract text in this process (pdfplumber, then PyPDF2 as fallback)"""
+        with _time_limit(self.file_timeout):
+            # Try pdfplumber first (better for complex layouts)
+            text_content = self._extract_with_pdfplumber(file_path)
 
         # Fallback to PyPDF2 if pdfplumber fails
         if not text_content or len(text_content.strip()) < 50:
-            text_content = self._extract_with_pypdf2(file_path)
+            with _time_limit(self.file_timeout):
+                text_content = self._extract_with_pypdf2(file_path)
+
+        return text_content
+
+    def process_single_pdf(self, file_path: Path, text_content: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Process a single PDF file (reusing the cached result if the file is unchanged)
+
+        Args:
+            file_path: PDF to process
+            text_content: Text already extracted (e.g. by a worker process); extracted here if None
+        """
+        if self.cache is not None and text_content is None:
+            hit, content = self.cache.lookup(file_path)
+            if hit:
+                return self._refresh_cached(file_path, content)
+        return self._process_and_cache(file_path, text_content)
+
+    def _refresh_cached(self, file_path: Path, content: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Count a cache hit; a touched but unchanged file keeps its new modification time"""
+        self.cache_stats['reused'] += 1
+        if content:
+            content['metadata']['last_modified'] = file_path.stat().st_mtime
+        return content
+
+    def _process_and_cache(self, file_path: Path, text_content: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Parse a PDF and cache the result (including 'no usable text', so scans are not re-parsed)"""
+        content = self._parse_pdf(file_path, text_content)
+        self.cache_stats['parsed'] += 1
+        if self.cache is not None:
+            self.cache.store(file_path, content)
+        return content
+
+    def _parse_pdf(self, file_path: Path, text_content: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Extract (unless already done), clean and section a PDF"""
+        if text_content is None:
+            text_content = self._extract_text(file_path)
 
         # Skip if no meaningful content extracted
         if not text_content or len(text_content.strip()) < 50:
@@ -82,56 +461,86 @@ class PDFProcessor:
             'page_count': metadata.get('page_count', 0)
         }
 
-    def _extract_with_pdfplumber(self, file_path: Path) -> str:
-        """Extract text using pdfplumber (better for tables/complex layouts)"""
-        try:
-            text_content = ""
+    @staticmethod
+    def _iter_pages(file_path: Path, extractor: str = 'pdfplumber', start: int = 0,
+                    end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page number, text) for pages [start, end) that have text, one page at a time
+
+        Args:
+            file_path: PDF to read
+            extractor: 'pdfplumber' (better for tables/complex layouts) or 'pypdf2'
+            start: First page (0-based)
+            end: End page (exclusive; None for the last page)
+        """
+        if extractor == 'pdfplumber':
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
+                for page_num, page in enumerate(pdf.pages[start:end], start + 1):
+                    page_text = page.extract_text()
+                    # pdfplumber keeps every parsed page's layout objects otherwise
+                    page.flush_cache()
+                    if page_text:
+                        yield page_num, page_text
+        else:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                for page_num, page in enumerate(pdf_reader.pages[start:end], start + 1):
                     page_text = page.extract_text()
                     if page_text:
-                        text_content += f"\n--- Page {page_num} ---\n"
-                        text_content += page_text + "\n"
+                        yield page_num, page_text
 
-            return text_content
+    @staticmethod
+    def _extract_with_pdfplumber(file_path: Path, start: int = 0, end: Optional[int] = None) -> str:
+        """Extract text of pages [start, end) using pdfplumber (better for tables/complex layouts)"""
+        try:
+            return "".join(
+                _page_chunk(page_num, page_text)
+                for page_num, page_text in PDFProcessor._iter_pages(file_path, 'pdfplumber', start, end)
+            )
+        except ExtractionTimeout:
+            raise
         except Exception as e:
             print(f"pdfplumber failed for {file_path.name}: {e}")
             return ""
 
-    def _extract_with_pypdf2(self, file_path: Path) -> str:
-        """Extract text using PyPDF2 (fallback method)"""
+    @staticmethod
+    def _extract_with_pypdf2(file_path: Path, start: int = 0, end: Optional[int] = None) -> str:
+        """Extract text of pages [start, end) using PyPDF2 (fallback method)"""
         try:
-            text_content = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += f"\n--- Page {page_num} ---\n"
-                        text_content += page_text + "\n"
-
-            return text_content
+            return "".join(
+                _page_chunk(page_num, page_text)
+                for page_num, page_text in PDFProcessor._iter_pages(file_path, 'pypdf2', start, end)
+            )
+        except ExtractionTimeout:
+            raise
         except Exception as e:
             print(f"PyPDF2 failed for {file_path.name}: {e}")
             return ""
 
     def _clean_content(self, content: str) -> str:
         """Clean extracted PDF content"""
-        # Remove excessive whitespace and formatting artifacts
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)  # Multiple newlines
-        content = re.sub(r'[ \t]+', ' ', content)  # Multiple spaces/tabs
+        cleaned_lines, _ = self._filter_lines(self._normalize_text(content).split('\n'))
+        return '\n'.join(cleaned_lines).strip()
+
+    @staticmethod
+    def _normalize_text(content: str) -> str:
+        """Whitespace, page marker and spacing fixes (line by line, so pages can be done separately)"""
+        return normalize_pdf_text(content)
 
-        # Remove common PDF artifacts
-        content = re.sub(r'---\s*Page\s+\d+\s*---', '\n[PAGE BREAK]\n', content)
+    @staticmethod
+    def _filter_lines(lines: List[str], prev_line: str = "") -> Tuple[List[str], str]:
+        """
+        Strip lines and drop short or repeated ones
 
-        # Fix common OCR/extraction issues
-        content = re.sub(r'([a-z])([A-Z])', r'\1 \2', content)  # Missing spaces
-        content = re.sub(r'(\d+)([A-Za-z])', r'\1 \2', content)  # Number-letter joins
+        Args:
+            lines: Normalized lines
+            prev_line: Last line before these (to continue from the previous page)
 
+        Returns:
+            (kept lines, last line seen)
+        """
         # Remove header/footer repetitions (simple heuristic)
-        lines = content.split('\n')
         cleaned_lines = []
-        prev_line = ""
 
         for line in lines:
             line = line.strip()
@@ -140,19 +549,25 @@ class PDFProcessor:
                 cleaned_lines.append(line)
             prev_line = line
 
-        return '\n'.join(cleaned_lines).strip()
+        return cleaned_lines, prev_line
 
     def _extract_metadata(self, file_path: Path, content: str) -> Dict[str, Any]:
         """Extract metadata from PDF file and content"""
         file_name = file_path.stem
 
         # Categorize based on filename patterns
-        category = self._categorize_pdf(file_name, content)
+        category = self._categorize_pdf(file_name, _content_keywords(content))
         title = self._extract_title(file_name, content)
 
         # Try to get page count
         page_count = content.count('[PAGE BREAK]') + 1 if '[PAGE BREAK]' in content else 1
 
+        return self._file_metadata(file_path, title, category, page_count)
+
+    def _file_metadata(self, file_path: Path, title: str, category: str, page_count: int) -> Dict[str, Any]:
+        """Metadata record for a PDF whose title, category and page count are known"""
+        file_name = file_path.stem
+
         # Extract project association if in project folder
         project_name = None
         if 'Projects' in str(file_path):
@@ -182,10 +597,9 @@ class PDFProcessor:
             'last_modified': file_path.stat().st_mtime if file_path.exists() else None
         }
 
-    def _categorize_pdf(self, file_name: str, content: str) -> str:
-        """Categorize PDF based on filename and content"""
+    def _categorize_pdf(self, file_name: str, content_keywords: Set[str]) -> str:
+        """Categorize PDF based on filename and content (the CONTENT_CATEGORY_KEYWORDS found in it)"""
         file_lower = file_name.lower()
-        content_lower = content.lower()
 
         # Check for resume/CV first (common patterns)
         if any(keyword in file_lower for keyword in ['resume', 'cv', 'ming']):
@@ -200,20 +614,16 @@ class PDFProcessor:
             return 'team_document'
         else:
             # Try to infer from content
-            if any(keyword in content_lower for keyword in ['experience', 'education', 'skills', 'objective']):
-                return 'resume'
-            elif any(keyword in content_lower for keyword in ['abstract', 'introduction', 'methodology', 'conclusion']):
-                return 'academic_paper'
-            elif any(keyword in content_lower for keyword in ['agenda', 'meeting', 'minutes']):
-                return 'meeting_document'
-            else:
-                return 'general_document'
+            for category, keywords in CONTENT_CATEGORY_KEYWORDS:
+                if content_keywords.intersection(keywords):
+                    return category
+            return 'general_document'
 
     def _extract_title(self, file_name: str, content: str) -> str:
         """Extract title from filename or content"""
         # Clean filename as fallback title
         title = file_name.replace('_', ' ').replace('-', ' ')
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = WHITESPACE.sub(' ', title).strip()
 
         # Try to find title in content (first few lines)
         lines = content.split('\n')[:10]  # Check first 10 lines
@@ -237,23 +647,26 @@ class PDFProcessor:
         pages = content.split('[PAGE BREAK]')
 
         for page_num, page_content in enumerate(pages, 1):
-            if not page_content.strip():
-                continue
+            sections.extend(self._page_sections(page_content, page_num))
 
-            # Try to find section headers within each page
-            page_sections = self._find_sections_in_text(page_content)
+        return sections
 
-            if page_sections:
-                sections.extend(page_sections)
-            else:
-                # If no clear sections, treat entire page as one section
-                sections.append({
-                    'title': f'Page {page_num}',
-                    'content': page_content.strip(),
-                    'page_number': page_num
-                })
+    def _page_sections(self, page_content: str, page_num: int) -> List[Dict[str, Any]]:
+        """Sections of one page's cleaned text"""
+        if not page_content.strip():
+            return []
 
-        return sections
+        # Try to find section headers within each page
+        page_sections = self._find_sections_in_text(page_content)
+        if page_sections:
+            return page_sections
+
+        # If no clear sections, treat entire page as one section
+        return [{
+            'title': f'Page {page_num}',
+            'content': page_content.strip(),
+            'page_number': page_num
+        }]
 
     def _find_sections_in_text(self, text: str) -> List[Dict[str, str]]:
         """Find section headers in text"""
@@ -289,29 +702,7 @@ class PDFProcessor:
 
     def _is_section_header(self, line: str) -> bool:
         """Determine if a line is likely a section header"""
-        # Common section header patterns
-        header_patterns = [
-            r'^\d+\.\s+[A-Z]',  # "1. Introduction"
-            r'^[IVX]+\.\s+[A-Z]',  # "I. Introduction"
-            r'^[A-Z][A-Z\s]{2,20}$',  # "INTRODUCTION"
-            r'^[A-Z][a-z]+ [A-Z][a-z]+',  # "Project Overview"
-        ]
-
-        # Check patterns
-        for pattern in header_patterns:
-            if re.match(pattern, line):
-                return True
-
-        # Additional heuristics
-        if (len(line) < 50 and
-            line[0].isupper() and
-            not line.endswith('.') and
-            any(keyword in line.lower() for keyword in
-                ['introduction', 'conclusion', 'methodology', 'results', 'abstract',
-                 'background', 'implementation', 'evaluation', 'discussion'])):
-            return True
-
-        return False
+        return is_section_header(line)
 
     def _generate_id(self, file_path: Path) -> str:
         """Generate unique ID for content"""
@@ -336,10 +727,127 @@ class PDFProcessor:
         print(f"💾 Saved processed PDF content to {output_file}")
         print(f"📊 Processed {len(self.processed_content)} PDF files")
 
+    def stream_processed_content(self, output_path: str, pdf_files: Optional[List[Path]] = None) -> int:
+        """
+        Process all PDFs and write each record to a JSON file as soon as it is ready
+
+        Same output as process_all_pdfs() + save_processed_content(), but records
+        are not kept and each uncached PDF is extracted, cleaned and sectioned a
+        page at a time, so memory stays around one page whatever the document
+        size. Extraction runs in this process (no worker pool), and streamed
+        records are not added to the extraction cache; cached ones are reused.
+
+        Args:
+            output_path: JSON file to write
+            pdf_files: PDFs already found (e.g. by FileManifest); None searches base_path
+
+        Returns:
+            Number of records written
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(f"{output_file.name}.tmp-{os.getpid()}")
+
+        all_pdf_files = self._find_pdf_files(pdf_files)
+        written = 0
+        with open(tmp_file, 'w', encoding='utf-8') as out:
+            out.write("[")
+            for pdf_file in all_pdf_files:
+                separator = "\n  " if not written else ",\n  "
+                try:
+                    hit, content = self.cache.lookup(pdf_file) if self.cache is not None else (False, None)
+                    if hit:
+                        content = self._refresh_cached(pdf_file, content)
+                        if content:
+                            out.write(separator)
+                            json.dump(content, out, ensure_ascii=False)
+                    else:
+                        spool = self._spool_pdf(pdf_file)
+                        content = spool is not None
+                        if spool is not None:
+                            try:
+                                out.write(separator)
+                                self._write_spooled_record(pdf_file, spool, out)
+                            finally:
+                                spool.close()
+                    if content:
+                        written += 1
+                        print(f"✅ Processed: {pdf_file.name}")
+                except ExtractionTimeout:
+                    print(f"⏱️  Timed out extracting {pdf_file.name} (limit {self.file_timeout:.0f}s), skipping")
+                except Exception as e:
+                    print(f"❌ Error processing {pdf_file.name}: {e}")
+            out.write("\n]" if written else "]")
+        os.replace(tmp_file, output_file)
+
+        if self.cache is not None:
+            self.cache.retain(all_pdf_files)
+            self.cache.save()
+
+        print(f"💾 Streamed processed PDF content to {output_file}")
+        print(f"📊 Processed {written} PDF files")
+        return written
+
+    def _spool_pdf(self, file_path: Path) -> Optional[_PageSpool]:
+        """Extract, clean and section a PDF page by page (pdfplumber, then PyPDF2 as fallback)"""
+        for extractor, name in (('pdfplumber', "pdfplumber"), ('pypdf2', "PyPDF2")):
+            spool = _PageSpool(self)
+            try:
+                with _time_limit(self.file_timeout):
+                    for page_num, page_text in self._iter_pages(file_path, extractor):
+                        spool.add_page(page_num, page_text)
+            except ExtractionTimeout:
+                spool.close()
+                raise
+            except Exception as e:
+                print(f"{name} failed for {file_path.name}: {e}")
+                spool.close()
+                spool = _PageSpool(self)
+
+            if spool.text_length >= 50:
+                spool.finish()
+                return spool
+            spool.close()
+
+        # Skip if no meaningful content extracted
+        print(f"⚠️  Minimal text extracted from {file_path.name}")
+        return None
+
+    def _write_spooled_record(self, file_path: Path, spool: _PageSpool, out: TextIO):
+        """Write a spooled PDF as one JSON record (the same fields as _parse_pdf())"""
+        title = self._extract_title(file_path.stem, '\n'.join(spool.first_lines))
+        category = self._categorize_pdf(file_path.stem, spool.keywords)
+        page_count = spool.page_breaks + 1 if spool.page_breaks else 1
+        metadata = self._file_metadata(file_path, title, category, page_count)
+
+        def dump(value: Any) -> str:
+            return json.dumps(value, ensure_ascii=False)
+
+        def copy(spool_file: TextIO):
+            spool_file.seek(0)
+            shutil.copyfileobj(spool_file, out)
+
+        out.write(f'{{"id": {dump(self._generate_id(file_path))}, "source_file": {dump(str(file_path))}, '
+                  f'"type": "pdf", "title": {dump(title)}, "category": {dump(category)}, "raw_content": "')
+        copy(spool.raw)
+        out.write('", "cleaned_content": "')
+        copy(spool.cleaned)
+        out.write('", "sections": [')
+        copy(spool.sections)
+        out.write(f'], "metadata": {dump(metadata)}, "word_count": {spool.word_count}, '
+                  f'"page_count": {page_count}}}')
+
 
 # Example usage
 if __name__ == "__main__":
-    import os
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract text from portfolio PDFs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Extraction processes")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per file / page range")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write records as they are processed, a page at a time (bounded memory, no workers)")
+    args = parser.parse_args()
 
     # Get the project root directory (go up from src/processor/ to project root)
     current_dir = Path(__file__).parent  # src/processor/
@@ -348,6 +856,7 @@ if __name__ == "__main__":
     # Set paths relative to project root
     notion_export_path = project_root / "data" / "raw" / "notion_export"
     output_path = project_root / "data" / "processed" / "pdf_content.json"
+    cache_dir = project_root / "data" / "processed" / "cache"
 
     print(f"Looking for PDFs in: {notion_export_path}")
     print(f"Also checking: {notion_export_path.parent} (for files like mingresume.pdf)")
@@ -359,28 +868,33 @@ if __name__ == "__main__":
         print("Will only process PDFs in data/raw/ folder")
         # Use the raw folder instead
         raw_folder = project_root / "data" / "raw"
-        processor = PDFProcessor(str(raw_folder))
+        processor = PDFProcessor(str(raw_folder), workers=args.workers, file_timeout=args.timeout,
+                                 cache_dir=str(cache_dir))
     else:
         # Initialize processor with notion export path
-        processor = PDFProcessor(str(notion_export_path))
+        processor = PDFProcessor(str(notion_export_path), workers=args.workers, file_timeout=args.timeout,
+                                 cache_dir=str(cache_dir))
 
-    # Process all PDF files
-    processed_content = processor.process_all_pdfs()
+    if args.stream:
+        processor.stream_processed_content(str(output_path))
+    else:
+        # Process all PDF files
+        processed_content = processor.process_all_pdfs()
 
-    # Save results
-    processor.save_processed_content(str(output_path))
+        # Save results
+        processor.save_processed_content(str(output_path))
 
-    # Print summary
-    print("\n📋 PDF Processing Summary:")
-    categories = {}
-    total_pages = 0
+        # Print summary
+        print("\n📋 PDF Processing Summary:")
+        categories = {}
+        total_pages = 0
 
-    for content in processed_content:
-        cat = content['metadata']['category']
-        categories[cat] = categories.get(cat, 0) + 1
-        total_pages += content.get('page_count', 0)
+        for content in processed_content:
+            cat = content['metadata']['category']
+            categories[cat] = categories.get(cat, 0) + 1
+            total_pages += content.get('page_count', 0)
 
-    for category, count in categories.items():
-        print(f"  {category}: {count} files")
+        for category, count in categories.items():
+            print(f"  {category}: {count} files")
 
-    print(f"📄 Total pages processed: {total_pages}")
+        print(f"📄 Total pages processed: {total_pages}")
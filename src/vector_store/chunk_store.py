@@ -0,0 +1,140 @@
+# src/vector_store/chunk_store.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Sequence, Tuple
+
+MISSING_CONTENT = "Content not found"
+
+
+class ChunkStore:
+    """In-memory chunk content store indexed by FAISS row id"""
+
+    def __init__(self, chunks_file: str, row_ids: Sequence[str], check_interval: float = 5.0):
+        """
+        Load chunk content once and align it with the FAISS index rows
+
+        Args:
+            chunks_file: Path to final_chunks.json
+            row_ids: Chunk ids in FAISS row order (from the index metadata)
+            check_interval: Minimum seconds between on-disk change checks
+        """
+        self.chunks_file = Path(chunks_file)
+        self.row_ids = list(row_ids)
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._contents: List[str] = []
+        self._file_signature = None
+        self._content_hash = None
+        self._last_check = time.monotonic()
+        self.reload_count = 0
+
+        self._load()
+
+    def _stat_signature(self) -> Tuple[int, int]:
+        """Cheap change detector: (mtime_ns, size) of the chunks file"""
+        stat = os.stat(self.chunks_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, raw: bytes = None, signature: Tuple[int, int] = None):
+        """Read chunks file and rebuild the row-aligned content list"""
+        if raw is None:
+            signature = self._stat_signature()
+            with open(self.chunks_file, 'rb') as f:
+                raw = f.read()
+
+        all_chunks = json.loads(raw.decode('utf-8'))
+        content_by_id = {chunk['id']: chunk['content'] for chunk in all_chunks}
+
+        # Swap in a fully built list so readers never see a partial store
+        self._contents = [content_by_id.get(chunk_id, MISSING_CONTENT) for chunk_id in self.row_ids]
+        self._file_signature = signature
+        self._content_hash = hashlib.sha256(raw).hexdigest()
+
+        missing = sum(1 for content in self._contents if content is MISSING_CONTENT)
+        print(f"✅ Chunk store loaded {len(self._contents) - missing}/{len(self.row_ids)} chunks from {self.chunks_file.name}")
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Reload the store if the chunks file changed on disk
+
+        The file is only stat'ed once per check_interval and only re-read when
+        its mtime/size changed; a reload happens only if the content hash differs.
+
+        Returns:
+            True if the store was reloaded
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+
+        with self._lock:
+            if now - self._last_check < self.check_interval:
+                return False
+            self._last_check = now
+
+            try:
+                signature = self._stat_signature()
+            except OSError:
+                return False
+
+            if signature == self._file_signature:
+                return False
+
+            with open(self.chunks_file, 'rb') as f:
+                raw = f.read()
+
+            if hashlib.sha256(raw).hexdigest() == self._content_hash:
+                # Touched but unchanged
+                self._file_signature = signature
+                return False
+
+            print(f"🔄 {self.chunks_file.name} changed on disk, reloading chunk store")
+            self._load(raw, signature)
+            self.reload_count += 1
+            return True
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def get_content(self, row: int) -> str:
+        """Get chunk content by FAISS row id"""
+        contents = self._contents
+        if 0 <= row < len(contents):
+            return contents[row]
+        return MISSING_CONTENT
+
+    def hydrate(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add 'content' to FAISS search results in place using their row ids"""
+        contents = self._contents
+        for result in results:
+            row = result['row_id']
+            result['content'] = contents[row] if 0 <= row < len(contents) else MISSING_CONTENT
+        return results
+
+
+_shared_stores: Dict[Tuple[str, str], ChunkStore] = {}
+_shared_lock = threading.Lock()
+
+
+def get_chunk_store(chunks_file: str, row_ids: Sequence[str]) -> ChunkStore:
+    """
+    Get the process-wide chunk store for a chunks file and row layout
+
+    Chatbot instances serving the same index share one store, so the chunks
+    file is parsed once per process instead of once per request.
+    """
+    ids_fingerprint = hashlib.sha1('\n'.join(row_ids).encode('utf-8')).hexdigest()
+    key = (str(Path(chunks_file).resolve()), ids_fingerprint)
+
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = ChunkStore(chunks_file, row_ids)
+            _shared_stores[key] = store
+        return store
@@ -0,0 +1,219 @@
+# src/vector_store/columnar_store.py
+
+import json
+import mmap
+import os
+import shutil
+from collections.abc import Sequence
+from pathlib import Path
+from typing import List, Dict, Any, Iterable
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+MISSING_CONTENT = "Content not found"
+
+# Record fields stored as interned columns (besides one column per metadata key)
+INTERNED_FIELDS = ['source_type', 'source_file']
+
+
+def _write_blob(strings: List[str], blob_file: Path, offsets_file: Path):
+    """Write strings as one concatenated UTF-8 blob plus an int64 offsets array"""
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    with open(blob_file, 'wb') as f:
+        position = 0
+        for i, text in enumerate(strings):
+            encoded = text.encode('utf-8')
+            f.write(encoded)
+            position += len(encoded)
+            offsets[i + 1] = position
+    np.save(offsets_file, offsets)
+
+
+def _open_blob(blob_file: Path):
+    """Memory-map a blob file read-only (empty files cannot be mapped)"""
+    with open(blob_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def write_chunk_store(records: Iterable[Dict[str, Any]], store_dir: str) -> Path:
+    """
+    Write chunk records to the columnar on-disk format
+
+    Layout of store_dir:
+        manifest.json      - format version, row count, column vocabularies
+        text.bin           - concatenated UTF-8 chunk content
+        text_offsets.npy   - int64 [n + 1] byte offsets into text.bin
+        ids.bin            - concatenated UTF-8 chunk ids
+        id_offsets.npy     - int64 [n + 1] byte offsets into ids.bin
+        word_count.npy     - int32 [n]
+        codes.npy          - int32 [n, n_columns] vocabulary codes (-1 = absent)
+
+    Args:
+        records: Chunk dicts with id, content, metadata, source_type,
+                 source_file and word_count, in FAISS row order
+        store_dir: Output directory (replaced atomically if it exists)
+
+    Returns:
+        Path to the written store directory
+    """
+    records = list(records)
+    store_path = Path(store_dir)
+    tmp_path = store_path.with_name(f"{store_path.name}.tmp-{os.getpid()}")
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+    tmp_path.mkdir(parents=True)
+
+    # Interned columns: fixed record fields, then metadata keys in first-seen order
+    columns = [f"record.{field}" for field in INTERNED_FIELDS]
+    for record in records:
+        for key in record['metadata']:
+            if f"metadata.{key}" not in columns:
+                columns.append(f"metadata.{key}")
+
+    vocabularies: Dict[str, List[Any]] = {column: [] for column in columns}
+    vocab_index: Dict[str, Dict[str, int]] = {column: {} for column in columns}
+    codes = np.full((len(records), len(columns)), -1, dtype=np.int32)
+
+    for row, record in enumerate(records):
+        for col, column in enumerate(columns):
+            scope, key = column.split('.', 1)
+            source = record if scope == 'record' else record['metadata']
+            if key not in source:
+                continue
+            value = source[key]
+            value_key = json.dumps(value, sort_keys=True, ensure_ascii=False)
+            code = vocab_index[column].get(value_key)
+            if code is None:
+                code = len(vocabularies[column])
+                vocab_index[column][value_key] = code
+                vocabularies[column].append(value)
+            codes[row, col] = code
+
+    _write_blob([record['content'] for record in records], tmp_path / "text.bin", tmp_path / "text_offsets.npy")
+    _write_blob([record['id'] for record in records], tmp_path / "ids.bin", tmp_path / "id_offsets.npy")
+    np.save(tmp_path / "word_count.npy", np.array([record['word_count'] for record in records], dtype=np.int32))
+    np.save(tmp_path / "codes.npy", codes)
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'num_rows': len(records),
+        'columns': columns,
+        'vocabularies': vocabularies
+    }
+    with open(tmp_path / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+    # Swap directories; processes that already mapped the old files keep them
+    if store_path.exists():
+        old_path = store_path.with_name(f"{store_path.name}.old-{os.getpid()}")
+        os.replace(store_path, old_path)
+        os.replace(tmp_path, store_path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.replace(tmp_path, store_path)
+
+    return store_path
+
+
+class ChunkMetadataView(Sequence):
+    """Read-only sequence of per-row metadata dicts backed by the columnar store"""
+
+    def __init__(self, store: "ColumnarChunkStore"):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._store.get_record(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self._store.get_record(row)
+
+
+class ColumnarChunkStore:
+    """Memory-mapped chunk content and metadata, shared via the page cache"""
+
+    def __init__(self, store_dir: str):
+        """
+        Open a store written by write_chunk_store
+
+        Args:
+            store_dir: Directory containing manifest.json and column files
+        """
+        self.store_dir = Path(store_dir)
+
+        with open(self.store_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        if manifest.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported chunk store format: {manifest.get('format_version')}")
+
+        self.num_rows = manifest['num_rows']
+        self.columns = manifest['columns']
+        self.vocabularies = [manifest['vocabularies'][column] for column in self.columns]
+
+        self._text = _open_blob(self.store_dir / "text.bin")
+        self._text_offsets = np.load(self.store_dir / "text_offsets.npy", mmap_mode='r')
+        self._ids = _open_blob(self.store_dir / "ids.bin")
+        self._id_offsets = np.load(self.store_dir / "id_offsets.npy", mmap_mode='r')
+        self._word_count = np.load(self.store_dir / "word_count.npy", mmap_mode='r')
+        self._codes = np.load(self.store_dir / "codes.npy", mmap_mode='r')
+
+    @classmethod
+    def exists(cls, store_dir: str) -> bool:
+        """Check whether a store has been written to store_dir"""
+        return (Path(store_dir) / MANIFEST_FILE).exists()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def refresh_if_stale(self) -> bool:
+        """Stores are immutable; a rebuilt index comes with a new store"""
+        return False
+
+    def get_content(self, row: int) -> str:
+        """Get chunk content by FAISS row id"""
+        if not 0 <= row < self.num_rows:
+            return MISSING_CONTENT
+        start, end = self._text_offsets[row], self._text_offsets[row + 1]
+        return self._text[start:end].decode('utf-8')
+
+    def get_id(self, row: int) -> str:
+        """Get chunk id by FAISS row id"""
+        start, end = self._id_offsets[row], self._id_offsets[row + 1]
+        return self._ids[start:end].decode('utf-8')
+
+    def get_record(self, row: int) -> Dict[str, Any]:
+        """Get the index metadata entry for a row (same shape as metadata.json items)"""
+        record = {'id': self.get_id(row), 'metadata': {}}
+        metadata = record['metadata']
+
+        for column, vocabulary, code in zip(self.columns, self.vocabularies, self._codes[row]):
+            if code < 0:
+                continue
+            scope, key = column.split('.', 1)
+            if scope == 'record':
+                record[key] = vocabulary[code]
+            else:
+                metadata[key] = vocabulary[code]
+
+        record['word_count'] = int(self._word_count[row])
+        return record
+
+    def metadata_view(self) -> ChunkMetadataView:
+        """Sequence view usable in place of the unpickled metadata list"""
+        return ChunkMetadataView(self)
+
+    def hydrate(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add 'content' to FAISS search results in place using their row ids"""
+        for result in results:
+            result['content'] = self.get_content(result['row_id'])
+        return results
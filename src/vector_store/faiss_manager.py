@@ -1,27 +1,103 @@
 # src/vector_store/faiss_manager.py
 
+import hashlib
 import json
+import os
+import shutil
+import time
 import numpy as np
 import faiss
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 import pickle
+import sys
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from vector_store.columnar_store import ColumnarChunkStore, write_chunk_store
+
+INDEX_TYPES = ('flat', 'ivf', 'ivfpq', 'sq', 'hnsw', 'auto')
+
+# Build / search parameters used when not given in index_params
+DEFAULT_INDEX_PARAMS = {
+    'M': 32,                # HNSW graph degree
+    'efConstruction': 200,  # HNSW build-time candidate list size
+    'pq_nbits': 8,          # Bits per PQ sub-quantizer code
+    'sq_type': 'QT_8bit'    # faiss.ScalarQuantizer quantizer type
+}
+
+# Corpus sizes at which auto mode moves to an approximate index
+AUTO_FLAT_MAX_VECTORS = 20_000
+AUTO_HNSW_MAX_VECTORS = 2_000_000
+
+# Candidate values tried when tuning search parameters to a recall target
+NPROBE_CANDIDATES = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+EF_SEARCH_CANDIDATES = [16, 32, 64, 96, 128, 192, 256, 384, 512]
+
+# Published index generations live in generations/<name>/; CURRENT names the live one
+GENERATIONS_DIR = "generations"
+CURRENT_FILE = "CURRENT"
+KEEP_GENERATIONS = 2  # The live generation plus the one before (still mapped by older readers)
+
+# sync_from_embeddings() compacts once this fraction of rows changed since the last build
+COMPACT_AFTER_FRACTION = 0.25
+
+
+def chunk_faiss_id(chunk_id: str) -> int:
+    """Stable non-negative int64 FAISS id for a chunk id (first 8 bytes of its sha256)"""
+    digest = hashlib.sha256(chunk_id.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') & 0x7FFFFFFFFFFFFFFF
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    """Write JSON to a temporary file and rename it over path"""
+    tmp_file = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, path)
+
 
 class FAISSManager:
     """Manage FAISS vector store for RAG retrieval"""
 
-    def __init__(self, embedding_dim: int, index_type: str = "flat"):
+    def __init__(self, embedding_dim: int, index_type: str = "flat", recall_target: float = 0.95,
+                 index_params: Optional[Dict[str, Any]] = None):
         """
         Initialize FAISS manager
 
         Args:
             embedding_dim: Dimension of embeddings
-            index_type: Type of FAISS index ('flat', 'ivf', 'hnsw')
+            index_type: Type of FAISS index ('flat', 'ivf', 'ivfpq', 'sq', 'hnsw',
+                        or 'auto' to pick from corpus size and recall_target)
+            recall_target: Min recall@10 vs exact search; search parameters
+                           (nprobe / efSearch) not set in index_params are tuned to it
+            index_params: Overrides for nlist, nprobe, M, efConstruction, efSearch,
+                          pq_m, pq_nbits and sq_type
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type '{index_type}', expected one of {INDEX_TYPES}")
+
         self.embedding_dim = embedding_dim
         self.index_type = index_type
+        self.recall_target = recall_target
+        self.index_params = dict(index_params or {})
+        self.build_params: Dict[str, Any] = {}
+        self.search_params: Dict[str, Any] = {}
         self.index = None
         self.metadata = None
+        self.chunk_store = None
+        self.id_to_row: Dict[str, int] = {}
+        self.row_to_id: List[str] = []
+
+        # Id-mapped indexes (built by create_index_from_embeddings) search by
+        # chunk_faiss_id; legacy indexes return rows directly
+        self.faiss_ids: Optional[np.ndarray] = None
+        self.faiss_id_to_row: Optional[Dict[int, int]] = None
+        self.vectors: Optional[np.ndarray] = None  # Normalized, in row order
+        self.generation: Optional[str] = None
+        self.model_name: Optional[str] = None
+        self.updates_since_build = 0
+        self._contents: Optional[List[str]] = None  # Set while rows differ from chunk_store
 
     def create_index_from_embeddings(self, embeddings_dir: str) -> str:
         """
@@ -37,90 +113,247 @@ class FAISSManager:
 
         # Load embeddings and metadata
         print("📖 Loading embeddings and metadata...")
-        embeddings = np.load(embeddings_path / "embeddings.npy")
-
-        with open(embeddings_path / "metadata.json", 'r', encoding='utf-8') as f:
-            self.metadata = json.load(f)
-
-        with open(embeddings_path / "config.json", 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        embeddings, metadata, config = self._load_embeddings_dir(embeddings_path)
 
         print(f"✅ Loaded {len(embeddings)} embeddings of dimension {embeddings.shape[1]}")
 
+        content_by_id = self._load_chunk_contents(embeddings_path, config)
+        self.metadata = metadata
+        self.chunk_store = None
+        self._contents = [content_by_id.get(chunk['id'], "Content not found") for chunk in metadata]
+        self.model_name = config.get('model_name')
+        self._build_id_index()
+        self._set_faiss_ids([chunk_faiss_id(chunk_id) for chunk_id in self.row_to_id])
+
         # Create FAISS index
         self.embedding_dim = embeddings.shape[1]
-        self.index = self._create_faiss_index(embeddings)
+        self.index = self._create_faiss_index(embeddings, self.faiss_ids)
+        self.vectors = self._normalize(embeddings)
+        self.updates_since_build = 0
 
-        # Save index and metadata
-        index_file = embeddings_path / "faiss_index.index"
-        metadata_file = embeddings_path / "faiss_metadata.pkl"
+        # Publish index, chunk store and id index as a new generation
+        generation_path = self.save(str(embeddings_path))
 
-        # Save FAISS index
-        faiss.write_index(self.index, str(index_file))
-        print(f"💾 Saved FAISS index to {index_file}")
+        print(f"✅ FAISS index created successfully!")
+        self._print_index_info()
 
-        # Save metadata for retrieval
-        with open(metadata_file, 'wb') as f:
-            pickle.dump(self.metadata, f)
-        print(f"💾 Saved metadata to {metadata_file}")
+        return str(generation_path / "faiss_index.index")
 
-        # Update config
-        config['faiss_index_file'] = str(index_file)
-        config['faiss_metadata_file'] = str(metadata_file)
-        config['index_type'] = self.index_type
+    def _load_embeddings_dir(self, embeddings_path: Path) -> Tuple[np.ndarray, List[Dict[str, Any]], Dict[str, Any]]:
+        """Load embeddings.npy, metadata.json and config.json written by the embedding generator"""
+        embeddings = np.load(embeddings_path / "embeddings.npy")
 
-        with open(embeddings_path / "config.json", 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(embeddings_path / "metadata.json", 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
 
-        print(f"✅ FAISS index created successfully!")
-        self._print_index_info()
+        with open(embeddings_path / "config.json", 'r', encoding='utf-8') as f:
+            config = json.load(f)
 
-        return str(index_file)
+        return embeddings, metadata, config
+
+    def _load_chunk_contents(self, embeddings_path: Path, config: Dict[str, Any]) -> Dict[str, str]:
+        """Load chunk content by id from final_chunks.json"""
+        candidates = [
+            Path(config.get('chunks_file', '')),
+            embeddings_path.parent / "processed" / "final_chunks.json",
+            embeddings_path / "final_chunks.json"
+        ]
+        for chunks_file in candidates:
+            if chunks_file.is_file():
+                with open(chunks_file, 'r', encoding='utf-8') as f:
+                    return {chunk['id']: chunk['content'] for chunk in json.load(f)}
+
+        raise FileNotFoundError("final_chunks.json not found. Please run the content aggregator first!")
+
+    def _resolve_index_type(self, n_embeddings: int) -> str:
+        """Pick the index type for auto mode from corpus size and recall target"""
+        if self.index_type != "auto":
+            return self.index_type
+
+        if n_embeddings <= AUTO_FLAT_MAX_VECTORS or self.recall_target >= 0.999:
+            return "flat"  # Exact search is fast enough (or nothing else is exact)
+        if n_embeddings <= AUTO_HNSW_MAX_VECTORS:
+            return "hnsw"
+        # Beyond this, full-precision vectors stop fitting comfortably in memory
+        return "ivfpq" if self.recall_target < 0.9 else "sq"
+
+    def _ivf_nlist(self, n_embeddings: int) -> int:
+        """Number of IVF lists: ~4 * sqrt(n), clamped so each list gets enough training points"""
+        nlist = self.index_params.get('nlist', int(4 * np.sqrt(n_embeddings)))
+        return int(max(1, min(nlist, n_embeddings // 39 or 1)))
+
+    def _pq_m(self, dim: int) -> int:
+        """Number of PQ sub-quantizers: the largest divisor of dim up to dim / 8"""
+        pq_m = self.index_params.get('pq_m', max(1, dim // 8))
+        while dim % pq_m:
+            pq_m -= 1
+        return pq_m
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Float32 copy with unit-length rows (inner product = cosine similarity)"""
+        embeddings_normalized = np.array(embeddings, dtype=np.float32)
+        faiss.normalize_L2(embeddings_normalized)
+        return embeddings_normalized
 
-    def _create_faiss_index(self, embeddings: np.ndarray) -> faiss.Index:
-        """Create FAISS index based on type and data size"""
-        n_embeddings, dim = embeddings.shape
+    def _create_faiss_index(self, embeddings: np.ndarray, ids: Optional[np.ndarray] = None,
+                            index_type: Optional[str] = None) -> faiss.Index:
+        """
+        Create FAISS index based on type and data size
 
-        print(f"🔧 Creating FAISS index (type: {self.index_type})")
+        Args:
+            embeddings: Vectors to index (normalized here)
+            ids: int64 FAISS id per vector (default: the row number)
+            index_type: Concrete index type to build instead of resolving self.index_type
+        """
+        n_embeddings, dim = embeddings.shape
+        index_type = index_type or self._resolve_index_type(n_embeddings)
+        ids = np.arange(n_embeddings, dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        params = {**DEFAULT_INDEX_PARAMS, **self.index_params}
+        metric = faiss.METRIC_INNER_PRODUCT  # Cosine similarity on normalized vectors
 
-        if self.index_type == "flat" or n_embeddings < 1000:
-            # Use flat index for small datasets or when specified
-            index = faiss.IndexFlatIP(dim)  # Inner product (cosine similarity)
-            print("📊 Using IndexFlatIP (exact search)")
+        print(f"🔧 Creating FAISS index (type: {index_type}, requested: {self.index_type})")
 
-        elif self.index_type == "ivf":
-            # Inverted file index for larger datasets
-            nlist = min(int(np.sqrt(n_embeddings)), 100)  # Number of clusters
-            quantizer = faiss.IndexFlatIP(dim)
-            index = faiss.IndexIVFFlat(quantizer, dim, nlist)
-            print(f"📊 Using IndexIVFFlat with {nlist} clusters")
+        # Normalize embeddings for cosine similarity
+        embeddings_normalized = self._normalize(embeddings)
 
-            # Train the index
-            print("🏋️ Training IVF index...")
-            index.train(embeddings.astype(np.float32))
+        self.build_params = {'index_type': index_type}
 
-        else:  # Default to flat
+        if index_type == "flat":
             index = faiss.IndexFlatIP(dim)
-            print("📊 Using IndexFlatIP (default)")
+            print("📊 Using IndexFlatIP (exact search)")
 
-        # Add embeddings to index
+        elif index_type in ("ivf", "ivfpq"):
+            nlist = self._ivf_nlist(n_embeddings)
+            quantizer = faiss.IndexFlatIP(dim)
+            self.build_params['nlist'] = nlist
+
+            if index_type == "ivf":
+                index = faiss.IndexIVFFlat(quantizer, dim, nlist, metric)
+                print(f"📊 Using IndexIVFFlat with {nlist} clusters")
+            else:
+                pq_m = self._pq_m(dim)
+                # Each sub-quantizer wants ~39 training points per centroid (2^nbits centroids)
+                pq_nbits = int(min(params['pq_nbits'], max(1, np.log2(max(n_embeddings / 39, 2)))))
+                index = faiss.IndexIVFPQ(quantizer, dim, nlist, pq_m, pq_nbits, metric)
+                self.build_params.update({'pq_m': pq_m, 'pq_nbits': pq_nbits})
+                print(f"📊 Using IndexIVFPQ with {nlist} clusters, {pq_m}x{pq_nbits}-bit codes")
+
+        elif index_type == "sq":
+            sq_type = params['sq_type']
+            index = faiss.IndexScalarQuantizer(dim, getattr(faiss.ScalarQuantizer, sq_type), metric)
+            self.build_params['sq_type'] = sq_type
+            print(f"📊 Using IndexScalarQuantizer ({sq_type})")
+
+        else:  # hnsw
+            index = faiss.IndexHNSWFlat(dim, params['M'], metric)
+            index.hnsw.efConstruction = params['efConstruction']
+            self.build_params.update({'M': params['M'], 'efConstruction': params['efConstruction']})
+            print(f"📊 Using IndexHNSWFlat with M={params['M']}, efConstruction={params['efConstruction']}")
+
+        if not index.is_trained:
+            print("🏋️ Training index...")
+            index.train(embeddings_normalized)
+
+        # Add embeddings under their ids, so single chunks can later be replaced or removed.
+        # IVF indexes store ids in their inverted lists; an IndexIDMap2 around one goes out
+        # of sync on remove_ids (it compacts its id map, IVF does not renumber)
         print("📥 Adding embeddings to index...")
+        if not isinstance(index, faiss.IndexIVF):
+            index = faiss.IndexIDMap2(index)
+        index.add_with_ids(embeddings_normalized, ids)
 
-        # Normalize embeddings for cosine similarity
-        embeddings_normalized = embeddings.astype(np.float32)
-        faiss.normalize_L2(embeddings_normalized)
+        print(f"✅ Added {index.ntotal} vectors to index")
 
-        index.add(embeddings_normalized)
+        self.index = index
+        self.search_params = self._tune_search_params(embeddings_normalized, ids)
+        self._apply_search_params(self.search_params)
 
-        print(f"✅ Added {index.ntotal} vectors to index")
+        return index
 
+    def _tune_search_params(self, embeddings_normalized: np.ndarray, ids: np.ndarray, k: int = 10,
+                            n_queries: int = 200) -> Dict[str, Any]:
+        """
+        Choose nprobe / efSearch for the built index
+
+        Explicit values in index_params are kept; otherwise the smallest
+        candidate whose recall@k against exact search on a sample of the
+        corpus reaches recall_target is used (the largest if none does).
+        """
+        ivf = faiss.try_extract_index_ivf(self.index)
+        hnsw = getattr(self._base_index(), 'hnsw', None)
+
+        if ivf is not None:
+            name, candidates = 'nprobe', [c for c in NPROBE_CANDIDATES if c < ivf.nlist] + [ivf.nlist]
+        elif hnsw is not None:
+            name, candidates = 'efSearch', EF_SEARCH_CANDIDATES
+        else:
+            return {}
+
+        if name in self.index_params:
+            return {name: self.index_params[name]}
+
+        # Sample queries from the corpus and get exact neighbours
+        rng = np.random.default_rng(0)
+        n_queries = min(n_queries, len(embeddings_normalized))
+        k = min(k, len(embeddings_normalized))
+        queries = embeddings_normalized[rng.choice(len(embeddings_normalized), n_queries, replace=False)]
+
+        exact = faiss.IndexFlatIP(embeddings_normalized.shape[1])
+        exact.add(embeddings_normalized)
+        truth = ids[exact.search(queries, k)[1]]
+
+        for value in candidates:
+            self._apply_search_params({name: value})
+            _, found = self.index.search(queries, k)
+            recall = np.mean([len(set(t) & set(f)) / k for t, f in zip(truth, found)])
+            if recall >= self.recall_target:
+                break
+
+        print(f"🎯 Tuned {name}={value} (recall@{k}={recall:.3f}, target {self.recall_target})")
+        return {name: value}
+
+    def _apply_search_params(self, search_params: Dict[str, Any]):
+        """Set query-time parameters (nprobe / efSearch) on the loaded index"""
+        if 'nprobe' in search_params:
+            ivf = faiss.try_extract_index_ivf(self.index)
+            if ivf is not None:
+                ivf.nprobe = int(search_params['nprobe'])
+        if 'efSearch' in search_params:
+            hnsw = getattr(self._base_index(), 'hnsw', None)
+            if hnsw is not None:
+                hnsw.efSearch = int(search_params['efSearch'])
+
+    def _base_index(self) -> faiss.Index:
+        """The index under the id map (the index itself for legacy indexes)"""
+        index = faiss.downcast_index(self.index)
+        if isinstance(index, faiss.IndexIDMap):
+            index = faiss.downcast_index(index.index)
         return index
 
-    def load_index(self, index_dir: str):
-        """Load existing FAISS index and metadata"""
+    def load_index(self, index_dir: str, search_params: Optional[Dict[str, Any]] = None):
+        """
+        Load existing FAISS index and metadata
+
+        Loads the generation named by index_dir/CURRENT, or for vector stores
+        built before generations existed, the files in index_dir itself.
+
+        Args:
+            index_dir: Vector store directory
+            search_params: nprobe / efSearch overriding those saved at build time
+        """
         index_path = Path(index_dir)
+        generation = self.current_generation(index_dir)
 
-        index_file = index_path / "faiss_index.index"
+        if generation:
+            data_path = index_path / GENERATIONS_DIR / generation
+            config_file = data_path / "manifest.json"
+        else:
+            data_path = index_path
+            config_file = index_path / "config.json"
+
+        index_file = data_path / "faiss_index.index"
+        store_dir = data_path / "chunk_store"
         metadata_file = index_path / "faiss_metadata.pkl"
 
         if not index_file.exists():
@@ -128,15 +361,59 @@ class FAISSManager:
 
         # Load index
         self.index = faiss.read_index(str(index_file))
+        self.generation = generation
         print(f"✅ Loaded FAISS index from {index_file}")
 
-        # Load metadata
-        with open(metadata_file, 'rb') as f:
-            self.metadata = pickle.load(f)
-        print(f"✅ Loaded metadata for {len(self.metadata)} chunks")
+        # Apply the search parameters chosen when the index was built
+        config = {}
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        self.build_params = config.get('index_params', {})
+        self.model_name = config.get('model_name')
+        self.updates_since_build = config.get('updates_since_build', 0)
+        self.search_params = {**config.get('search_params', {}), **(search_params or {})}
+        self._apply_search_params(self.search_params)
+
+        self._contents = None
+        if ColumnarChunkStore.exists(str(store_dir)):
+            # Memory-mapped: workers share page-cache pages, nothing to unpickle
+            self.chunk_store = ColumnarChunkStore(str(store_dir))
+            self.metadata = self.chunk_store.metadata_view()
+            print(f"✅ Mapped chunk store for {len(self.metadata)} chunks")
+        else:
+            # Legacy vector stores without a chunk store
+            self.chunk_store = None
+            with open(metadata_file, 'rb') as f:
+                self.metadata = pickle.load(f)
+            print(f"✅ Loaded metadata for {len(self.metadata)} chunks")
+
+        # Normalized vectors, needed to rebuild the index after updates
+        vectors_file = data_path / "vectors.npy"
+        self.vectors = np.load(vectors_file, mmap_mode='r') if vectors_file.exists() else None
+
+        # Load id <-> row lookup index (built once for vector stores without one)
+        id_index_file = data_path / "id_index.json"
+        if id_index_file.exists():
+            with open(id_index_file, 'r', encoding='utf-8') as f:
+                id_index = json.load(f)
+            self.id_to_row = id_index['id_to_row']
+            self.row_to_id = id_index['row_to_id']
+            self._set_faiss_ids(id_index.get('faiss_ids'))
+        else:
+            self._build_id_index()
+            self._set_faiss_ids(None)
 
         self._print_index_info()
 
+    @staticmethod
+    def current_generation(index_dir: str) -> Optional[str]:
+        """Name of the live index generation in index_dir (None for legacy vector stores)"""
+        current_file = Path(index_dir) / CURRENT_FILE
+        if not current_file.exists():
+            return None
+        return current_file.read_text(encoding='utf-8').strip() or None
+
     def search(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Search for similar chunks
@@ -148,24 +425,44 @@ class FAISSManager:
         Returns:
             List of similar chunks with metadata and scores
         """
+        return self.search_batch(np.asarray(query_embedding).reshape(1, -1), top_k=top_k)[0]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar chunks for many queries in one FAISS call
+
+        Args:
+            query_embeddings: Query embeddings of shape (n_queries, dim)
+            top_k: Number of results to return per query
+
+        Returns:
+            One list of results (as returned by search) per query, in input order
+        """
         if self.index is None:
             raise ValueError("Index not loaded. Call create_index_from_embeddings() or load_index() first.")
 
-        # Normalize query embedding
-        query_normalized = query_embedding.astype(np.float32).reshape(1, -1)
-        faiss.normalize_L2(query_normalized)
+        # Normalize a copy of the query embeddings (callers may share theirs)
+        queries_normalized = np.array(query_embeddings, dtype=np.float32).reshape(-1, self.index.d)
+        faiss.normalize_L2(queries_normalized)
 
         # Search
-        scores, indices = self.index.search(query_normalized, top_k)
+        scores, indices = self.index.search(queries_normalized, top_k)
 
-        # Prepare results
+        return [self._format_results(score_row, index_row) for score_row, index_row in zip(scores, indices)]
+
+    def _format_results(self, scores: np.ndarray, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Turn one row of FAISS scores/ids into result dicts"""
         results = []
-        for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-            if idx >= 0:  # Valid result
-                chunk_metadata = self.metadata[idx]
+        for score, idx in zip(scores, indices):
+            if idx < 0:  # Fewer than top_k results
+                continue
+            row = self.faiss_id_to_row.get(int(idx)) if self.faiss_id_to_row is not None else int(idx)
+            if row is not None:
+                chunk_metadata = self.metadata[row]
                 results.append({
-                    'rank': i + 1,
+                    'rank': len(results) + 1,
                     'score': float(score),
+                    'row_id': row,
                     'chunk_id': chunk_metadata['id'],
                     'metadata': chunk_metadata['metadata'],
                     'source_type': chunk_metadata['source_type'],
@@ -179,17 +476,368 @@ class FAISSManager:
         """Print information about the loaded index"""
         if self.index:
             print(f"\n📊 FAISS Index Info:")
-            print(f"  Index type: {type(self.index).__name__}")
+            print(f"  Index type: {type(self._base_index()).__name__}")
+            if self.generation:
+                print(f"  Generation: {self.generation}")
             print(f"  Dimension: {self.index.d}")
             print(f"  Total vectors: {self.index.ntotal}")
             print(f"  Is trained: {self.index.is_trained}")
+            if self.search_params:
+                print(f"  Search params: {self.search_params}")
+
+    def _build_id_index(self):
+        """Build chunk id -> row and row -> chunk id lookups from the metadata"""
+        if self.chunk_store is not None:
+            self.row_to_id = [self.chunk_store.get_id(row) for row in range(len(self.chunk_store))]
+        else:
+            self.row_to_id = [chunk['id'] for chunk in self.metadata]
+        self.id_to_row = {chunk_id: row for row, chunk_id in enumerate(self.row_to_id)}
+
+    def _set_faiss_ids(self, faiss_ids: Optional[List[int]]):
+        """Set the per-row FAISS ids and the reverse lookup used to map search hits to rows"""
+        if faiss_ids is None:
+            self.faiss_ids = None
+            self.faiss_id_to_row = None
+            return
+
+        self.faiss_ids = np.asarray(faiss_ids, dtype=np.int64)
+        self.faiss_id_to_row = {int(faiss_id): row for row, faiss_id in enumerate(self.faiss_ids)}
+        if len(self.faiss_id_to_row) != len(self.faiss_ids):
+            raise ValueError("Duplicate chunk ids (or a FAISS id collision) in the index")
+
+    def _save_id_index(self, id_index_file: Path):
+        """Persist the id lookups next to the FAISS index"""
+        id_index = {'id_to_row': self.id_to_row, 'row_to_id': self.row_to_id}
+        if self.faiss_ids is not None:
+            id_index['faiss_ids'] = self.faiss_ids.tolist()
+        with open(id_index_file, 'w', encoding='utf-8') as f:
+            json.dump(id_index, f, ensure_ascii=False)
+
+    def get_row(self, chunk_id: str) -> Optional[int]:
+        """Get the FAISS row for a chunk ID in constant time"""
+        return self.id_to_row.get(chunk_id)
 
     def get_chunk_by_id(self, chunk_id: str) -> Dict[str, Any]:
         """Get chunk metadata by ID"""
-        for chunk in self.metadata:
-            if chunk['id'] == chunk_id:
-                return chunk
-        return None
+        row = self.id_to_row.get(chunk_id)
+        return self.metadata[row] if row is not None else None
+
+    def get_chunks(self, chunk_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several chunks by ID without scanning the corpus
+
+        Args:
+            chunk_ids: Chunk IDs to look up
+
+        Returns:
+            Per ID (in input order) the chunk metadata plus 'row_id' and, when the
+            index has a chunk store, 'content'; None for unknown IDs
+        """
+        chunks = []
+        for chunk_id in chunk_ids:
+            row = self.id_to_row.get(chunk_id)
+            if row is None:
+                chunks.append(None)
+                continue
+
+            chunk = {**self.metadata[row], 'row_id': row}
+            if self._contents is not None or self.chunk_store is not None:
+                chunk['content'] = self._row_content(row)
+            chunks.append(chunk)
+
+        return chunks
+
+    def _row_content(self, row: int) -> str:
+        """Chunk content for a row, from pending edits or the mapped chunk store"""
+        if self._contents is not None:
+            return self._contents[row]
+        return self.chunk_store.get_content(row)
+
+    def _require_updatable(self):
+        """Updates need an id-mapped index with its vectors (any index built by this version)"""
+        if self.index is None:
+            raise ValueError("Index not loaded. Call create_index_from_embeddings() or load_index() first.")
+        if self.faiss_ids is None or self.vectors is None:
+            raise ValueError("This vector store predates incremental updates; "
+                             "rebuild it once with create_index_from_embeddings()")
+
+    def _ivf_in_id_map(self) -> bool:
+        """IVF index wrapped in an IndexIDMap2 (built before IVF indexes kept their own ids)"""
+        return (isinstance(faiss.downcast_index(self.index), faiss.IndexIDMap)
+                and isinstance(self._base_index(), faiss.IndexIVF))
+
+    def _supports_remove(self) -> bool:
+        """HNSW graphs cannot drop vectors and id-mapped IVF indexes lose their ids doing so; both are rebuilt"""
+        return not (isinstance(self._base_index(), faiss.IndexHNSW) or self._ivf_in_id_map())
+
+    def _materialize(self):
+        """Copy rows out of the read-only mapped files so they can be edited"""
+        if self._contents is not None:
+            return
+        self._contents = [self._row_content(row) for row in range(len(self.row_to_id))]
+        self.metadata = list(self.metadata)
+        self.vectors = np.array(self.vectors, dtype=np.float32)
+        self.chunk_store = None
+
+    def upsert(self, records: List[Dict[str, Any]], embeddings: np.ndarray) -> Dict[str, int]:
+        """
+        Add new chunks and replace existing ones without rebuilding the index
+
+        Args:
+            records: Chunk dicts with id, content, metadata, source_type,
+                     source_file and word_count
+            embeddings: One embedding per record
+
+        Returns:
+            Number of chunks 'added' and 'updated'
+        """
+        self._require_updatable()
+        chunk_ids = [record['id'] for record in records]
+        if len(set(chunk_ids)) != len(chunk_ids):
+            raise ValueError("Duplicate chunk ids in upsert")
+        if not records:
+            return {'added': 0, 'updated': 0}
+
+        vectors = self._normalize(np.asarray(embeddings).reshape(len(records), -1))
+        if vectors.shape[1] != self.index.d:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self.index.d}")
+
+        faiss_ids = np.array([chunk_faiss_id(chunk_id) for chunk_id in chunk_ids], dtype=np.int64)
+        for chunk_id, faiss_id in zip(chunk_ids, faiss_ids):
+            row = self.faiss_id_to_row.get(int(faiss_id))
+            if row is not None and self.row_to_id[row] != chunk_id:
+                raise ValueError(f"FAISS id collision between {chunk_id} and {self.row_to_id[row]}")
+        existing = np.array([chunk_id in self.id_to_row for chunk_id in chunk_ids], dtype=bool)
+
+        self._materialize()
+
+        # Index first, so a failure leaves the rows untouched
+        rebuild = existing.any() and not self._supports_remove()
+        if not rebuild:
+            if existing.any():
+                self.index.remove_ids(faiss_ids[existing])
+            self.index.add_with_ids(vectors, faiss_ids)
+
+        # Replaced chunks keep their row; new chunks are appended
+        for record, vector, is_existing in zip(records, vectors, existing):
+            if is_existing:
+                row = self.id_to_row[record['id']]
+                self.metadata[row] = {key: value for key, value in record.items() if key != 'content'}
+                self._contents[row] = record['content']
+                self.vectors[row] = vector
+
+        added = np.flatnonzero(~existing)
+        for i in added:
+            record = records[i]
+            self.id_to_row[record['id']] = len(self.row_to_id)
+            self.faiss_id_to_row[int(faiss_ids[i])] = len(self.row_to_id)
+            self.row_to_id.append(record['id'])
+            self.metadata.append({key: value for key, value in record.items() if key != 'content'})
+            self._contents.append(record['content'])
+        self.vectors = np.concatenate([self.vectors, vectors[added]])
+        self.faiss_ids = np.concatenate([self.faiss_ids, faiss_ids[added]])
+
+        if rebuild:
+            self.compact()
+        self.updates_since_build += len(records)
+
+        return {'added': len(added), 'updated': int(existing.sum())}
+
+    def delete(self, chunk_ids: List[str]) -> int:
+        """
+        Remove chunks from the index
+
+        Args:
+            chunk_ids: Chunk IDs to remove (unknown IDs are ignored)
+
+        Returns:
+            Number of chunks removed
+        """
+        self._require_updatable()
+        rows = sorted({self.id_to_row[chunk_id] for chunk_id in chunk_ids if chunk_id in self.id_to_row})
+        if not rows:
+            return 0
+
+        self._materialize()
+        if self._supports_remove():
+            self.index.remove_ids(self.faiss_ids[rows])
+
+        keep = np.ones(len(self.row_to_id), dtype=bool)
+        keep[rows] = False
+        kept_rows = np.flatnonzero(keep)
+
+        self.metadata = [self.metadata[row] for row in kept_rows]
+        self._contents = [self._contents[row] for row in kept_rows]
+        self.row_to_id = [self.row_to_id[row] for row in kept_rows]
+        self.id_to_row = {chunk_id: row for row, chunk_id in enumerate(self.row_to_id)}
+        self.vectors = self.vectors[keep]
+        self._set_faiss_ids(self.faiss_ids[keep])
+
+        if not self._supports_remove():
+            self.compact()
+        self.updates_since_build += len(rows)
+
+        return len(rows)
+
+    def compact(self):
+        """
+        Rebuild the index from the stored vectors, keeping chunk ids
+
+        Retrains IVF / PQ / SQ quantizers on the current corpus (they drift as
+        chunks are replaced), rebuilds HNSW graphs and re-tunes search
+        parameters. Call save() to publish the result.
+        """
+        self._require_updatable()
+        if self.index_type == "auto":
+            index_type = self._resolve_index_type(len(self.vectors))
+        else:
+            index_type = self.build_params.get('index_type', self.index_type)
+
+        print(f"🗜️  Compacting index of {len(self.vectors)} vectors...")
+        self.index = self._create_faiss_index(np.asarray(self.vectors), self.faiss_ids, index_type)
+        self.updates_since_build = 0
+
+    def save(self, index_dir: str) -> Path:
+        """
+        Publish the index, chunk store and id index as a new generation
+
+        Files are written to a temporary directory that is renamed into
+        generations/ before CURRENT is replaced, so readers of index_dir see
+        either the previous generation or the complete new one.
+
+        Args:
+            index_dir: Vector store directory
+
+        Returns:
+            Path to the new generation directory
+        """
+        self._require_updatable()
+        index_path = Path(index_dir)
+        generations_path = index_path / GENERATIONS_DIR
+        generation = f"g{time.time_ns()}"
+        generation_path = generations_path / generation
+        tmp_path = generations_path / f".{generation}.tmp"
+        tmp_path.mkdir(parents=True)
+
+        faiss.write_index(self.index, str(tmp_path / "faiss_index.index"))
+        write_chunk_store(
+            ({**self.metadata[row], 'content': self._row_content(row)} for row in range(len(self.row_to_id))),
+            str(tmp_path / "chunk_store")
+        )
+        np.save(tmp_path / "vectors.npy", np.asarray(self.vectors, dtype=np.float32))
+        self._save_id_index(tmp_path / "id_index.json")
+        _write_json_atomic(tmp_path / "manifest.json", {
+            'generation': generation,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'model_name': self.model_name,
+            'num_vectors': int(self.index.ntotal),
+            'embedding_dimension': int(self.index.d),
+            'index_type': self.build_params.get('index_type'),
+            'index_params': self.build_params,
+            'search_params': self.search_params,
+            'updates_since_build': self.updates_since_build
+        })
+        os.replace(tmp_path, generation_path)
+
+        # Switch readers to the new generation
+        current_tmp = index_path / f"{CURRENT_FILE}.tmp-{os.getpid()}"
+        current_tmp.write_text(generation, encoding='utf-8')
+        os.replace(current_tmp, index_path / CURRENT_FILE)
+        print(f"💾 Published index generation {generation} ({self.index.ntotal} vectors)")
+
+        config_file = index_path / "config.json"
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            config.pop('faiss_metadata_file', None)
+            config.update({
+                'current_generation': generation,
+                'faiss_index_file': str(generation_path / "faiss_index.index"),
+                'chunk_store_dir': str(generation_path / "chunk_store"),
+                'id_index_file': str(generation_path / "id_index.json"),
+                'index_type': self.build_params.get('index_type'),
+                'index_params': self.build_params,
+                'search_params': self.search_params
+            })
+            _write_json_atomic(config_file, config)
+
+        self._prune_generations(generations_path, generation)
+
+        # Serve from the published files (mapped, shared with other processes)
+        self.generation = generation
+        self.chunk_store = ColumnarChunkStore(str(generation_path / "chunk_store"))
+        self.metadata = self.chunk_store.metadata_view()
+        self.vectors = np.load(generation_path / "vectors.npy", mmap_mode='r')
+        self._contents = None
+
+        return generation_path
+
+    def _prune_generations(self, generations_path: Path, current: str):
+        """Delete all but the newest KEEP_GENERATIONS generations"""
+        generations = sorted(
+            path.name for path in generations_path.iterdir()
+            if path.is_dir() and not path.name.startswith('.')
+        )
+        for name in generations[:-KEEP_GENERATIONS]:
+            if name != current:
+                shutil.rmtree(generations_path / name, ignore_errors=True)
+
+    def sync_from_embeddings(self, embeddings_dir: str) -> Dict[str, int]:
+        """
+        Apply regenerated embeddings to the published index without a full rebuild
+
+        Chunks whose content or metadata changed are replaced, new chunks
+        added and chunks that disappeared deleted; the result is published as
+        a new generation of embeddings_dir.
+
+        Args:
+            embeddings_dir: Directory containing embeddings and metadata (and the index)
+
+        Returns:
+            Number of chunks 'added', 'updated', 'deleted' and 'unchanged'
+        """
+        embeddings_path = Path(embeddings_dir)
+        if self.index is None:
+            self.load_index(embeddings_dir)
+        self._require_updatable()
+
+        embeddings, metadata, config = self._load_embeddings_dir(embeddings_path)
+        if self.model_name and config.get('model_name') != self.model_name:
+            raise ValueError(f"Embeddings are from {config.get('model_name')}, index from {self.model_name}; "
+                             "rebuild with create_index_from_embeddings()")
+        content_by_id = self._load_chunk_contents(embeddings_path, config)
+
+        # Older IVF generations scrambled their id map on in-place updates; rebuild from the stored vectors
+        repaired = self._ivf_in_id_map() and self.updates_since_build > 0
+        if repaired:
+            self.compact()
+
+        # Diff against the indexed rows
+        changed_records, changed_rows = [], []
+        for i, chunk in enumerate(metadata):
+            record = {**chunk, 'content': content_by_id.get(chunk['id'], "Content not found")}
+            row = self.id_to_row.get(chunk['id'])
+            if row is None or {**self.metadata[row], 'content': self._row_content(row)} != record:
+                changed_records.append(record)
+                changed_rows.append(i)
+        removed = set(self.id_to_row) - {chunk['id'] for chunk in metadata}
+
+        counts = self.upsert(changed_records, embeddings[changed_rows])
+        counts['deleted'] = self.delete(sorted(removed))
+        counts['unchanged'] = len(metadata) - len(changed_records)
+        print(f"🔁 Synced index: {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['deleted']} deleted, {counts['unchanged']} unchanged")
+
+        if changed_records or removed:
+            # Trained quantizers drift as chunks change; retrain once enough did
+            trained = self.build_params.get('index_type') in ('ivf', 'ivfpq', 'sq')
+            if trained and self.updates_since_build > COMPACT_AFTER_FRACTION * max(len(self.row_to_id), 1):
+                self.compact()
+            self.save(str(embeddings_path))
+        elif repaired:
+            self.save(str(embeddings_path))
+
+        return counts
 
 
 # Example usage and testing
@@ -221,12 +869,21 @@ if __name__ == "__main__":
     print(f"🤖 Model: {model_name}")
 
     # Create FAISS manager
-    faiss_manager = FAISSManager(embedding_dim, index_type="flat")
-
-    # Create index
-    index_file = faiss_manager.create_index_from_embeddings(str(embeddings_dir))
-
-    print(f"\n🎉 FAISS index created successfully!")
+    faiss_manager = FAISSManager(embedding_dim, index_type="auto")
+
+    if FAISSManager.current_generation(str(embeddings_dir)) and "--rebuild" not in sys.argv:
+        # Only re-index chunks that changed since the published generation
+        try:
+            faiss_manager.sync_from_embeddings(str(embeddings_dir))
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            faiss_manager = FAISSManager(embedding_dim, index_type="auto")
+            faiss_manager.create_index_from_embeddings(str(embeddings_dir))
+    else:
+        # Create index
+        index_file = faiss_manager.create_index_from_embeddings(str(embeddings_dir))
+
+    print(f"\n🎉 FAISS index ready!")
 
     # Test search functionality
     print("\n" + "="*50)
@@ -246,14 +903,12 @@ if __name__ == "__main__":
         "Career goals and aspirations"
     ]
 
-    for query in test_queries:
-        print(f"\n🔍 Query: '{query}'")
+    # Embed and search all test queries in one batch
+    query_embeddings = model.encode(test_queries, convert_to_numpy=True)
+    all_results = faiss_manager.search_batch(query_embeddings, top_k=3)
 
-        # Generate query embedding
-        query_embedding = model.encode([query], convert_to_numpy=True)
-
-        # Search
-        results = faiss_manager.search(query_embedding, top_k=3)
+    for query, results in zip(test_queries, all_results):
+        print(f"\n🔍 Query: '{query}'")
 
         print(f"📊 Top {len(results)} results:")
         for result in results:
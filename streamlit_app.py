@@ -203,6 +203,15 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+SUGGESTIONS = [
+    "What are Wei Ming's technical skills?",
+    "Tell me about his machine learning projects",
+    "What's his educational background?",
+    "How can I contact Wei Ming?",
+    "What are his career goals?",
+    "Deep learning experience"
+]
+
 @st.cache_resource
 def initialize_chatbot():
     """Initialize chatbot - cached to avoid reloading"""
@@ -218,6 +227,9 @@ def initialize_chatbot():
                 pass
 
         chatbot = GroqRAGChatbot(str(vector_store_dir), groq_api_key=groq_api_key)
+
+        # Suggestion pills are the most common queries; embed them up front
+        chatbot.query_cache.warm(SUGGESTIONS, chatbot.embedding_model)
         return chatbot, None
     except Exception as e:
         return None, str(e)
@@ -293,17 +305,8 @@ def main():
     if st.session_state.show_suggestions and len(st.session_state.messages) == 0:
         st.markdown('<div class="suggestion-pills">', unsafe_allow_html=True)
 
-        suggestions = [
-            "What are Wei Ming's technical skills?",
-            "Tell me about his machine learning projects",
-            "What's his educational background?",
-            "How can I contact Wei Ming?",
-            "What are his career goals?",
-            "Deep learning experience"
-        ]
-
         cols = st.columns(3)
-        for i, suggestion in enumerate(suggestions):
+        for i, suggestion in enumerate(SUGGESTIONS):
             with cols[i % 3]:
                 if st.button(suggestion, key=f"suggestion_{i}", use_container_width=True):
                     st.session_state.current_question = suggestion
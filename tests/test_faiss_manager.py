@@ -0,0 +1,169 @@
+# tests/test_faiss_manager.py
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Set
+
+import faiss
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from vector_store.faiss_manager import FAISSManager, CURRENT_FILE, GENERATIONS_DIR, KEEP_GENERATIONS
+
+N_VECTORS = 2000
+DIM = 32
+INDEX_TYPES = ['flat', 'ivf', 'ivfpq', 'sq', 'hnsw']
+
+# PQ codes only approximate distances, so under IVF-PQ a vector's own chunk is
+# expected among its nearest few rather than first (a scrambled id map finds none)
+SELF_RANK = {'flat': 1, 'ivf': 1, 'hnsw': 1, 'sq': 1, 'ivfpq': 50}
+
+
+def chunk_record(i: int) -> Dict:
+    return {'id': f"chunk_{i}", 'metadata': {'n': i}, 'source_type': 'markdown',
+            'source_file': f"file_{i % 7}.md", 'word_count': i % 50}
+
+
+def write_vector_store(store_dir: Path, embeddings: np.ndarray, numbers: List[int], edited: Set[int] = frozenset()):
+    """Write the embedding generator's output for chunks numbered `numbers`, with new content for `edited`"""
+    store_dir.mkdir(parents=True, exist_ok=True)
+    np.save(store_dir / "embeddings.npy", embeddings)
+    with open(store_dir / "metadata.json", 'w', encoding='utf-8') as f:
+        json.dump([chunk_record(i) for i in numbers], f)
+    with open(store_dir / "final_chunks.json", 'w', encoding='utf-8') as f:
+        json.dump([{**chunk_record(i), 'content': f"{'edited' if i in edited else ''} content {i}".strip()}
+                   for i in numbers], f)
+    with open(store_dir / "config.json", 'w', encoding='utf-8') as f:
+        json.dump({'model_name': "test-model", 'embedding_dimension': DIM,
+                   'chunks_file': str(store_dir / "final_chunks.json")}, f)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def build(store_dir: Path, index_type: str, rng) -> (FAISSManager, Dict[str, np.ndarray]):
+    embeddings = rng.standard_normal((N_VECTORS, DIM)).astype(np.float32)
+    write_vector_store(store_dir, embeddings, list(range(N_VECTORS)))
+    manager = FAISSManager(DIM, index_type=index_type)
+    manager.create_index_from_embeddings(str(store_dir))
+    return manager, {f"chunk_{i}": embeddings[i] for i in range(N_VECTORS)}
+
+
+def assert_self_nearest(manager: FAISSManager, vectors: Dict[str, np.ndarray], index_type: str):
+    """Every chunk's own embedding finds that chunk"""
+    chunk_ids = list(vectors)
+    results = manager.search_batch(np.stack([vectors[chunk_id] for chunk_id in chunk_ids]),
+                                   top_k=SELF_RANK[index_type])
+    missing = [chunk_id for chunk_id, hits in zip(chunk_ids, results)
+               if chunk_id not in [hit['chunk_id'] for hit in hits]]
+    assert not missing, f"{len(missing)}/{len(chunk_ids)} chunks not found by their own embedding"
+
+
+def mutate(manager: FAISSManager, vectors: Dict[str, np.ndarray], rng):
+    """Delete 100 chunks, add 50 and replace 10, updating the expected vectors"""
+    manager.delete([f"chunk_{i}" for i in range(100)])
+    for i in range(100):
+        del vectors[f"chunk_{i}"]
+
+    numbers = list(range(N_VECTORS, N_VECTORS + 50)) + list(range(500, 510))
+    embeddings = rng.standard_normal((len(numbers), DIM)).astype(np.float32)
+    counts = manager.upsert([{**chunk_record(i), 'content': f"new content {i}"} for i in numbers], embeddings)
+    assert counts == {'added': 50, 'updated': 10}
+    vectors.update({f"chunk_{i}": embedding for i, embedding in zip(numbers, embeddings)})
+
+
+@pytest.mark.parametrize("index_type", INDEX_TYPES)
+def test_delete_and_upsert_keep_chunk_ids(tmp_path, rng, index_type):
+    manager, vectors = build(tmp_path, index_type, rng)
+    mutate(manager, vectors, rng)
+
+    assert manager.index.ntotal == len(vectors) == len(manager.row_to_id)
+    assert manager.get_chunks(["chunk_505"])[0]['content'] == "new content 505"
+    assert manager.get_row("chunk_0") is None
+    assert_self_nearest(manager, vectors, index_type)
+
+
+@pytest.mark.parametrize("index_type", INDEX_TYPES)
+def test_save_and_load_after_updates(tmp_path, rng, index_type):
+    manager, vectors = build(tmp_path, index_type, rng)
+    first_generation = manager.generation
+    mutate(manager, vectors, rng)
+    manager.save(str(tmp_path))
+
+    assert manager.generation != first_generation
+    assert (tmp_path / CURRENT_FILE).read_text(encoding='utf-8') == manager.generation
+
+    loaded = FAISSManager(DIM, index_type=index_type)
+    loaded.load_index(str(tmp_path))
+    assert loaded.generation == manager.generation
+    assert loaded.updates_since_build == manager.updates_since_build > 0
+    assert loaded.get_chunks(["chunk_505"])[0]['content'] == "new content 505"
+    assert_self_nearest(loaded, vectors, index_type)
+
+    # A loaded generation can be updated again
+    assert loaded.delete(["chunk_100", "chunk_2000"]) == 2
+    del vectors["chunk_100"], vectors["chunk_2000"]
+    embedding = rng.standard_normal((1, DIM)).astype(np.float32)
+    assert loaded.upsert([{**chunk_record(600), 'content': "content 600"}], embedding) == {'added': 0, 'updated': 1}
+    vectors["chunk_600"] = embedding[0]
+    assert_self_nearest(loaded, vectors, index_type)
+
+
+@pytest.mark.parametrize("index_type", INDEX_TYPES)
+def test_compact_keeps_chunk_ids(tmp_path, rng, index_type):
+    manager, vectors = build(tmp_path, index_type, rng)
+    mutate(manager, vectors, rng)
+    manager.compact()
+
+    assert manager.updates_since_build == 0
+    assert_self_nearest(manager, vectors, index_type)
+
+
+def test_old_generations_are_pruned(tmp_path, rng):
+    manager, _ = build(tmp_path, 'flat', rng)
+    for _ in range(KEEP_GENERATIONS + 2):
+        manager.save(str(tmp_path))
+
+    generations = sorted(path.name for path in (tmp_path / GENERATIONS_DIR).iterdir())
+    assert len(generations) == KEEP_GENERATIONS
+    assert manager.generation in generations
+
+
+@pytest.mark.parametrize("index_type", ['flat', 'ivf'])
+def test_sync_from_embeddings(tmp_path, rng, index_type):
+    manager, vectors = build(tmp_path, index_type, rng)
+
+    # Regenerated embeddings: chunks 0-9 gone, 10-19 changed, 20 new ones
+    numbers = list(range(10, N_VECTORS + 20))
+    embeddings = np.stack([vectors.get(f"chunk_{i}", np.zeros(DIM, dtype=np.float32)) for i in numbers])
+    embeddings[:10] = rng.standard_normal((10, DIM))
+    embeddings[-20:] = rng.standard_normal((20, DIM))
+    write_vector_store(tmp_path, embeddings, numbers, edited=set(range(10, 20)))
+
+    synced = FAISSManager(DIM, index_type=index_type)
+    counts = synced.sync_from_embeddings(str(tmp_path))
+    assert counts == {'added': 20, 'updated': 10, 'deleted': 10, 'unchanged': len(numbers) - 30}
+
+    reloaded = FAISSManager(DIM, index_type=index_type)
+    reloaded.load_index(str(tmp_path))
+    assert_self_nearest(reloaded, {f"chunk_{i}": embedding for i, embedding in zip(numbers, embeddings)}, index_type)
+
+
+def test_id_mapped_ivf_is_rebuilt_instead_of_removed_from(tmp_path, rng):
+    """Generations built with an IndexIDMap2 around IVF must not remove_ids in place"""
+    manager, vectors = build(tmp_path, 'ivf', rng)
+    ivf = faiss.clone_index(manager.index)
+    ivf.reset()
+    wrapped = faiss.IndexIDMap2(ivf)
+    wrapped.add_with_ids(np.asarray(manager.vectors), manager.faiss_ids)
+    manager.index = wrapped
+
+    mutate(manager, vectors, rng)
+
+    assert isinstance(faiss.downcast_index(manager.index), faiss.IndexIVF)
+    assert_self_nearest(manager, vectors, 'ivf')
@@ -0,0 +1,106 @@
+# tests/test_http_client.py
+
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from chatbot.http_client import PooledHTTPClient, AsyncPooledHTTPClient
+
+
+@pytest.fixture
+def rate_limited_server():
+    """Local server answering 429 with the given Retry-After once, then 200"""
+    state = {'retry_after': "600", 'calls': 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            state['calls'] += 1
+            if state['calls'] == 1:
+                self.send_response(429)
+                self.send_header('Retry-After', state['retry_after'])
+            else:
+                self.send_response(200)
+            self.send_header('Content-Length', "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("retry_after", ["600", "-5"])
+def test_sync_retry_after_is_capped(rate_limited_server, retry_after):
+    url, state = rate_limited_server
+    state['retry_after'] = retry_after
+    client = PooledHTTPClient(read_timeout=5.0, backoff_factor=0.01, max_retry_after=0.2)
+
+    start = time.perf_counter()
+    response = client.post(url, json={})
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    assert response.status_code == 200
+    assert response.timing['retries'] == 1
+    assert elapsed < 2.0
+
+
+def test_sync_cap_defaults_to_read_timeout():
+    client = PooledHTTPClient(read_timeout=7.0)
+    retry = client.session.get_adapter("https://api.groq.com").max_retries
+
+    assert retry.parse_retry_after("600") == 7.0
+    assert retry.new(total=1).parse_retry_after("600") == 7.0  # Survives urllib3 copying the Retry
+    client.close()
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("600", 0.2),
+    ("0.1", 0.1),
+    ("-5", 0.01),  # backoff_factor * 2 ** 0
+    ("nan", 0.01),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", 0.01)
+])
+def test_async_retry_after_is_capped(monkeypatch, retry_after, expected):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={'Retry-After': retry_after})
+        return httpx.Response(200)
+
+    async def run():
+        client = AsyncPooledHTTPClient(read_timeout=5.0, backoff_factor=0.01, max_retry_after=0.2)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await client.post("https://api.groq.com/openai/v1/chat/completions", json={})
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.timing['retries'] == 1
+    assert sleeps == [pytest.approx(expected)]
@@ -0,0 +1,116 @@
+# tests/test_markdown_plain_text.py
+
+import sys
+from pathlib import Path
+
+import markdown
+import pytest
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from processors.markdown_processor import MarkdownProcessor
+from processors.text_normalization import html_to_text, markdown_to_text, normalize_markdown
+
+FIXTURES = {
+    "tables.md": """# Projects Overview
+
+| Name | Stack | Link |
+| --- | :---: | --- |
+| Chatbot | Python, *FAISS* | [repo](https://github.com/example/chatbot) |
+| Portfolio | `Next.js` | <https://example.com> |
+| Escaped | a \\| b | __bold__ |
+
+Name | Role
+-----|-----
+Ming | Developer
+
+Some text after the tables with **bold** and _italic_ words.
+""",
+    "nested_lists.md": """## Skills
+
+- Languages
+    - Python
+    - TypeScript
+        - React and **Next.js**
+- Machine learning
+    1. Retrieval with [FAISS](https://faiss.ai)
+    2. Embeddings: `all-MiniLM-L6-v2`
+
+* Star item
++ Plus item continued
+  on a second line
+
+1. First
+2. Second with a [reference link][docs] and a [collapsed one][]
+
+[docs]: https://example.com/docs
+[collapsed one]: https://example.com/collapsed "Title"
+""",
+    "code_blocks.md": """Setup
+=====
+
+Install the requirements:
+
+```bash
+pip install -r requirements.txt
+python setup_chatbot.py --force
+```
+
+Indented code:
+
+    def answer(query):
+        return query * 2 < 10 and "a & b"
+
+Inline `code <b>` and ``double `tick` code``, an escaped \\*star\\* and a
+![diagram](diagram.svg) image.
+
+> Quoted *note* with a [link](notes.md)
+> spanning two lines
+>
+> > and a nested quote
+
+---
+
+Subheading
+----------
+
+***Bold italic*** and * a lone star.
+""",
+    "links.md": """Contact me at <mailto:someone@example.com> or <other.person@example.com>,
+see [My Resume](mingresume.pdf) and the [demo video](demo.mp4).
+
+[Projects](Projects%20aee4f34d22394d1690473e4917727405/Chatbot%20abc.md) & more <span>inline html</span>.
+
+[Nested [brackets] link](https://example.com/a_(b)) and [not a link] and [undefined][missing].
+
+AT&amp;T &lt;tag&gt; &#169; 2024 &#x2014; entities.
+"""
+}
+
+
+@pytest.fixture
+def markdown_dir(tmp_path):
+    for name, content in FIXTURES.items():
+        (tmp_path / name).write_text(content, encoding='utf-8')
+    return tmp_path
+
+
+def test_fast_plain_text_matches_html_rendering(markdown_dir):
+    assert MarkdownProcessor(str(markdown_dir)).verify_plain_text() == []
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_markdown_to_text_matches_html_to_text(name):
+    content = normalize_markdown(FIXTURES[name])
+    rendered = html_to_text(markdown.markdown(content, extensions=['tables', 'toc', 'codehilite']))
+
+    assert markdown_to_text(content) == rendered
+
+
+def test_plain_text_keeps_readable_text():
+    text = markdown_to_text(normalize_markdown(FIXTURES["links.md"]))
+
+    assert "someone@example.com" in text
+    assert "mailto:" not in text
+    assert "My Resume" in text
+    assert "AT&T <tag> © 2024 — entities." in text
@@ -0,0 +1,81 @@
+# tests/test_micro_batcher.py
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from chatbot.metrics import REGISTRY
+from embeddings.micro_batcher import EmbeddingMicroBatcher, EMBEDDING_BATCH_SIZE
+from embeddings.query_cache import QueryEmbeddingCache, QUERY_EMBEDDING_CACHE_LOOKUPS
+
+
+class RecordingModel:
+    """Fake SentenceTransformer recording the size of every encode call"""
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.lock = threading.Lock()
+
+    def encode(self, texts, convert_to_numpy=True, **kwargs):
+        with self.lock:
+            self.batch_sizes.append(len(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+def test_aencode_batches_all_concurrent_awaiters():
+    model = RecordingModel()
+    batcher = EmbeddingMicroBatcher(model, max_batch_size=16, max_wait_ms=200)
+
+    async def run():
+        return await asyncio.gather(*(batcher.aencode([f"query {i}"]) for i in range(16)))
+
+    embeddings = asyncio.run(run())
+    batcher.close()
+
+    # No worker threads involved, so one batch holds every request
+    assert model.batch_sizes == [16]
+    assert [embedding[0, 0] for embedding in embeddings] == [len(f"query {i}") for i in range(16)]
+
+
+def test_query_cache_aencode_skips_the_encoder_on_a_hit():
+    model = RecordingModel()
+    batcher = EmbeddingMicroBatcher(model, max_wait_ms=0)
+    cache = QueryEmbeddingCache()
+
+    async def run():
+        first = await cache.aencode("  machine   learning ", batcher)
+        second = await cache.aencode("machine learning", batcher)
+        return first, second
+
+    first, second = asyncio.run(run())
+    batcher.close()
+
+    assert model.batch_sizes == [1]
+    assert first.shape == (1, 2)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_lookups_and_batch_sizes_are_exported_as_metrics():
+    model = RecordingModel()
+    batcher = EmbeddingMicroBatcher(model, max_wait_ms=0)
+    cache = QueryEmbeddingCache()
+    hits, misses = QUERY_EMBEDDING_CACHE_LOOKUPS.get(result="hit"), QUERY_EMBEDDING_CACHE_LOOKUPS.get(result="miss")
+    batches = EMBEDDING_BATCH_SIZE._values.get((), {}).get('count', 0)
+
+    cache.encode("first", batcher)
+    cache.encode("first", batcher)
+    cache.encode_batch(["first", "second", "third"], model)
+    batcher.close()
+
+    assert QUERY_EMBEDDING_CACHE_LOOKUPS.get(result="hit") - hits == 2
+    assert QUERY_EMBEDDING_CACHE_LOOKUPS.get(result="miss") - misses == 3
+    assert EMBEDDING_BATCH_SIZE._values[()]['count'] - batches == 1
+
+    exposition = REGISTRY.render()
+    assert 'rag_query_embedding_cache_lookups_total{result="hit"}' in exposition
+    assert 'rag_embedding_batch_size_bucket{le="1"}' in exposition
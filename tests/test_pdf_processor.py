@@ -0,0 +1,83 @@
+# tests/test_pdf_processor.py
+
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from processors import pdf_processor
+from processors.pdf_processor import PDFProcessor, _run_in_processes
+
+
+def square(x):
+    return x * x
+
+
+def hang(seconds):
+    """Stand-in for extraction stuck in native code: ignores SIGALRM and never returns in time"""
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(seconds)
+    return "too late"
+
+
+def crash(_):
+    """Stand-in for a segfault or OOM kill"""
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def dispatch(arg):
+    """Run one of the tasks above: ('square' | 'hang' | 'crash', argument)"""
+    task, value = arg
+    return {'square': square, 'hang': hang, 'crash': crash}[task](value)
+
+
+def fake_extract_task(task):
+    extractor, file_path, start, end = task
+    name = Path(file_path).stem
+    if name == "hang":
+        hang(60)
+    if name == "crash":
+        crash(None)
+    return f"\n--- Page 1 ---\n{name} " + "text " * 20
+
+
+def test_run_in_processes_keeps_order():
+    assert _run_in_processes(square, list(range(6)), workers=3, timeout=10) == [('ok', x * x) for x in range(6)]
+
+
+def test_run_in_processes_kills_hung_and_reports_crashed_tasks():
+    args = [('square', 3), ('hang', 60), ('crash', None), ('square', 4)]
+
+    start = time.perf_counter()
+    results = _run_in_processes(dispatch, args, workers=2, timeout=1.0)
+    elapsed = time.perf_counter() - start
+
+    assert results == [('ok', 9), ('timeout', None), ('crashed', None), ('ok', 16)]
+    assert elapsed < 10
+
+
+def test_crashed_worker_is_noticed_without_a_timeout():
+    start = time.perf_counter()
+    results = _run_in_processes(dispatch, [('crash', None), ('square', 2)], workers=1, timeout=0)
+
+    assert results == [('crashed', None), ('ok', 4)]
+    assert time.perf_counter() - start < 10
+
+
+def test_extract_parallel_skips_files_that_hang_or_crash(monkeypatch, tmp_path):
+    monkeypatch.setattr(pdf_processor, "_count_pages", lambda file_path: 1)
+    monkeypatch.setattr(pdf_processor, "_extract_task", fake_extract_task)
+    pdf_files = [tmp_path / f"{name}.pdf" for name in ("good", "hang", "crash", "other")]
+    processor = PDFProcessor(str(tmp_path), workers=2, file_timeout=1.0)
+
+    start = time.perf_counter()
+    texts = processor._extract_parallel(pdf_files)
+
+    assert texts[tmp_path / "hang.pdf"] is None
+    assert texts[tmp_path / "crash.pdf"] is None
+    assert texts[tmp_path / "good.pdf"].startswith("\n--- Page 1 ---\ngood text")
+    assert texts[tmp_path / "other.pdf"].startswith("\n--- Page 1 ---\nother text")
+    assert time.perf_counter() - start < 10
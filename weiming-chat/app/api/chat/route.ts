@@ -2,7 +2,7 @@ import { NextRequest, NextResponse } from 'next/server'
 
 export async function POST(request: NextRequest) {
   try {
-    const { message } = await request.json()
+    const { message, stream } = await request.json()
 
     if (!message || typeof message !== 'string') {
       return NextResponse.json(
@@ -14,6 +14,33 @@ export async function POST(request: NextRequest) {
     // Replace with your actual Python backend URL
     const PYTHON_BACKEND_URL = process.env.PYTHON_BACKEND_URL || 'http://localhost:8000'
 
+    if (stream) {
+      // Pass the backend's Server-Sent Events straight through
+      const streamResponse = await fetch(`${PYTHON_BACKEND_URL}/chat/stream`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          query: message,
+          top_k: 5,
+          max_tokens: 500
+        }),
+      })
+
+      if (!streamResponse.ok || !streamResponse.body) {
+        throw new Error(`Backend responded with status: ${streamResponse.status}`)
+      }
+
+      return new Response(streamResponse.body, {
+        headers: {
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache',
+          'Connection': 'keep-alive',
+        },
+      })
+    }
+
     const response = await fetch(`${PYTHON_BACKEND_URL}/chat`, {
       method: 'POST',
       headers: {
@@ -39,6 +39,8 @@ export default function ChatPage() {
     setInput("");
     setIsLoading(true);
 
+    const botMessageId = (Date.now() + 1).toString();
+
     try {
       // Replace this URL with your actual backend endpoint
       const response = await fetch("/api/chat", {
@@ -46,29 +48,58 @@ export default function ChatPage() {
         headers: {
           "Content-Type": "application/json",
         },
-        body: JSON.stringify({ message: input }),
+        body: JSON.stringify({ message: input, stream: true }),
       });
 
-      const data = await response.json();
+      if (!response.ok || !response.body) {
+        throw new Error(`Request failed with status: ${response.status}`);
+      }
 
-      const botMessage: Message = {
-        id: (Date.now() + 1).toString(),
-        text:
-          data.response || "Sorry, I encountered an error. Please try again.",
-        isUser: false,
-        timestamp: new Date(),
-      };
+      setMessages((prev) => [
+        ...prev,
+        { id: botMessageId, text: "", isUser: false, timestamp: new Date() },
+      ]);
+      setIsLoading(false);
 
-      setMessages((prev) => [...prev, botMessage]);
+      // Append tokens to the bot message as Server-Sent Events arrive
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split("\n\n");
+        buffer = events.pop() || "";
+
+        for (const event of events) {
+          if (!event.startsWith("data:")) continue;
+          const data = JSON.parse(event.slice(5));
+          const token = data.token ?? (data.error ? "Sorry, I encountered an error. Please try again." : "");
+          if (token) {
+            setMessages((prev) =>
+              prev.map((m) =>
+                m.id === botMessageId ? { ...m, text: m.text + token } : m
+              )
+            );
+          }
+        }
+      }
     } catch (error) {
       console.error("Error:", error);
-      const errorMessage: Message = {
-        id: (Date.now() + 1).toString(),
-        text: "Sorry, I encountered an error. Please try again.",
-        isUser: false,
-        timestamp: new Date(),
-      };
-      setMessages((prev) => [...prev, errorMessage]);
+      const errorText = "Sorry, I encountered an error. Please try again.";
+      setMessages((prev) =>
+        prev.some((m) => m.id === botMessageId)
+          ? prev.map((m) =>
+              m.id === botMessageId ? { ...m, text: m.text || errorText } : m
+            )
+          : [
+              ...prev,
+              { id: botMessageId, text: errorText, isUser: false, timestamp: new Date() },
+            ]
+      );
     } finally {
       setIsLoading(false);
     }